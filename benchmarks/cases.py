@@ -0,0 +1,163 @@
+"""Formclasses exercising different parts of the sampling engine."""
+
+import os.path
+import runpy
+from typing import Any, Callable, Dict, NamedTuple
+
+from plato import Shared, derivedfield, formclass
+from plato.providers.builtin import Bothify, Choice, IntRange
+from plato.providers.faker import FromFaker
+
+fake = FromFaker()
+
+
+class Benchmark(NamedTuple):
+    """A benchmark case.
+
+    Attributes
+    ----------
+    name
+        Unique name of the benchmark.
+    description
+        Short description of what is benchmarked.
+    create_form
+        Creates the formclass instance to sample.
+    samples
+        Default number of samples to take. Chosen to take roughly the same
+        time for all benchmarks.
+    """
+
+    name: str
+    description: str
+    create_form: Callable[[], Any]
+    samples: int
+
+
+@formclass
+class Flat:
+    first_name: str = fake.first_name()
+    last_name: str = fake.last_name()
+    email: str = fake.email()
+    age: int = IntRange(18, 99)
+    customer_number: str = Bothify("??-#####")
+    status: str = Choice(["new", "active", "inactive"])
+    country: str = "Germany"
+
+
+def _create_wide_form(num_fields: int) -> Any:
+    annotations: Dict[str, Any] = {}
+    namespace: Dict[str, Any] = {"__annotations__": annotations}
+    for i in range(num_fields):
+        name = f"field{i:03d}"
+        if i % 3 == 0:
+            annotations[name] = int
+            namespace[name] = IntRange(0, 1000)
+        elif i % 3 == 1:
+            annotations[name] = str
+            namespace[name] = Bothify("???-###")
+        else:
+            annotations[name] = str
+            namespace[name] = "constant"
+    return formclass(type("Wide", (), namespace))()
+
+
+def _create_deep_form(depth: int) -> Any:
+    @formclass
+    class Leaf:
+        value: int = IntRange(0, 1000)
+        label: str = Bothify("??##")
+
+    form_class: Any = Leaf
+    for _ in range(depth):
+        form_class = formclass(
+            type(
+                "Node",
+                (),
+                {
+                    "__annotations__": {"value": int, "child": form_class},
+                    "value": IntRange(0, 1000),
+                    "child": form_class(),
+                },
+            )
+        )
+    return form_class()
+
+
+def _create_derived_form(num_derived_fields: int) -> Any:
+    def create_derived_field(previous: str) -> Any:
+        def derived(self: Any) -> int:
+            return getattr(self, previous) + getattr(self, "base") % 7
+
+        return derivedfield(derived)
+
+    annotations: Dict[str, Any] = {"base": int}
+    namespace: Dict[str, Any] = {
+        "__annotations__": annotations,
+        "base": IntRange(0, 1000),
+    }
+    previous = "base"
+    for i in range(num_derived_fields):
+        # Derived fields without arguments are evaluated in declaration order.
+        name = f"derived{i:02d}"
+        namespace[name] = create_derived_field(previous)
+        previous = name
+    return formclass(type("Derived", (), namespace))()
+
+
+@formclass
+class PostalCodeWithCity:
+    zip_code: str = fake.postcode()
+    city: str = fake.city()
+
+
+@formclass
+class SharedAddress:
+    street: str = fake.street_address()
+    zip_code_and_city = Shared(PostalCodeWithCity())
+    zip_code: str = zip_code_and_city.zip_code
+    city: str = zip_code_and_city.city
+
+
+@formclass
+class SharedCustomer:
+    name: str = fake.name()
+    address = Shared(SharedAddress())
+    billing_address: SharedAddress = address
+    shipping_address: SharedAddress = address
+    city: str = address.city
+
+
+def _create_shop_order() -> Any:
+    path = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "examples",
+        "shop.py",
+    )
+    return runpy.run_path(path)["Order"]()
+
+
+BENCHMARKS = [
+    Benchmark("flat", "Flat formclass with a few fields", Flat, 5000),
+    Benchmark(
+        "wide",
+        "Formclass with 300 fields",
+        lambda: _create_wide_form(300),
+        100,
+    ),
+    Benchmark(
+        "deep",
+        "Formclasses nested 25 levels deep",
+        lambda: _create_deep_form(25),
+        500,
+    ),
+    Benchmark(
+        "derived",
+        "Chain of 30 derived fields",
+        lambda: _create_derived_form(30),
+        1000,
+    ),
+    Benchmark(
+        "shared", "Shared values across nested formclasses", SharedCustomer, 2000
+    ),
+    Benchmark("shop", "Order from examples/shop.py", _create_shop_order, 300),
+]
@@ -0,0 +1,267 @@
+"""Runs the sampling benchmarks and compares the results against a baseline.
+
+Usage::
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --baseline results.json
+
+For each benchmark, the following metrics are measured:
+
+* ``throughput``: samples per second with consecutive `plato.sample` calls
+  (best of several repetitions),
+* ``batch_throughput``: samples per second with `plato.sample_many` (best of
+  several repetitions),
+* ``latency_p50_us``, ``latency_p90_us``, ``latency_p99_us``: percentiles of
+  the latency of single `plato.sample` calls in microseconds,
+* ``allocated_bytes_per_sample``: peak memory allocated while generating
+  a single sample (including temporary objects and the sample itself), as
+  traced by `tracemalloc` and averaged over the samples.
+
+If a baseline is given, the process exits with a non-zero exit code if any
+metric is worse than in the baseline by more than the tolerance.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import plato
+from plato.__version__ import __version__
+
+from .cases import BENCHMARKS, Benchmark
+
+HIGHER_IS_BETTER = {"throughput": True, "batch_throughput": True}
+METRICS = (
+    "throughput",
+    "batch_throughput",
+    "latency_p50_us",
+    "latency_p90_us",
+    "latency_p99_us",
+    "allocated_bytes_per_sample",
+)
+
+
+def run_benchmark(
+    benchmark: Benchmark, scale: float = 1.0, repeat: int = 3
+) -> Dict[str, float]:
+    """Runs a single benchmark.
+
+    Arguments
+    ---------
+    benchmark
+        The benchmark to run.
+    scale
+        Factor to scale the number of samples taken with.
+    repeat
+        Number of repetitions of the throughput measurements.
+
+    Returns
+    -------
+    Dict[str, float]
+        The measured metrics.
+    """
+    form = benchmark.create_form()
+    samples = max(1, int(benchmark.samples * scale))
+
+    plato.seed(0)
+    for _ in range(min(samples, 10)):
+        plato.sample(form)
+
+    throughput = 0.0
+    batch_throughput = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(samples):
+            plato.sample(form)
+        throughput = max(throughput, samples / (time.perf_counter() - start))
+
+        start = time.perf_counter()
+        plato.sample_many(form, samples)
+        batch_throughput = max(
+            batch_throughput, samples / (time.perf_counter() - start)
+        )
+
+    latencies = []
+    for _ in range(samples):
+        start_ns = time.perf_counter_ns()
+        plato.sample(form)
+        latencies.append(time.perf_counter_ns() - start_ns)
+    latencies.sort()
+
+    gc.collect()
+    allocated_bytes = 0
+    tracemalloc.start()
+    try:
+        for _ in range(samples):
+            # Also resets the peak. Each sample is dropped right after its
+            # generation, so that only the allocations of a single sample are
+            # traced.
+            tracemalloc.clear_traces()
+            plato.sample(form)
+            allocated_bytes += tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "throughput": throughput,
+        "batch_throughput": batch_throughput,
+        "latency_p50_us": _percentile(latencies, 50) / 1000,
+        "latency_p90_us": _percentile(latencies, 90) / 1000,
+        "latency_p99_us": _percentile(latencies, 99) / 1000,
+        "allocated_bytes_per_sample": allocated_bytes / samples,
+    }
+
+
+def _percentile(sorted_values: Sequence[float], percent: float) -> float:
+    index = round(percent / 100 * (len(sorted_values) - 1))
+    return sorted_values[index]
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[str]:
+    """Compares benchmark results against a baseline.
+
+    Arguments
+    ---------
+    results
+        Metrics by benchmark name of the current run.
+    baseline
+        Metrics by benchmark name of the baseline run.
+    tolerance
+        Relative change of a metric in the worse direction that is still
+        accepted.
+
+    Returns
+    -------
+    List[str]
+        Descriptions of the regressions found.
+    """
+    regressions = []
+    for name, metrics in results.items():
+        if name not in baseline:
+            continue
+        for metric, value in metrics.items():
+            baseline_value = baseline[name].get(metric, None)
+            if not baseline_value:
+                continue
+            change = value / baseline_value - 1
+            if HIGHER_IS_BETTER.get(metric, False):
+                change = -change
+            if change > tolerance:
+                regressions.append(
+                    f"{name}: {metric} regressed by {change:.1%} "
+                    f"({baseline_value:.6g} -> {value:.6g})"
+                )
+    return regressions
+
+
+def _print_results(
+    results: Dict[str, Dict[str, float]],
+    baseline: Optional[Dict[str, Dict[str, float]]],
+) -> None:
+    print(f"{'benchmark':<10} {'metric':<28} {'value':>14} {'baseline':>14}")
+    for name, metrics in results.items():
+        for metric in METRICS:
+            line = f"{name:<10} {metric:<28} {metrics[metric]:>14.2f}"
+            if baseline and metric in baseline.get(name, {}):
+                line += f" {baseline[name][metric]:>14.2f}"
+            print(line)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point.
+
+    Arguments
+    ---------
+    argv
+        Command line arguments (without the program name).
+
+    Returns
+    -------
+    int
+        Exit code.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        help="Names of the benchmarks to run (default: all).",
+    )
+    parser.add_argument("--output", help="Path to write the results as JSON to.")
+    parser.add_argument("--baseline", help="Path of JSON results to compare to.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Accepted relative regression of a metric (default: 0.1).",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Factor to scale the number of samples with (default: 1.0).",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Repetitions of the throughput measurements (default: 3).",
+    )
+    args = parser.parse_args(argv)
+
+    known_names = [benchmark.name for benchmark in BENCHMARKS]
+    unknown_names = set(args.benchmarks) - set(known_names)
+    if unknown_names:
+        parser.error(
+            f"unknown benchmarks: {', '.join(sorted(unknown_names))} "
+            f"(choose from {', '.join(known_names)})"
+        )
+
+    results = {}
+    for benchmark in BENCHMARKS:
+        if args.benchmarks and benchmark.name not in args.benchmarks:
+            continue
+        print(f"Running {benchmark.name}: {benchmark.description} ...", file=sys.stderr)
+        results[benchmark.name] = run_benchmark(benchmark, args.scale, args.repeat)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["benchmarks"]
+
+    _print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"metadata": _get_metadata(), "benchmarks": results}, f, indent=2)
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+def _get_metadata() -> Dict[str, Any]:
+    return {
+        "plato_version": __version__,
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -70,6 +70,18 @@ exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
 
 autodoc_typehints = "description"
 
+# NumPy is an optional dependency. Without it, the plato.providers.numpy module
+# is documented with a mocked NumPy and its doctests are skipped.
+try:
+    import numpy
+except ImportError:
+    numpy_available = False
+    autodoc_mock_imports = ["numpy"]
+else:
+    numpy_available = True
+
+doctest_global_setup = f"numpy_available = {numpy_available}"
+
 
 def linkcode_resolve(domain, info):
     if domain != "py":
@@ -1,6 +1,10 @@
 """Main Plato module providing the most used library members."""
 
+from .batch import iter_samples, sample_many
+from .columnar import sample_columns
 from .context import seed
+from .dicts import sample_dict, sample_many_dicts
 from .formclasses import InitVar, derivedfield, formclass, sample
 from .providers import Provider
 from .providers.common import Shared
+from .resampling import resample
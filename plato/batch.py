@@ -0,0 +1,280 @@
+"""Generation of many samples at once.
+
+The functions of this module generate the same samples as consecutive
+top-level invocations of `~plato.formclasses.sample`, but either process all
+samples together (`sample_many` and `sample_batch`) or one at a time on
+request (`iter_samples`).
+
+.. testsetup:: *
+
+    from plato import formclass, iter_samples, sample_many
+    import plato.providers.faker
+
+    plato.seed(0)
+"""
+
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import is_dataclass
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from .context import Context, create_root_context, get_root_context, reserve_root_seeds
+from .formclasses import (
+    _complete_derived_fields,
+    _create_instance,
+    _sample_formclass,
+    sample,
+)
+from .hooks import _active_hooks
+from .internal.field_values import FieldValues, complete_derived_field_values
+from .internal.output_class import get_output_factory
+from .internal.sampling_plan import get_init_vars, get_sampling_plan
+from .providers.base import Provider
+
+T = TypeVar("T")
+
+
+# pylint: disable=invalid-name
+def sample_many(form: T, n: int, workers: Optional[int] = None) -> List[T]:
+    """Generates *n* dataclasses with concrete values from a `.formclass` instance.
+
+    The result is the same as for *n* consecutive top-level invocations of
+    `~plato.formclasses.sample`, but the setup work of each invocation is only
+    done once for the whole batch.
+
+    The generation can be distributed across multiple processes with the
+    *workers* argument. Each worker generates a contiguous slice of the samples
+    from the root seeds reserved for that slice, so the result does not depend
+    on the number of workers. This requires the *form* (including all
+    providers) and the samples to be picklable, i.e. formclasses need to be
+    defined at module level. Furthermore, providers must derive their values
+    solely from the sampling context and not from state modified in previous
+    invocations, because each worker process has its own copy of the
+    providers.
+
+    Arguments
+    ---------
+    form
+        Usually a `.formclass` instance to be processed. But can also be a
+        `.Provider` instance or any other object (see `~plato.formclasses.sample`).
+    n
+        Number of samples to generate.
+    workers
+        Number of worker processes to use. If `None` or 1, the samples will be
+        generated in the current process.
+
+    Returns
+    -------
+    List[T]
+        The generated samples.
+
+    Examples
+    --------
+
+    .. testcode:: sample_many
+
+        fake = plato.providers.faker.FromFaker()
+
+        @formclass
+        class MyFormclass:
+            generated_field: str = fake.first_name()
+
+        for data in sample_many(MyFormclass(), 2):
+            print(data.generated_field)
+
+    .. testoutput:: sample_many
+
+        Alicia
+        Leah
+    """
+
+    return _sample_many_root_seeds(form, reserve_root_seeds(form.__class__, n), workers)
+
+
+def _sample_many_root_seeds(
+    form: T, root_seeds: range, workers: Optional[int]
+) -> List[T]:
+    n = len(root_seeds)
+    if workers is None or workers <= 1 or n <= 1:
+        return _sample_root_seeds(form, root_seeds)
+
+    slice_bounds = [n * i // workers for i in range(workers + 1)]
+    seed_slices = [
+        root_seeds[start:stop]
+        for start, stop in zip(slice_bounds[:-1], slice_bounds[1:])
+        if start < stop
+    ]
+    with ProcessPoolExecutor(max_workers=len(seed_slices)) as executor:
+        return [
+            instance
+            for instances in executor.map(
+                _sample_root_seeds, itertools.repeat(form), seed_slices
+            )
+            for instance in instances
+        ]
+
+
+def _sample_root_seeds(form: T, root_seeds: range) -> List[T]:
+    return sample_batch(
+        form, [create_root_context(root_seed) for root_seed in root_seeds]
+    )
+
+
+def sample_batch(form: T, contexts: Sequence[Context]) -> List[T]:
+    """Generates a sample from a `.formclass` instance for each context.
+
+    The result is the same as calling `~plato.formclasses.sample` for each of
+    the *contexts*, but the batch is processed field by field instead of
+    instance by instance. This allows `.Provider` instances to generate the
+    values for all instances at once with `.Provider.sample_batch`. As a
+    consequence, providers that do not derive their values solely from the
+    sampling context (e.g., providers counting the number of invocations) might
+    produce different values than with `~plato.formclasses.sample`.
+
+    Usually it will not be necessary to call this function directly. Use
+    `.sample_many` instead.
+
+    Arguments
+    ---------
+    form
+        Usually a `.formclass` instance to be processed. But can also be a
+        `.Provider` instance or any other object (see `~plato.formclasses.sample`).
+    contexts
+        Contexts of the sample operation, one for each sample to generate.
+
+    Returns
+    -------
+    List[T]
+        The generated samples.
+    """
+    return _sample_batch(form, contexts, as_values=False)
+
+
+def iter_samples(form: T, count: Optional[int] = None) -> Iterator[T]:
+    """Lazily generates dataclasses with concrete values from a `.formclass` instance.
+
+    Each generated value is the same as the one returned by the corresponding
+    top-level invocation of `~plato.formclasses.sample`. In contrast to
+    `.sample_many`, the samples are only generated when requested and no
+    reference to previously generated samples is kept. Thus, it is suitable to
+    process a large or unbounded number of samples with constant memory.
+
+    Arguments
+    ---------
+    form
+        Usually a `.formclass` instance to be processed. But can also be a
+        `.Provider` instance or any other object (see `~plato.formclasses.sample`).
+    count
+        Number of samples to generate. If `None`, an infinite number of samples
+        will be generated.
+
+    Yields
+    ------
+    T
+        The generated samples.
+
+    Examples
+    --------
+
+    .. testcode:: iter_samples
+
+        fake = plato.providers.faker.FromFaker()
+
+        @formclass
+        class MyFormclass:
+            generated_field: str = fake.first_name()
+
+        for data in iter_samples(MyFormclass(), 2):
+            print(data.generated_field)
+
+    .. testoutput:: iter_samples
+
+        Alicia
+        Leah
+    """
+
+    if isinstance(form, Provider):
+        sample_fn: Callable[[Context], T] = form.sample
+    elif is_dataclass(form):
+        plan = get_sampling_plan(type(form))
+        sample_fn = partial(_sample_formclass, form, plan, get_init_vars(form, plan))
+    else:
+
+        def sample_fn(_context: Context) -> T:
+            return form
+
+    for _ in itertools.count() if count is None else range(count):
+        context = get_root_context(form.__class__)
+        if _active_hooks:
+            yield sample(form, context)
+        else:
+            yield sample_fn(context)
+
+
+def _sample_batch(form: Any, contexts: Sequence[Context], as_values: bool) -> List[Any]:
+    if _active_hooks and not as_values:
+        # Sample one instance at a time to invoke the hooks for each field
+        # and provider invocation.
+        return [sample(form, context) for context in contexts]
+    if isinstance(form, Provider):
+        return form.sample_batch(contexts)
+    if not is_dataclass(form):
+        return [form] * len(contexts)
+
+    plan = get_sampling_plan(type(form))
+    init_vars = get_init_vars(form, plan)
+
+    field_values = [
+        _sample_batch(
+            getattr(form, name),
+            [context.subcontext(name) for context in contexts],
+            as_values,
+        )
+        for name in plan.field_names
+    ]
+    values_by_context: Iterable[Tuple[Any, ...]] = (
+        zip(*field_values) if field_values else [()] * len(contexts)
+    )
+
+    if as_values:
+        return [
+            complete_derived_field_values(
+                FieldValues(type(form), zip(plan.field_names, values)),
+                plan,
+                init_vars,
+                context,
+            )
+            for context, values in zip(contexts, values_by_context)
+        ]
+
+    create = get_output_factory(type(form))
+    if create and not plan.derived_fields:
+        return [create(*values) for values in values_by_context]
+    return [
+        _complete_derived_fields(
+            type(form),
+            _create_instance(type(form), plan, init_vars, values),
+            plan,
+            init_vars,
+            context,
+        )
+        for context, values in zip(contexts, values_by_context)
+    ]
+
+
+def _reserve_root_contexts(form: Any, n: int) -> List[Context]:
+    return [
+        create_root_context(root_seed)
+        for root_seed in reserve_root_seeds(type(form), n)
+    ]
@@ -0,0 +1,440 @@
+"""Persistent cache of samples on disk.
+
+Sampling deterministic fixtures, e.g., in the test suite run by a continuous
+integration pipeline, produces the same samples in each run. A `DiskCache`
+stores the samples on disk and loads them instead of generating them again::
+
+    from plato.cache import DiskCache
+
+    cache = DiskCache(".plato-cache")
+    orders = cache.sample_many(Order(), 100)
+
+Entries are keyed by a fingerprint of the sampled `.formclass` instance (its
+fields, providers, and the source code of the formclass and its derived
+fields), the root seeds, and the versions of Plato, Faker, and NumPy (if the
+providers of `plato.providers.numpy` are in use). Thus, the cache returns the
+same samples as `~plato.formclasses.sample` and `~plato.batch.sample_many` and
+consumes root seeds in the same way, so that subsequent uncached samples are
+not affected.
+
+The fingerprint covers the declared structure of the formclass instance: the
+field values, the source code of functions, and the class and constructor
+arguments of providers and other objects (i.e., the attributes named like the
+parameters of the constructor). Other state, like the internal state of
+a random number generator, is not included. Hence, providers depending on
+state other than their constructor arguments or on external data (e.g.,
+files) must not be used with the cache. The fingerprint of a formclass
+instance is only computed on its first use with a `DiskCache`. Thus, the
+instance must not be modified afterwards.
+
+Each entry is a single file holding the pickled samples. Hence, the samples
+need to be picklable, i.e. formclasses need to be defined at module level.
+Samples that cannot be pickled are not cached. Once the total size of the
+entries exceeds the size limit, the least recently used entries are deleted.
+"""
+
+import inspect
+import os
+import pickle
+import re
+import sys
+import tempfile
+import weakref
+from dataclasses import fields, is_dataclass
+from datetime import date, time, timedelta
+from decimal import Decimal
+from hashlib import blake2b
+from types import BuiltinFunctionType, FunctionType, MethodType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from weakref import WeakKeyDictionary
+
+import faker
+
+from .__version__ import __version__
+from .batch import _sample_many_root_seeds
+from .context import create_root_context, reserve_root_seeds
+from .formclasses import sample
+from .internal.sampling_plan import INIT_VARS_ATTR, get_sampling_plan
+from .providers.base import Provider
+
+T = TypeVar("T")
+
+_MAGIC = b"PLATO-SAMPLES\x01"
+_SUFFIX = ".plato"
+
+
+class DiskCache:
+    """Cache of samples stored on disk.
+
+    The methods mirror the functions of the same name in `plato`, but load the
+    samples from the cache if available.
+
+    Arguments
+    ---------
+    directory
+        Directory to store the cached samples in. Created if it does not exist.
+    max_size
+        Maximum total size in bytes of the cached samples. If `None`, the
+        size is not limited.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        max_size: Optional[int] = 256 * 1024 ** 2,
+    ):
+        self.directory = os.fspath(directory)
+        self.max_size = max_size
+        os.makedirs(self.directory, exist_ok=True)
+        self._fingerprints: Dict[int, Tuple["weakref.ref[Any]", bytes]] = {}
+
+    def sample(self, form: T) -> T:
+        """Generate a sample or load it from the cache.
+
+        The sample is the same as the one generated by
+        `~plato.formclasses.sample`.
+
+        Arguments
+        ---------
+        form
+            Usually a `.formclass` instance to be processed. But can also be
+            a `.Provider` instance or any other object
+            (see `~plato.formclasses.sample`).
+
+        Returns
+        -------
+        T
+            The generated or loaded sample.
+        """
+
+        def sample_fn(root_seeds: range) -> List[T]:
+            return [sample(form, create_root_context(root_seeds[0]))]
+
+        return self._load_or_sample("sample", form, 1, sample_fn)[0]
+
+    def sample_many(  # pylint: disable=invalid-name
+        self, form: T, n: int, workers: Optional[int] = None
+    ) -> List[T]:
+        """Generate samples or load them from the cache.
+
+        The samples are the same as the ones generated by
+        `~plato.batch.sample_many`.
+
+        Arguments
+        ---------
+        form
+            Usually a `.formclass` instance to be processed. But can also be
+            a `.Provider` instance or any other object
+            (see `~plato.formclasses.sample`).
+        n
+            Number of samples to generate.
+        workers
+            Number of worker processes to use if the samples are not cached
+            (see `~plato.batch.sample_many`).
+
+        Returns
+        -------
+        List[T]
+            The generated or loaded samples.
+        """
+
+        def sample_fn(root_seeds: range) -> List[T]:
+            return _sample_many_root_seeds(form, root_seeds, workers)
+
+        return self._load_or_sample("sample_many", form, n, sample_fn)
+
+    def clear(self) -> None:
+        """Delete all cached samples."""
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(_SUFFIX):
+                _remove(entry.path)
+
+    def _load_or_sample(
+        self,
+        kind: str,
+        form: T,
+        count: int,
+        sample_fn: Callable[[range], List[T]],
+    ) -> List[T]:
+        root_seeds = reserve_root_seeds(form.__class__, count)
+        hasher = blake2b(digest_size=20)
+        hasher.update(
+            f"{__version__}\0{_get_dependency_versions()}\0{kind}\0"
+            f"{root_seeds.start}\0{len(root_seeds)}\0".encode("utf-8")
+        )
+        hasher.update(self._get_fingerprint(form))
+        path = os.path.join(self.directory, hasher.hexdigest() + _SUFFIX)
+
+        samples = _load(path)
+        if samples is None:
+            samples = sample_fn(root_seeds)
+            self._store(path, samples)
+        return samples
+
+    def _get_fingerprint(self, form: Any) -> bytes:
+        key = id(form)
+        entry = self._fingerprints.get(key, None)
+        if entry is not None and entry[0]() is form:
+            return entry[1]
+
+        form_fingerprint = fingerprint(form)
+        try:
+            form_ref = weakref.ref(form, lambda _: self._fingerprints.pop(key, None))
+        except TypeError:  # not weak referenceable
+            return form_fingerprint
+        self._fingerprints[key] = (form_ref, form_fingerprint)
+        return form_fingerprint
+
+    def _store(self, path: str, samples: List[Any]) -> None:
+        try:
+            data = pickle.dumps(samples, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return
+        if self.max_size is not None and len(_MAGIC) + len(data) > self.max_size:
+            return
+
+        # Write to a temporary file first to never expose partial entries to
+        # concurrent readers.
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, suffix=".tmp", delete=False
+        ) as stream:
+            stream.write(_MAGIC)
+            stream.write(data)
+        os.replace(stream.name, path)
+        self._evict()
+
+    def _evict(self) -> None:
+        if self.max_size is None:
+            return
+
+        entries = []
+        total_size = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(_SUFFIX):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            _remove(path)
+            total_size -= size
+
+
+def _get_dependency_versions() -> str:
+    # Faker and NumPy may generate different values in other releases.
+    versions = f"faker {faker.VERSION}"
+    if "plato.providers.numpy" in sys.modules:
+        versions += f" numpy {sys.modules['numpy'].__version__}"
+    return versions
+
+
+def _load(path: str) -> Optional[List[Any]]:
+    try:
+        with open(path, "rb") as stream:
+            if stream.read(len(_MAGIC)) != _MAGIC:
+                return None
+            samples = pickle.loads(stream.read())
+        # Mark the entry as recently used for the eviction.
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        # Corrupted entry or the pickled classes changed.
+        return None
+    return samples
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def fingerprint(obj: Any) -> bytes:
+    """Compute a fingerprint of an object for use as cache key.
+
+    The fingerprint is computed from the type of the object and recursively
+    from the field values of dataclasses, the items of containers, and the
+    constructor arguments of other objects (i.e., the attributes named like
+    the parameters of the constructor). For functions, formclasses, and
+    providers, the source code is included as well.
+
+    Arguments
+    ---------
+    obj
+        Object to compute the fingerprint of.
+
+    Returns
+    -------
+    bytes
+        The fingerprint.
+    """
+    fingerprinter = _Fingerprinter()
+    fingerprinter.update(obj)
+    return fingerprinter.hasher.digest()
+
+
+_ATOMIC_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    Decimal,
+    date,
+    time,
+    timedelta,
+)
+_ADDRESS_PATTERN = re.compile(r" at 0x[0-9a-fA-F]+")
+
+_source_cache: MutableMapping[Any, str] = WeakKeyDictionary()
+_init_parameter_names_cache: MutableMapping[type, Tuple[str, ...]] = WeakKeyDictionary()
+
+
+class _Fingerprinter:
+    def __init__(self) -> None:
+        self.hasher = blake2b(digest_size=20)
+        # Shared and recursive references are encoded by the index of the
+        # first occurrence, which is deterministic unlike the ids.
+        self._seen: Dict[int, int] = {}
+        self._keep_alive: List[Any] = []
+
+    def update(self, obj: Any) -> None:
+        if isinstance(obj, _ATOMIC_TYPES):
+            self._write("atom", type(obj).__qualname__, repr(obj))
+            return
+
+        if id(obj) in self._seen:
+            self._write("ref", str(self._seen[id(obj)]))
+            return
+        self._seen[id(obj)] = len(self._seen)
+        self._keep_alive.append(obj)
+
+        if isinstance(obj, type):
+            self._write("type", _qualified_name(obj))
+        elif isinstance(obj, FunctionType):
+            self._update_function(obj)
+        elif isinstance(obj, (MethodType, BuiltinFunctionType)):
+            self._update_method(obj)
+        elif isinstance(obj, (list, tuple, dict, set, frozenset)):
+            self._update_collection(obj)
+        elif is_dataclass(obj):
+            self._update_dataclass(obj)
+        else:
+            self._update_object(obj)
+
+    def _update_function(self, fn: FunctionType) -> None:
+        self._write("function", _qualified_name(fn), _get_source(fn))
+        self.update(fn.__defaults__)
+        self.update(fn.__kwdefaults__)
+        for cell in fn.__closure__ or ():
+            try:
+                self.update(cell.cell_contents)
+            except ValueError:  # empty cell
+                self._write("empty cell")
+
+    def _update_method(self, method: Any) -> None:
+        self._write("method", _qualified_name(method))
+        if not inspect.ismodule(method.__self__):
+            self.update(method.__self__)
+
+    def _update_collection(self, obj: Any) -> None:
+        if isinstance(obj, (list, tuple)):
+            self._write("sequence", _qualified_name(type(obj)), str(len(obj)))
+            for item in obj:
+                self.update(item)
+        elif isinstance(obj, dict):
+            self._write("mapping", _qualified_name(type(obj)), str(len(obj)))
+            for key, value in obj.items():
+                self.update(key)
+                self.update(value)
+        else:
+            self._write("set", _qualified_name(type(obj)), str(len(obj)))
+            for item_fingerprint in sorted(fingerprint(item) for item in obj):
+                self.hasher.update(item_fingerprint)
+
+    def _update_dataclass(self, form: Any) -> None:
+        cls = type(form)
+        self._write("dataclass", _qualified_name(cls), _get_source(cls))
+        for field_def in fields(form):
+            self._write("field", field_def.name, str(field_def.type))
+            self.update(getattr(form, field_def.name))
+        for derived_field in get_sampling_plan(cls).derived_fields:
+            self._write("derived field", derived_field.name)
+            self.update(derived_field.fn)
+        self.update(getattr(form, INIT_VARS_ATTR, None))
+
+    def _update_object(self, obj: Any) -> None:
+        cls = type(obj)
+        self._write("object", _qualified_name(cls))
+        if isinstance(obj, Provider):
+            self._write("source", _get_source(cls))
+        elif cls.__repr__ is not object.__repr__:
+            self._write("repr", _ADDRESS_PATTERN.sub("", repr(obj)))
+        for name in _get_init_parameter_names(cls):
+            try:
+                # Bypasses __getattr__, e.g., of providers with attribute access.
+                value = object.__getattribute__(obj, name)
+            except AttributeError:
+                continue
+            self._write("argument", name)
+            self.update(value)
+
+    def _write(self, *tokens: str) -> None:
+        for token in tokens:
+            self.hasher.update(token.encode("utf-8", "surrogatepass"))
+            self.hasher.update(b"\0")
+
+
+def _qualified_name(obj: Any) -> str:
+    return f"{getattr(obj, '__module__', '')}.{getattr(obj, '__qualname__', '')}"
+
+
+def _get_init_parameter_names(cls: type) -> Tuple[str, ...]:
+    try:
+        return _init_parameter_names_cache[cls]
+    except KeyError:
+        pass
+    names: Tuple[str, ...] = ()
+    if getattr(cls, "__init__") is not object.__init__:
+        try:
+            names = tuple(inspect.signature(getattr(cls, "__init__")).parameters)[1:]
+        except (TypeError, ValueError):
+            # For example, classes implemented in C.
+            pass
+    _init_parameter_names_cache[cls] = names
+    return names
+
+
+def _get_source(obj: Any) -> str:
+    try:
+        return _source_cache[obj]
+    except KeyError:
+        pass
+    try:
+        source = inspect.getsource(obj)
+    except (OSError, TypeError):
+        # For example, classes created dynamically or in an interactive
+        # session.
+        source = ""
+    _source_cache[obj] = source
+    return source
@@ -0,0 +1,91 @@
+"""Generation of many samples in a columnar layout.
+
+.. testsetup:: *
+
+    from plato import formclass, sample_columns
+    import plato.providers.faker
+
+    plato.seed(0)
+"""
+
+from dataclasses import is_dataclass
+from typing import Any, Dict, List
+
+from .batch import _reserve_root_contexts, _sample_batch
+from .internal.field_values import flatten_field_values
+
+
+# pylint: disable=invalid-name
+def sample_columns(form: Any, n: int) -> Dict[str, List[Any]]:
+    """Generates *n* samples of a `.formclass` instance in a columnar layout.
+
+    Instead of a list of dataclasses, a dictionary mapping each field to the
+    list of its sampled values is returned. Fields of nested `.formclass`
+    instances are flattened, using the dotted path to the field as key (e.g.,
+    ``"billing_address.city"``). The values are the same as for *n* consecutive
+    invocations of `~plato.formclasses.sample`, but dataclass instances are
+    only created for `.formclass` instances with derived fields (to pass them
+    to the `.derivedfield` methods). Only values generated by `.Provider`
+    instances are kept as they are.
+
+    If a field is absent in some samples (e.g., because a `.derivedfield`
+    returns different formclasses), the respective entries will be `None`.
+
+    Arguments
+    ---------
+    form
+        A `.formclass` instance to be processed.
+    n
+        Number of samples to generate.
+
+    Returns
+    -------
+    Dict[str, List[Any]]
+        The sampled values of each field.
+
+    Raises
+    ------
+    TypeError
+        If *form* is not a formclass instance.
+
+    Examples
+    --------
+
+    .. testcode:: sample_columns
+
+        fake = plato.providers.faker.FromFaker()
+
+        @formclass
+        class Address:
+            city: str = fake.city()
+
+        @formclass
+        class Customer:
+            name: str = fake.first_name()
+            address: Address = Address()
+
+        for path, values in sample_columns(Customer(), 2).items():
+            print(path, values)
+
+    .. testoutput:: sample_columns
+
+        name ['Nicholas', 'Jeffrey']
+        address.city ['Phillipfurt', 'Gomezchester']
+    """
+
+    if not is_dataclass(form):
+        raise TypeError("A formclass instance is required.")
+
+    columns: Dict[str, List[Any]] = {}
+    for row, values in enumerate(
+        _sample_batch(form, _reserve_root_contexts(form, n), as_values=True)
+    ):
+        for path, value in flatten_field_values(values, ""):
+            column = columns.setdefault(path, [])
+            if len(column) < row:
+                column.extend([None] * (row - len(column)))
+            column.append(value)
+
+    for column in columns.values():
+        column.extend([None] * (n - len(column)))
+    return columns
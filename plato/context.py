@@ -3,10 +3,12 @@
 import random
 from collections import defaultdict
 from hashlib import blake2b
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, MutableMapping, Optional, Tuple, Type
 
 from typing_extensions import Protocol
 
+from .internal.cow_dict import CopyOnWriteDict
+
 
 class Hasher(Protocol):
     """Protocol of classes to perform incremental hashing."""
@@ -40,41 +42,66 @@ class Context:
         might be modified.
     """
 
+    __slots__ = ("_hasher", "_name", "parent", "meta", "_seed", "_rng")
+
     parent: Optional["Context"]
     """The parent context or `None` if this is a root context."""
 
-    meta: dict
+    meta: CopyOnWriteDict[Any, Any]
     """ Dictionary that can be used by providers to store additional information
         across invocations of `.Provider.sample()`. Use the `.Provider` instance
         or concrete class as key to avoid key collisions with other providers.
     """
 
-    seed: bytes
-    """Seed to use for the generation of random numbers."""
-
-    rng: random.Random
-    """ A seeded random number generator that may be used for the generation of
-        random numbers.
-    """
-
     def __init__(
-        self, hasher: Hasher, parent: "Context" = None, meta: Dict[Any, Any] = None
+        self,
+        hasher: Hasher,
+        parent: "Context" = None,
+        meta: MutableMapping[Any, Any] = None,
     ):
-        self._hasher = hasher
+        self._hasher: Optional[Hasher] = hasher
+        self._name: Optional[str] = None
         self.parent = parent
-        if meta is None:
-            meta = {}
+        if not isinstance(meta, CopyOnWriteDict):
+            meta = CopyOnWriteDict(meta)
         self.meta = meta
 
-        self.seed = self._hasher.digest()
-        self.rng = random.Random(self.seed)
+        self._seed: Optional[bytes] = None
+        self._rng: Optional[random.Random] = None
+
+    @property
+    def seed(self) -> bytes:
+        """Seed to use for the generation of random numbers."""
+        # The seed is only computed on first access.
+        if self._seed is None:
+            self._seed = self._get_hasher().digest()
+        return self._seed
+
+    @property
+    def rng(self) -> random.Random:
+        """Seeded random number generator to use for generating random numbers."""
+        # The random number generator is only created on first access.
+        if self._rng is None:
+            self._rng = random.Random(self.seed)
+        return self._rng
+
+    @property
+    def path(self) -> Tuple[str, ...]:
+        """Names of the subcontexts leading from the root context to this context."""
+        if self._name is None:
+            return ()
+        assert self.parent is not None
+        return self.parent.path + (self._name,)
 
     def subcontext(self, name: str) -> "Context":
         """Derive a subcontext.
 
         A subcontext is derived by updating a copy of the *hasher* with the
         *name*, setting the *parent* accordingly, and (flat) copying the
-        *meta* dictionary.
+        *meta* dictionary. The *meta* dictionary is copied on write, i.e.
+        the actual copy is deferred until either context modifies it. Likewise,
+        the *hasher* is only copied and updated once the subcontext's seed or
+        hasher is needed.
 
         Arguments
         ---------
@@ -87,9 +114,35 @@ class Context:
         Context
             The derived subcontext.
         """
-        subhasher = self._hasher.copy()
-        subhasher.update(name.encode())
-        return Context(subhasher, self, dict(self.meta))
+        # pylint: disable=protected-access
+        # Fills the slots directly, which is faster than invoking __init__.
+        subcontext = Context.__new__(Context)
+        subcontext._hasher = None
+        subcontext._name = name
+        subcontext.parent = self
+        subcontext.meta = self.meta.copy()
+        subcontext._seed = None
+        subcontext._rng = None
+        return subcontext
+
+    def _get_hasher(self) -> Hasher:
+        # pylint: disable=protected-access
+        if self._hasher is None:
+            assert self.parent is not None and self._name is not None
+            hasher = self.parent._get_hasher().copy()
+            hasher.update(self._name.encode())
+            self._hasher = hasher
+        return self._hasher
+
+
+def _int2bytes(value: int) -> bytes:
+    return value.to_bytes(value.bit_length() // 8 + 1, "big")
+
+
+def _create_hasher(root_seed: int) -> Hasher:
+    hasher = blake2b()
+    hasher.update(_int2bytes(root_seed))
+    return hasher
 
 
 _TYPE_COUNTS: Dict[Type, int] = defaultdict(lambda: 0)
@@ -102,18 +155,50 @@ def seed(value: int) -> None:
     _TYPE_COUNTS = defaultdict(lambda: value)
 
 
-def _int2bytes(value: int) -> bytes:
-    return value.to_bytes(value.bit_length() // 8 + 1, "big")
-
-
-def _create_hasher(hasher_seed: int) -> blake2b:
-    hasher = blake2b()
-    hasher.update(_int2bytes(hasher_seed))
-    return hasher
-
-
 def get_root_context(type_: Type) -> Context:
     """Get a root context for a given type."""
     root_seed = _TYPE_COUNTS[type_]
     _TYPE_COUNTS[type_] += 1
     return Context(_create_hasher(root_seed))
+
+
+def reserve_root_seeds(type_: Type, count: int) -> range:
+    """Reserve the root seeds for *count* consecutive root contexts of a type.
+
+    Creating root contexts from the returned seeds with `create_root_context`
+    gives the same contexts as calling `get_root_context` *count* times. The
+    contexts can, however, be created in any order or in a different process.
+
+    Arguments
+    ---------
+    type_
+        The type to reserve the root seeds for.
+    count
+        Number of root seeds to reserve.
+
+    Returns
+    -------
+    range
+        The reserved root seeds.
+    """
+    first_seed = _TYPE_COUNTS[type_]
+    _TYPE_COUNTS[type_] += count
+    return range(first_seed, first_seed + count)
+
+
+def create_root_context(root_seed: int) -> Context:
+    """Create the root context for a root seed.
+
+    Use `get_root_context` or `reserve_root_seeds` to obtain root seeds.
+
+    Arguments
+    ---------
+    root_seed
+        The root seed.
+
+    Returns
+    -------
+    Context
+        The root context.
+    """
+    return Context(_create_hasher(root_seed))
@@ -0,0 +1,111 @@
+"""Generation of samples as dictionaries instead of dataclass instances.
+
+.. testsetup:: *
+
+    from plato import formclass, sample_dict
+    import plato.providers.faker
+
+    plato.seed(0)
+"""
+
+from dataclasses import is_dataclass
+from typing import Any, List
+
+from .batch import _reserve_root_contexts, _sample_batch
+from .context import get_root_context
+from .internal.field_values import DictFactory, field_values_to_dict, sample_values
+
+
+def sample_dict(form: Any, dict_factory: DictFactory = dict) -> Any:
+    """Generates a sample of a `.formclass` instance as dictionary.
+
+    The result is the same as for ``dataclasses.asdict(sample(form))``, but
+    dataclass instances are only created for `.formclass` instances with
+    derived fields (to pass them to the `.derivedfield` methods). Nested
+    `.formclass` instances are returned as nested dictionaries.
+
+    Arguments
+    ---------
+    form
+        A `.formclass` instance to be processed.
+    dict_factory
+        Creates the dictionaries from lists of key-value pairs (like the
+        argument of `dataclasses.asdict`).
+
+    Returns
+    -------
+    Any
+        The sampled values of the fields as created by *dict_factory*.
+
+    Raises
+    ------
+    TypeError
+        If *form* is not a formclass instance.
+
+    Examples
+    --------
+
+    .. testcode:: sample_dict
+
+        fake = plato.providers.faker.FromFaker()
+
+        @formclass
+        class Address:
+            city: str = fake.city()
+
+        @formclass
+        class Customer:
+            name: str = fake.first_name()
+            address: Address = Address()
+
+        print(sample_dict(Customer()))
+
+    .. testoutput:: sample_dict
+
+        {'name': 'Nicholas', 'address': {'city': 'Phillipfurt'}}
+    """
+
+    if not is_dataclass(form):
+        raise TypeError("A formclass instance is required.")
+
+    values = sample_values(form, get_root_context(type(form)))
+    return field_values_to_dict(values, dict_factory)
+
+
+# pylint: disable=invalid-name
+def sample_many_dicts(form: Any, n: int, dict_factory: DictFactory = dict) -> List[Any]:
+    """Generates *n* samples of a `.formclass` instance as dictionaries.
+
+    The result is the same as for converting the samples generated with
+    `~plato.batch.sample_many` with `dataclasses.asdict`, but dataclass
+    instances are only created for `.formclass` instances with derived fields.
+
+    Arguments
+    ---------
+    form
+        A `.formclass` instance to be processed.
+    n
+        Number of samples to generate.
+    dict_factory
+        Creates the dictionaries from lists of key-value pairs (like the
+        argument of `dataclasses.asdict`).
+
+    Returns
+    -------
+    List[Any]
+        The sampled values of the fields as created by *dict_factory* for each
+        sample.
+
+    Raises
+    ------
+    TypeError
+        If *form* is not a formclass instance.
+    """
+
+    if not is_dataclass(form):
+        raise TypeError("A formclass instance is required.")
+
+    return [
+        field_values_to_dict(values, dict_factory)
+        for values in _sample_batch(form, _reserve_root_contexts(form, n), True)
+    ]
@@ -0,0 +1,298 @@
+"""Writers serializing streams of samples to JSON Lines and CSV files.
+
+The writers consume any iterable of samples, e.g., from `.iter_samples`, and
+write them in chunks. Thus, an arbitrary number of samples can be written
+with bounded memory. In contrast to `dataclasses.asdict`, the field values
+are not deep-copied, but read directly from the sampled instances.
+
+Files given as path are compressed if the *compression* argument or the file
+extension (``.gz``, ``.bz2``, ``.xz``) asks for it.
+
+.. testsetup:: *
+
+    import io
+
+    import plato
+    from plato import formclass, iter_samples
+    from plato.export import write_csv, write_jsonl
+    from plato.providers.builtin import IntRange
+
+    plato.seed(0)
+
+Examples
+--------
+
+.. testcode:: export
+
+    @formclass
+    class Address:
+        street: str = "Main Street"
+        number: int = IntRange(1, 100)
+
+    @formclass
+    class Customer:
+        name: str = "Plato"
+        address: Address = Address()
+
+    out = io.StringIO()
+    write_jsonl(iter_samples(Customer(), 2), out)
+    print(out.getvalue(), end="")
+
+    out = io.StringIO()
+    write_csv(iter_samples(Customer(), 2), out)
+    print(out.getvalue(), end="")
+
+.. testoutput:: export
+
+    {"name":"Plato","address":{"street":"Main Street","number":88}}
+    {"name":"Plato","address":{"street":"Main Street","number":68}}
+    name,address.street,address.number
+    Plato,Main Street,39
+    Plato,Main Street,32
+"""
+
+import bz2
+import csv
+import gzip
+import json
+import lzma
+import os
+from contextlib import contextmanager
+from dataclasses import fields, is_dataclass
+from datetime import date, time
+from decimal import Decimal
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from uuid import UUID
+
+FileArg = Union[str, "os.PathLike[str]", IO[str]]
+
+_OPENERS: Dict[str, Callable[..., IO[str]]] = {
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "lzma": lzma.open,
+}
+_COMPRESSION_BY_EXTENSION = {".gz": "gzip", ".bz2": "bz2", ".xz": "lzma"}
+_ATOMIC_TYPES = (str, int, float, bool, type(None))
+
+
+def write_jsonl(
+    samples: Iterable[Any],
+    file: FileArg,
+    compression: Optional[str] = None,
+    chunk_size: int = 1000,
+) -> int:
+    """Write samples as JSON Lines, i.e., one JSON object per line.
+
+    Nested `.formclass` instances are written as nested objects. Decimals,
+    UUIDs, and dates and times are written as strings.
+
+    Arguments
+    ---------
+    samples
+        The samples to write.
+    file
+        Path or text file object to write to.
+    compression
+        One of ``"gzip"``, ``"bz2"``, and ``"lzma"``. If `None`, the
+        compression is determined by the file extension of a path.
+    chunk_size
+        Number of samples to serialize before writing them to the file.
+
+    Returns
+    -------
+    int
+        The number of written samples.
+    """
+    encoder = json.JSONEncoder(separators=(",", ":"), default=_json_default)
+    field_names_cache: Dict[type, Optional[Tuple[str, ...]]] = {}
+    count = 0
+    with _open_text(file, compression) as stream:
+        for chunk in _chunked(samples, chunk_size):
+            stream.write(
+                "".join(
+                    encoder.encode(_to_plain(sample, field_names_cache)) + "\n"
+                    for sample in chunk
+                )
+            )
+            count += len(chunk)
+    return count
+
+
+def write_csv(
+    samples: Iterable[Any],
+    file: FileArg,
+    compression: Optional[str] = None,
+    separator: str = ".",
+    chunk_size: int = 1000,
+) -> int:
+    """Write samples as CSV with a header row.
+
+    Fields of nested `.formclass` instances are flattened into columns named
+    by the path of field names joined with *separator*. Lists and
+    dictionaries are written as JSON. The columns are determined by the first
+    sample.
+
+    Arguments
+    ---------
+    samples
+        The samples to write.
+    file
+        Path or text file object to write to. File objects should be opened
+        with ``newline=""``.
+    compression
+        One of ``"gzip"``, ``"bz2"``, and ``"lzma"``. If `None`, the
+        compression is determined by the file extension of a path.
+    separator
+        Separator of field names in the column names of nested fields.
+    chunk_size
+        Number of samples to serialize before writing them to the file.
+
+    Returns
+    -------
+    int
+        The number of written samples.
+
+    Raises
+    ------
+    ValueError
+        If a sample has fields not present in the first sample.
+    """
+    field_names_cache: Dict[type, Optional[Tuple[str, ...]]] = {}
+    columns: Dict[str, None] = {}
+    count = 0
+    with _open_text(file, compression) as stream:
+        writer = csv.writer(stream, lineterminator="\n")
+        for chunk in _chunked(samples, chunk_size):
+            rows = []
+            for sample in chunk:
+                row: Dict[str, Any] = {}
+                _flatten(sample, "", separator, row, field_names_cache)
+                if not columns:
+                    columns = dict.fromkeys(row)
+                    writer.writerow(columns)
+                unknown_columns = row.keys() - columns.keys()
+                if unknown_columns:
+                    raise ValueError(
+                        "Sample has columns not present in the first sample: "
+                        f"{', '.join(sorted(unknown_columns))}."
+                    )
+                rows.append([row.get(column, None) for column in columns])
+            writer.writerows(rows)
+            count += len(chunk)
+    return count
+
+
+@contextmanager
+def _open_text(file: FileArg, compression: Optional[str]) -> Iterator[IO[str]]:
+    if not isinstance(file, (str, os.PathLike)):
+        if compression is not None:
+            raise ValueError("Compression is only supported for paths.")
+        yield file
+        return
+
+    if compression is None:
+        extension = os.path.splitext(file)[1]
+        compression = _COMPRESSION_BY_EXTENSION.get(extension, None)
+    if compression is None:
+        opener: Callable[..., IO[str]] = open
+    elif compression in _OPENERS:
+        opener = _OPENERS[compression]
+    else:
+        raise ValueError(f"Unknown compression '{compression}'.")
+
+    with opener(file, "wt", encoding="utf-8", newline="") as stream:
+        yield stream
+
+
+def _chunked(iterable: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _get_field_names(
+    cls: type, cache: Dict[type, Optional[Tuple[str, ...]]]
+) -> Optional[Tuple[str, ...]]:
+    try:
+        return cache[cls]
+    except KeyError:
+        pass
+    field_names = (
+        tuple(field_def.name for field_def in fields(cls))
+        if is_dataclass(cls)
+        else None
+    )
+    cache[cls] = field_names
+    return field_names
+
+
+def _to_plain(value: Any, cache: Dict[type, Optional[Tuple[str, ...]]]) -> Any:
+    if isinstance(value, _ATOMIC_TYPES):
+        return value
+    field_names = _get_field_names(type(value), cache)
+    if field_names is not None:
+        return {name: _to_plain(getattr(value, name), cache) for name in field_names}
+    if isinstance(value, (list, tuple)):
+        return [_to_plain(item, cache) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_plain(item, cache) for key, item in value.items()}
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _flatten(
+    value: Any,
+    prefix: str,
+    separator: str,
+    row: Dict[str, Any],
+    cache: Dict[type, Optional[Tuple[str, ...]]],
+) -> None:
+    field_names = _get_field_names(type(value), cache)
+    if field_names is None:
+        row[prefix or "value"] = _to_csv_value(value, cache)
+        return
+    for name in field_names:
+        _flatten(
+            getattr(value, name),
+            prefix + separator + name if prefix else name,
+            separator,
+            row,
+            cache,
+        )
+
+
+def _to_csv_value(value: Any, cache: Dict[type, Optional[Tuple[str, ...]]]) -> Any:
+    if isinstance(value, _ATOMIC_TYPES):
+        return value
+    if isinstance(value, (list, tuple, dict, set, frozenset)):
+        return json.dumps(
+            _to_plain(value, cache), separators=(",", ":"), default=_json_default
+        )
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return value
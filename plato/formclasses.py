@@ -7,49 +7,81 @@ Plato's core API consists out of
 * and the `.sample` function to generate instances of concrete test data from
   instances of such form classes.
 
+Further functions build on top of these to generate many instances at once
+(`plato.batch`), to generate columns (`plato.columnar`) or dictionaries
+(`plato.dicts`) instead of instances, and to generate variants of generated
+instances (`plato.resampling`).
+
 .. testsetup:: *
 
-    from plato import formclass, sample
+    from plato import derivedfield, formclass, sample
     import plato.providers.faker
 
     plato.seed(0)
 """
 
-import inspect
-import sys
-from dataclasses import Field, InitVar, fields, is_dataclass, make_dataclass
+from dataclasses import (  # pylint: disable=unused-import
+    Field,
+    InitVar,
+    fields,
+    is_dataclass,
+    make_dataclass,
+)
+from functools import partial
 from typing import (
     Any,
     Callable,
     ClassVar,
     Dict,
-    FrozenSet,
     Generic,
     List,
-    MutableMapping,
+    Optional,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
     Union,
     cast,
+    overload,
 )
-from weakref import WeakKeyDictionary
 
 from .context import Context, get_root_context
-from .internal.graph import toposort
-from .internal.weak_id_dict import WeakIdDict
+from .hooks import SamplingEvent, _active_hooks, run_hooked
+from .internal.lazy_sampling import sample_lazily
+from .internal.output_class import create_output_class, get_output_factory
+from .internal.sampling_plan import (
+    INIT_VARS_ATTR,
+    DerivedFieldPlan,
+    SamplingPlan,
+    get_derived_field_args,
+    get_init_vars,
+    get_sampling_plan,
+    is_init_var,
+    register_derived_fields,
+)
 from .providers.base import Provider, ProviderProtocol
 
-_init_var_registry: WeakIdDict[Dict[str, Any]] = WeakIdDict()
-_post_init_registry: MutableMapping[
-    object, Dict[str, Callable[..., Any]]
-] = WeakKeyDictionary()
-
-
 T = TypeVar("T")
 
 
+@overload
 def formclass(cls: type) -> type:
+    ...
+
+
+@overload
+def formclass(
+    *, output_slots: bool = False, output_frozen: bool = False
+) -> Callable[[type], type]:
+    ...
+
+
+def formclass(
+    cls: Optional[type] = None,
+    *,
+    output_slots: bool = False,
+    output_frozen: bool = False,
+) -> Union[type, Callable[[type], type]]:
     """Class decorator to process a class definition as formclass.
 
     The *formclass* decorator is one of the main parts of the Plato API. A class
@@ -67,8 +99,24 @@ def formclass(cls: type) -> type:
     as argument to the `__post_init__` method (in order of declaration) and
     `.derivedfield` methods (as keyword argument by name).
 
-    Example
-    -------
+    The instances returned by `.sample` are instances of a separate, plain
+    :func:`~dataclasses.dataclass` derived from the *formclass*. Its
+    constructor only takes the final values of all fields (including derived
+    fields) and does not run the `__post_init__` method. The decorator can be
+    invoked with arguments to configure this class.
+
+    Arguments
+    ---------
+    output_slots
+        Whether the sampled instances store their field values in slots
+        instead of an instance dictionary, which reduces the memory
+        footprint.
+    output_frozen
+        Whether the sampled instances are frozen, i.e. assigning to their
+        fields raises a :class:`~dataclasses.FrozenInstanceError`.
+
+    Examples
+    --------
 
     .. testcode:: formclass
 
@@ -93,6 +141,16 @@ def formclass(cls: type) -> type:
         # noqa: DAR201 return
     """
 
+    if cls is None:
+        return partial(
+            _process_formclass,
+            output_slots=output_slots,
+            output_frozen=output_frozen,
+        )
+    return _process_formclass(cls, output_slots, output_frozen)
+
+
+def _process_formclass(cls: type, output_slots: bool, output_frozen: bool) -> type:
     post_init_fns: Dict[str, Callable[..., Any]] = {}
 
     annotations = getattr(cls, "__annotations__", {})
@@ -112,17 +170,24 @@ def formclass(cls: type) -> type:
             value = None
         namespace[name] = value
 
-    orig_post_init = namespace.get("__post_init__", None)
-    init_var_names = [
-        name for name, type_ in annotations.items() if _is_init_var(type_)
-    ]
+    orig_post_init = getattr(cls, "__post_init__", None)
+    has_init_vars = any(is_init_var(type_) for type_ in annotations.values()) or any(
+        is_init_var(field_def.type)
+        for base in cls.__mro__[1:]
+        for field_def in getattr(base, "__dataclass_fields__", {}).values()
+    )
 
-    def __post_init__(self: Any, *args: Any) -> None:
-        _init_var_registry[self] = dict(zip(init_var_names, args))
-        if orig_post_init:
-            orig_post_init(self, *args)
+    if has_init_vars:
+        # The InitVar values are kept in the instance __dict__ (instead of
+        # a registry keyed by the instance) to make storing them cheap for the
+        # many instances created by sampling. This also makes them survive
+        # pickling and copying.
+        def __post_init__(self: Any, *args: Any) -> None:
+            self.__dict__[INIT_VARS_ATTR] = args
+            if orig_post_init:
+                orig_post_init(self, *args)
 
-    namespace["__post_init__"] = __post_init__
+        namespace["__post_init__"] = __post_init__
 
     instance_fields_with_field_def: List[
         Union[Tuple[str, type], Tuple[str, type, Field]]
@@ -139,7 +204,13 @@ def formclass(cls: type) -> type:
         bases=cls.__mro__[1:],
         namespace=namespace,
     )
-    _post_init_registry[dc] = post_init_fns
+    register_derived_fields(dc, post_init_fns)
+    create_output_class(
+        dc,
+        [field_def.name for field_def in fields(dc)],
+        slots=output_slots,
+        frozen=output_frozen,
+    )
     return dc
 
 
@@ -149,13 +220,6 @@ def _type_origin_matches(annotation: Type, type_: object) -> bool:
     ) is getattr(type_, "__origin__", None)
 
 
-def _is_init_var(type_: type) -> bool:
-    is_py37_init_var = (
-        sys.version_info[:2] <= (3, 7) and type_.__class__ is InitVar.__class__
-    )
-    return is_py37_init_var or isinstance(type_, InitVar)
-
-
 DerivedFieldT = TypeVar("DerivedFieldT", bound=Callable)
 
 
@@ -190,7 +254,7 @@ class _DerivedField(Generic[DerivedFieldT]):
 derivedfield = _DerivedField
 
 
-def sample(form: T, context: Context = None) -> T:
+def sample(form: T, context: Context = None, lazy: bool = False) -> T:
     """Generates a dataclass with concrete values from a `.formclass` instance.
 
     Recursively processes a `.formclass` instance and returns an analogous
@@ -216,6 +280,14 @@ def sample(form: T, context: Context = None) -> T:
         Context of the sample operation, for example, the random number seed to
         use. Usually this argument has not to be set manually and will be
         initialized automatically.
+    lazy
+        If set, the fields of a `.formclass` instance (including fields of
+        nested `.formclass` instances) are only sampled on first access. A
+        `.derivedfield` method only triggers the sampling of the fields it
+        accesses. The sampled values are the same as without *lazy*, as long
+        as providers derive their values solely from the sampling context
+        (`.Shared` is supported as well) and `.derivedfield` methods request
+        the values of other derived fields as arguments.
 
     Returns
     -------
@@ -276,54 +348,116 @@ def sample(form: T, context: Context = None) -> T:
         context = get_root_context(form.__class__)
 
     if isinstance(form, Provider):
+        if _active_hooks:
+            return run_hooked(
+                SamplingEvent(context, None, None, form), form.sample, context
+            )
         return form.sample(context)
     if not is_dataclass(form):
         return form
 
-    init_args = dict(_init_var_registry[form])
-    init_args.update(
-        {
-            field_def.name: sample(
-                getattr(form, field_def.name), context.subcontext(field_def.name)
+    plan = get_sampling_plan(type(form))
+    if lazy:
+        return sample_lazily(form, plan, context, sample)
+    if _active_hooks:
+        return run_hooked(
+            SamplingEvent(context, type(form), None, None),
+            _sample_formclass,
+            form,
+            plan,
+            get_init_vars(form, plan),
+            context,
+        )
+    return _sample_formclass(form, plan, get_init_vars(form, plan), context)
+
+
+def _sample_formclass(
+    form: T, plan: SamplingPlan, init_vars: Dict[str, Any], context: Context
+) -> T:
+    if _active_hooks:
+        values = [
+            _sample_field_hooked(
+                type(form), name, getattr(form, name), context.subcontext(name)
             )
-            for field_def in fields(form)
-        }
+            for name in plan.field_names
+        ]
+    else:
+        values = [
+            sample(getattr(form, name), context.subcontext(name))
+            for name in plan.field_names
+        ]
+    instance = _create_instance(type(form), plan, init_vars, values)
+    return _complete_derived_fields(type(form), instance, plan, init_vars, context)
+
+
+def _sample_field_hooked(
+    form_class: type, name: str, value: Any, context: Context
+) -> Any:
+    if value is None:
+        # Nothing to sample, e.g., derived fields that will be computed later.
+        return None
+    return run_hooked(
+        SamplingEvent(context, form_class, name, None), sample, value, context
     )
-    instance = form.__class__(**init_args)  # type: ignore[call-arg]
 
-    if form.__class__ in _post_init_registry:
 
-        def get_post_init_arg(name: str) -> Any:
-            if name in _init_var_registry[form]:
-                return _init_var_registry[form][name]
-            return getattr(instance, name)
-
-        dependency_graph: Dict[str, FrozenSet[str]] = {
-            name: frozenset() for name in init_args
-        }
-        for name, fn in _post_init_registry[form.__class__].items():
-            parameter_iter = iter(inspect.signature(fn).parameters)
-            next(parameter_iter)  # skip self
-            dependency_graph[name] = frozenset(parameter_iter)
-
-        eval_order = toposort(dependency_graph)
+def _create_instance(
+    form_class: Type[T],
+    plan: SamplingPlan,
+    init_vars: Dict[str, Any],
+    values: Sequence[Any],
+) -> T:
+    create = get_output_factory(form_class)
+    if create is None:
+        # Plain dataclass or a dataclass derived from a formclass without
+        # being a formclass itself.
+        return form_class(  # type: ignore[call-arg]
+            **init_vars, **dict(zip(plan.field_names, values))
+        )
+    return create(*values)
+
+
+def _complete_derived_fields(
+    form_class: type,
+    instance: T,
+    plan: SamplingPlan,
+    init_vars: Dict[str, Any],
+    context: Context,
+) -> T:
+    for derived_field in plan.derived_fields:
+        if derived_field.name in init_vars:
+            continue
 
-        for name in eval_order:
-            if name in _init_var_registry[form]:
-                continue
+        if getattr(instance, derived_field.name, None) is not None:
+            continue
 
-            value = getattr(instance, name, None)
-            if value is not None:
-                continue
+        field_context = context.subcontext(derived_field.name)
+        if _active_hooks:
+            value = run_hooked(
+                SamplingEvent(
+                    field_context, form_class, derived_field.name, None, derived=True
+                ),
+                _sample_derived_field,
+                instance,
+                derived_field,
+                init_vars,
+                field_context,
+            )
+        else:
+            value = _sample_derived_field(
+                instance, derived_field, init_vars, field_context
+            )
+        # Bypass __setattr__ to support frozen output classes.
+        object.__setattr__(instance, derived_field.name, value)
 
-            if name not in _post_init_registry[form.__class__]:
-                continue
+    return instance
 
-            fn = _post_init_registry[form.__class__][name]
-            init_var_args = {
-                name: get_post_init_arg(name) for name in dependency_graph[name]
-            }
-            value = fn(instance, **init_var_args)
-            setattr(instance, name, sample(value, context.subcontext(name)))
 
-    return instance
+def _sample_derived_field(
+    instance: Any,
+    derived_field: DerivedFieldPlan,
+    init_vars: Dict[str, Any],
+    context: Context,
+) -> Any:
+    derived_field_args = get_derived_field_args(instance, derived_field, init_vars)
+    return sample(derived_field.fn(instance, **derived_field_args), context)
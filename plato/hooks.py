@@ -0,0 +1,183 @@
+"""Hooks to instrument the sampling of formclasses and providers.
+
+Hooks are invoked around the sampling of each `.formclass` instance, around
+each of its fields (including derived fields), and around each invocation of
+a `.Provider` by `~plato.formclasses.sample`, `~plato.batch.sample_many`,
+`.iter_samples`, and `~plato.batch.sample_batch`. Fields with a `None` value
+(e.g., derived fields before they are computed) are skipped as there is
+nothing to sample.
+Batches are sampled one instance at a time while hooks are registered, so that
+each field and provider invocation can be observed individually. Hooks are not
+invoked in the worker processes of `~plato.batch.sample_many` and by
+`.sample_columns`, `.sample_dict`, and `.sample_many_dicts`.
+
+While no hook is registered, the instrumentation has effectively no cost.
+
+.. testsetup:: *
+
+    import plato
+    from plato import formclass, sample
+    from plato.hooks import SamplingHook, add_hook, remove_hook
+
+    plato.seed(0)
+
+Examples
+--------
+
+.. testcode:: hooks
+
+    class PrintHook(SamplingHook):
+        def after(self, event, elapsed):
+            if event.field_name is not None:
+                print(".".join(event.context.path))
+
+    @formclass
+    class Address:
+        city: str = "Berlin"
+
+    @formclass
+    class Customer:
+        name: str = "Plato"
+        address: Address = Address()
+
+    hook = PrintHook()
+    add_hook(hook)
+    try:
+        sample(Customer())
+    finally:
+        remove_hook(hook)
+
+.. testoutput:: hooks
+
+    name
+    address.city
+    address
+"""
+
+import time
+from types import TracebackType
+from typing import Any, Callable, List, NamedTuple, Optional, Type, TypeVar
+
+from .context import Context
+
+T = TypeVar("T")
+HookT = TypeVar("HookT", bound="SamplingHook")
+
+
+class SamplingEvent(NamedTuple):
+    """Describes the sampling of a field or the invocation of a provider."""
+
+    context: Context
+    """Context used for the sampling. The context path (see `.Context.path`)
+    identifies the sampled field within the top-level sample."""
+
+    form_class: Optional[type]
+    """The `.formclass` of the sampled instance or field or `None` for
+    provider invocations."""
+
+    field_name: Optional[str]
+    """Name of the sampled field or `None` for instances and provider
+    invocations."""
+
+    provider: Optional[Any]
+    """The invoked `.Provider` or `None` for instances and fields."""
+
+    derived: bool = False
+    """Whether the sampled field is a derived field."""
+
+
+class SamplingHook:
+    """Base class for sampling hooks.
+
+    Override the methods of interest and register the hook with `add_hook`.
+    Alternatively, use the hook as a context manager to register it for the
+    duration of the ``with`` block.
+    """
+
+    def __enter__(self: HookT) -> HookT:
+        add_hook(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        remove_hook(self)
+
+    def before(self, event: SamplingEvent) -> None:
+        """Invoked before an instance or field is sampled or a provider is invoked.
+
+        Arguments
+        ---------
+        event
+            Description of the instance, field, or provider.
+        """
+
+    def after(self, event: SamplingEvent, elapsed: float) -> None:
+        """Invoked after an instance or field was sampled or a provider invoked.
+
+        Also invoked if an exception was raised.
+
+        Arguments
+        ---------
+        event
+            Description of the instance, field, or provider.
+        elapsed
+            Elapsed time in seconds.
+        """
+
+
+_active_hooks: List[SamplingHook] = []
+
+
+def add_hook(hook: SamplingHook) -> None:
+    """Register a sampling hook.
+
+    Arguments
+    ---------
+    hook
+        The hook to register.
+    """
+    _active_hooks.append(hook)
+
+
+def remove_hook(hook: SamplingHook) -> None:
+    """Unregister a sampling hook.
+
+    Arguments
+    ---------
+    hook
+        The hook to unregister.
+    """
+    _active_hooks.remove(hook)
+
+
+def run_hooked(event: SamplingEvent, fn: Callable[..., T], *args: Any) -> T:
+    """Invoke a function surrounded by the calls to the registered hooks.
+
+    Arguments
+    ---------
+    event
+        The event to pass to the hooks.
+    fn
+        The function to invoke.
+    *args
+        Arguments to pass to *fn*.
+
+    Returns
+    -------
+    T
+        The return value of *fn*.
+    """
+    hooks = tuple(_active_hooks)
+    for hook in hooks:
+        hook.before(event)
+    start = time.perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        elapsed = time.perf_counter() - start
+        for hook in reversed(hooks):
+            hook.after(event, elapsed)
@@ -0,0 +1,71 @@
+"""Provides a dictionary with constant time copies."""
+
+from typing import Dict, Iterator, MutableMapping, Optional, TypeVar
+
+KT = TypeVar("KT")
+VT = TypeVar("VT")
+
+
+class CopyOnWriteDict(MutableMapping[KT, VT]):  # pylint: disable=too-many-ancestors
+    """Dictionary deferring the copying of its data until it gets modified.
+
+    Arguments
+    ---------
+    data
+        Initial data of the dictionary. The passed instance is used as storage
+        (without copying) and thus might be modified.
+    """
+
+    __slots__ = ("_data", "_shared")
+
+    _data: MutableMapping[KT, VT]
+    _shared: bool
+
+    def __init__(self, data: Optional[MutableMapping[KT, VT]] = None):
+        self._data = {} if data is None else data
+        self._shared = False
+
+    def copy(self) -> "CopyOnWriteDict[KT, VT]":
+        """Create a flat copy of the dictionary in constant time.
+
+        The data is only copied once either the original or the copy gets
+        modified.
+
+        Returns
+        -------
+        CopyOnWriteDict
+            The copy of the dictionary.
+        """
+        duplicate = CopyOnWriteDict(self._data)
+        duplicate._shared = True  # pylint: disable=protected-access
+        self._shared = True
+        return duplicate
+
+    def __getitem__(self, key: KT) -> VT:
+        return self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __setitem__(self, key: KT, value: VT) -> None:
+        self._ensure_exclusive_data()
+        self._data[key] = value
+
+    def __delitem__(self, key: KT) -> None:
+        self._ensure_exclusive_data()
+        del self._data[key]
+
+    def __iter__(self) -> Iterator[KT]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._data!r})"
+
+    def _ensure_exclusive_data(self) -> None:
+        if self._shared:
+            data: Dict[KT, VT] = dict(self._data)
+            self._data = data
+            self._shared = False
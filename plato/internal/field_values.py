@@ -0,0 +1,205 @@
+"""Sampling of formclass instances into field values without the instances."""
+
+import copy
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+from ..context import Context
+from ..providers.base import Provider
+from .output_class import get_output_class
+from .sampling_plan import (
+    SamplingPlan,
+    get_derived_field_args,
+    get_init_vars,
+    get_sampling_plan,
+)
+
+DictFactory = Callable[[List[Tuple[str, Any]]], Any]
+
+
+class FieldValues(Dict[str, Any]):
+    """Sampled field values of a formclass instance without the instance.
+
+    Arguments
+    ---------
+    form_class
+        The formclass of the sampled instance.
+    values
+        The field values as name-value pairs.
+    """
+
+    def __init__(self, form_class: type, values: Iterable[Tuple[str, Any]] = ()):
+        super().__init__(values)
+        self.form_class = form_class
+
+
+def sample_values(form: Any, context: Context) -> Any:
+    """Samples a formclass instance into `FieldValues`.
+
+    The values are the same as sampled by `.sample`. Nested formclass
+    instances are sampled into nested `FieldValues`.
+
+    Arguments
+    ---------
+    form
+        A formclass instance, a `.Provider`, or any other object.
+    context
+        Context of the sample operation.
+
+    Returns
+    -------
+    The `FieldValues` of a formclass instance, the sampled value of
+    a `.Provider`, or the object itself otherwise.
+    """
+    if isinstance(form, Provider):
+        return form.sample(context)
+    if not is_dataclass(form):
+        return form
+    plan = get_sampling_plan(type(form))
+    init_vars = get_init_vars(form, plan)
+    values = FieldValues(type(form))
+    for name in plan.field_names:
+        values[name] = sample_values(getattr(form, name), context.subcontext(name))
+    return complete_derived_field_values(values, plan, init_vars, context)
+
+
+def complete_derived_field_values(
+    values: FieldValues,
+    plan: SamplingPlan,
+    init_vars: Dict[str, Any],
+    context: Context,
+) -> FieldValues:
+    """Adds the values of the derived fields to sampled `FieldValues`.
+
+    An instance holding the field values is created (without initializing
+    it) as *self* argument for the `.derivedfield` methods, so that they get
+    the same kind of instance as when sampling instances.
+
+    Arguments
+    ---------
+    values
+        The sampled values of the fields.
+    plan
+        The sampling plan of the formclass.
+    init_vars
+        The `InitVar` values by name.
+    context
+        Context of the sample operation of the instance.
+
+    Returns
+    -------
+    The *values* with the derived fields added.
+    """
+    if not plan.derived_fields:
+        return values
+
+    instance = _create_instance_from_values(values)
+    for derived_field in plan.derived_fields:
+        if derived_field.name in init_vars:
+            continue
+
+        if values.get(derived_field.name, None) is not None:
+            continue
+
+        derived_field_args = get_derived_field_args(instance, derived_field, init_vars)
+        value = sample_values(
+            derived_field.fn(instance, **derived_field_args),
+            context.subcontext(derived_field.name),
+        )
+        values[derived_field.name] = value
+        _set_instance_value(instance, derived_field.name, value)
+
+    return values
+
+
+def flatten_field_values(values: FieldValues, prefix: str) -> Iterator[Tuple[str, Any]]:
+    """Flattens nested `FieldValues` into the dotted paths and values of fields.
+
+    Arguments
+    ---------
+    values
+        The field values.
+    prefix
+        Prefix of the paths.
+
+    Yields
+    ------
+    Tuple[str, Any]
+        The dotted path and the value of each field.
+    """
+    for name, value in values.items():
+        if isinstance(value, FieldValues):
+            yield from flatten_field_values(value, prefix + name + ".")
+        else:
+            yield prefix + name, value
+
+
+_IMMUTABLE_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def field_values_to_dict(value: Any, dict_factory: DictFactory) -> Any:
+    """Converts `FieldValues` into dictionaries like `dataclasses.asdict`.
+
+    Does the same conversion as `dataclasses.asdict`, including the deep copy
+    of values not converted, but for the sampled field values.
+
+    Arguments
+    ---------
+    value
+        The `FieldValues` to convert.
+    dict_factory
+        Creates the dictionaries from lists of key-value pairs.
+
+    Returns
+    -------
+    The converted value.
+    """
+    if isinstance(value, FieldValues) or (
+        is_dataclass(value) and not isinstance(value, type)
+    ):
+        return dict_factory(
+            [
+                (name, field_values_to_dict(field_value, dict_factory))
+                for name, field_value in _get_items(value)
+            ]
+        )
+    if type(value) in _IMMUTABLE_TYPES:
+        return value
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return type(value)(
+            *[field_values_to_dict(item, dict_factory) for item in value]
+        )
+    if isinstance(value, (list, tuple)):
+        return type(value)(field_values_to_dict(item, dict_factory) for item in value)
+    if isinstance(value, dict):
+        return type(value)(
+            (
+                field_values_to_dict(key, dict_factory),
+                field_values_to_dict(item, dict_factory),
+            )
+            for key, item in value.items()
+        )
+    return copy.deepcopy(value)
+
+
+def _get_items(value: Any) -> Iterable[Tuple[str, Any]]:
+    if isinstance(value, FieldValues):
+        return value.items()
+    return (
+        (field_def.name, getattr(value, field_def.name)) for field_def in fields(value)
+    )
+
+
+def _create_instance_from_values(values: FieldValues) -> Any:
+    form_class = values.form_class
+    instance: Any = object.__new__(get_output_class(form_class) or form_class)
+    for name, value in values.items():
+        _set_instance_value(instance, name, value)
+    return instance
+
+
+def _set_instance_value(instance: Any, name: str, value: Any) -> None:
+    if isinstance(value, FieldValues):
+        value = _create_instance_from_values(value)
+    # Bypass __setattr__ to support frozen output classes.
+    object.__setattr__(instance, name, value)
@@ -1,6 +1,7 @@
 """Graph algorithms used in Plato."""
 
-from typing import Collection, Dict, Mapping, Set, TypeVar
+from collections import deque
+from typing import Collection, Dict, Mapping, TypeVar
 
 T = TypeVar("T")
 
@@ -18,7 +19,8 @@ def toposort(graph: Mapping[T, Collection[T]]) -> Collection[T]:
     -------
     The topological sort of ``graph``, i.e. the keys in ``graph`` in the order
     they need to be processed to always have all necessary dependencies
-    available when processing a particular key.
+    available when processing a particular key. The result only depends on
+    the order of the keys in ``graph``, but not on their hash values.
 
     Raises
     ------
@@ -30,23 +32,23 @@ def toposort(graph: Mapping[T, Collection[T]]) -> Collection[T]:
     remaining_graph = {vertex: set(edges) for vertex, edges in graph.items()}
 
     toposorted = []
-    dependencies_fulfilled = set(
+    dependencies_fulfilled = deque(
         vertex for vertex, edges in graph.items() if len(edges) == 0
     )
 
-    dependents: Dict[T, Set[T]] = {vertex: set() for vertex in graph}
+    dependents: Dict[T, Dict[T, None]] = {vertex: {} for vertex in graph}
     for vertex, edges in graph.items():
         for edge in edges:
-            dependents[edge].add(vertex)
+            dependents[edge][vertex] = None
 
     while dependencies_fulfilled:
-        vertex = dependencies_fulfilled.pop()
+        vertex = dependencies_fulfilled.popleft()
         toposorted.append(vertex)
 
         for dependent in dependents[vertex]:
             remaining_graph[dependent].remove(vertex)
             if len(remaining_graph[dependent]) == 0:
-                dependencies_fulfilled.add(dependent)
+                dependencies_fulfilled.append(dependent)
 
     if any(len(edges) > 0 for edges in remaining_graph.values()):
         raise ValueError("The graph must not contain cycles.")
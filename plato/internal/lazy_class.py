@@ -0,0 +1,98 @@
+"""Classes for sampled instances whose fields are sampled on first access."""
+
+from typing import Any, Callable, Dict, Sequence
+
+from .output_class import create_eq, get_output_class
+
+_LAZY_CLASS_ATTR = "__plato_lazy_class__"
+_LAZY_STATE_ATTR = "__plato_lazy_state__"
+
+SampleFieldFn = Callable[[Any, Any, str], Any]
+
+
+class _LazyField:
+    """Non-data descriptor sampling a field on first access.
+
+    The sampled value is stored in the instance dictionary, which takes
+    precedence over the descriptor on subsequent accesses.
+    """
+
+    __slots__ = ("name", "sample_field")
+
+    def __init__(self, name: str, sample_field: SampleFieldFn):
+        self.name = name
+        self.sample_field = sample_field
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+        instance_dict = instance.__dict__
+        value = self.sample_field(instance, instance_dict[_LAZY_STATE_ATTR], self.name)
+        instance_dict[self.name] = value
+        return value
+
+
+def get_lazy_class(
+    form_class: type, field_names: Sequence[str], sample_field: SampleFieldFn
+) -> type:
+    """Returns the class used for lazily sampled instances of a formclass.
+
+    The class is created on first use. It is a subclass of the output class of
+    ``form_class`` (see `.create_output_class`) or of ``form_class`` itself if
+    there is none. Thus, the instances are compatible with eagerly sampled
+    instances.
+
+    Arguments
+    ---------
+    form_class
+        The formclass to get the lazy class for.
+    field_names
+        Names of all fields (including derived fields) of the formclass.
+    sample_field
+        Invoked with the instance, the state passed to `create_lazy_instance`,
+        and the field name to sample a field on its first access.
+
+    Returns
+    -------
+    The lazy class.
+    """
+    if _LAZY_STATE_ATTR in form_class.__dict__:
+        # Sampling a lazily sampled instance again.
+        return form_class
+
+    lazy_class = form_class.__dict__.get(_LAZY_CLASS_ATTR, None)
+    if lazy_class is None:
+        base = get_output_class(form_class) or form_class
+        namespace: Dict[str, Any] = {
+            name: _LazyField(name, sample_field) for name in field_names
+        }
+        namespace[_LAZY_STATE_ATTR] = None
+        namespace["__module__"] = form_class.__module__
+        namespace["__qualname__"] = form_class.__qualname__
+        namespace["__doc__"] = form_class.__doc__
+        if getattr(form_class, "__dataclass_params__").eq:
+            # Lazily sampled instances are also equal to eagerly sampled ones.
+            namespace["__eq__"] = create_eq(form_class, base)
+            namespace["__hash__"] = base.__hash__
+        lazy_class = type(form_class)(form_class.__name__, (base,), namespace)
+        setattr(form_class, _LAZY_CLASS_ATTR, lazy_class)
+    return lazy_class
+
+
+def create_lazy_instance(lazy_class: type, state: Any) -> Any:
+    """Creates an instance of a lazy class without sampling any field.
+
+    Arguments
+    ---------
+    lazy_class
+        Class created with `get_lazy_class`.
+    state
+        Passed to the *sample_field* function given to `get_lazy_class`.
+
+    Returns
+    -------
+    The created instance.
+    """
+    instance: Any = object.__new__(lazy_class)
+    instance.__dict__[_LAZY_STATE_ATTR] = state
+    return instance
@@ -0,0 +1,179 @@
+"""Sampling of formclass instances whose fields are sampled on first access."""
+
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, Dict, NamedTuple, Set
+
+from ..context import Context
+from ..hooks import SamplingEvent, _active_hooks, run_hooked
+from ..providers.base import Provider
+from .lazy_class import create_lazy_instance, get_lazy_class
+from .sampling_plan import (
+    DerivedFieldPlan,
+    SamplingPlan,
+    get_derived_field_args,
+    get_init_vars,
+)
+
+SampleFn = Callable[[Any, Context, bool], Any]
+
+
+class _LazyState(NamedTuple):
+    """What is needed to sample the fields of a lazily sampled instance."""
+
+    form: Any
+    plan: SamplingPlan
+    init_vars: Dict[str, Any]
+    context: Context
+    sample: SampleFn
+    # Ids of the providers sharing values that are reachable from each field,
+    # computed on first use.
+    shared_providers: Dict[str, Set[int]]
+
+
+def sample_lazily(
+    form: Any, plan: SamplingPlan, context: Context, sample: SampleFn
+) -> Any:
+    """Creates an instance of a formclass whose fields are sampled on first access.
+
+    The sampled values are the same as for eager sampling (see `.sample`).
+
+    Arguments
+    ---------
+    form
+        The formclass instance to sample.
+    plan
+        The sampling plan of the formclass.
+    context
+        Context of the sample operation.
+    sample
+        Invoked with a field value, its context, and `True` (for *lazy*) to
+        sample the fields. This is `.sample`, which cannot be imported here
+        without a circular import.
+
+    Returns
+    -------
+    The lazily sampled instance.
+    """
+    lazy_class = get_lazy_class(type(form), plan.field_names, _sample_lazy_field)
+    return create_lazy_instance(
+        lazy_class,
+        _LazyState(form, plan, get_init_vars(form, plan), context, sample, {}),
+    )
+
+
+def get_reachable_shared_providers(value: Any) -> Set[int]:
+    """Returns the ids of the providers sharing values reachable from a field value.
+
+    Providers are searched in the public attributes of providers, in the
+    fields of dataclass instances, and in containers. Only providers with
+    `.Provider.shares_values` set are returned.
+
+    Arguments
+    ---------
+    value
+        The field value of a formclass instance.
+
+    Returns
+    -------
+    The ids of the reachable providers sharing values.
+    """
+    provider_ids: Set[int] = set()
+    seen: Set[int] = set()
+    pending = [value]
+    while pending:
+        value = pending.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+
+        if isinstance(value, Provider):
+            if value.shares_values:
+                provider_ids.add(id(value))
+            pending.extend(
+                attr_value
+                for attr_name, attr_value in getattr(value, "__dict__", {}).items()
+                if not attr_name.startswith("_")
+            )
+        elif is_dataclass(value) and not isinstance(value, type):
+            pending.extend(getattr(value, field.name) for field in fields(value))
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            pending.extend(value)
+        elif isinstance(value, dict):
+            pending.extend(value.values())
+    return provider_ids
+
+
+def _sample_lazy_field(instance: Any, state: _LazyState, name: str) -> Any:
+    # Mirrors the order of checks in _sample_formclass and
+    # _complete_derived_fields of the formclasses module to produce the same
+    # values.
+    form_class = type(state.form)
+    _sample_preceding_fields_with_same_providers(instance, state, name)
+    value = getattr(state.form, name)
+    field_context = state.context.subcontext(name)
+
+    if value is not None:
+        if _active_hooks:
+            event = SamplingEvent(field_context, form_class, name, None)
+            value = run_hooked(event, state.sample, value, field_context, True)
+        else:
+            value = state.sample(value, field_context, True)
+
+    derived_field = next(
+        (
+            derived_field
+            for derived_field in state.plan.derived_fields
+            if derived_field.name == name
+        ),
+        None,
+    )
+    if derived_field is None or name in state.init_vars or value is not None:
+        return value
+
+    if _active_hooks:
+        return run_hooked(
+            SamplingEvent(field_context, form_class, name, None, derived=True),
+            _sample_derived_field,
+            instance,
+            state,
+            derived_field,
+            field_context,
+        )
+    return _sample_derived_field(instance, state, derived_field, field_context)
+
+
+def _sample_derived_field(
+    instance: Any, state: _LazyState, derived_field: DerivedFieldPlan, context: Context
+) -> Any:
+    derived_field_args = get_derived_field_args(
+        instance, derived_field, state.init_vars
+    )
+    return state.sample(derived_field.fn(instance, **derived_field_args), context, True)
+
+
+def _sample_preceding_fields_with_same_providers(
+    instance: Any, state: _LazyState, name: str
+) -> None:
+    # Providers like Shared reuse the value sampled first within the instance,
+    # also for nested formclass instances and providers. To reproduce the
+    # values of eager sampling, the preceding fields using the same providers
+    # need to be sampled before the subcontext copies the meta dictionary.
+    # Other providers do not depend on the preceding fields.
+    providers = _get_lazy_field_providers(state, name)
+    if not providers:
+        return
+    for other_name in state.plan.field_names:
+        if other_name == name:
+            return
+        if other_name in instance.__dict__:
+            continue
+        if not providers.isdisjoint(_get_lazy_field_providers(state, other_name)):
+            getattr(instance, other_name)
+
+
+def _get_lazy_field_providers(state: _LazyState, name: str) -> Set[int]:
+    providers = state.shared_providers.get(name, None)
+    if providers is None:
+        providers = get_reachable_shared_providers(getattr(state.form, name))
+        state.shared_providers[name] = providers
+    return providers
@@ -0,0 +1,216 @@
+"""Lightweight classes for the instances created by sampling formclasses."""
+
+from dataclasses import FrozenInstanceError, fields
+from typing import Any, Callable, Dict, NoReturn, Optional, Sequence, Tuple
+
+_OUTPUT_CLASS_ATTR = "__plato_output_class__"
+_OUTPUT_FACTORY_ATTR = "__plato_output_factory__"
+_FORM_CLASS_ATTR = "__plato_form_class__"
+
+
+def create_output_class(
+    form_class: type,
+    field_names: Sequence[str],
+    slots: bool = False,
+    frozen: bool = False,
+) -> type:
+    """Creates the class used for the sampled instances of a formclass.
+
+    The created class is a subclass of ``form_class`` with the same name. Thus,
+    it provides the same methods and is compatible with the functions of the
+    `dataclasses` module. Its constructor behaves like the one of
+    ``form_class`` (e.g., for `dataclasses.replace`), and its instances are
+    equal to instances of ``form_class`` with equal fields.
+
+    Sampled instances are created with a factory that takes the final values
+    of all fields (in the order of ``field_names``) and merely assigns them. In
+    particular, no ``__post_init__`` method is run.
+
+    The created class and its factory are registered with ``form_class`` and
+    can be retrieved with `get_output_class` and `get_output_factory`.
+
+    Arguments
+    ---------
+    form_class
+        The formclass to create the output class for.
+    field_names
+        Names of all fields (including derived fields) of the formclass.
+    slots
+        Whether to store the field values in slots instead of an instance
+        dictionary.
+    frozen
+        Whether assigning to fields of the created instances raises
+        a `dataclasses.FrozenInstanceError`.
+
+    Returns
+    -------
+    The created output class.
+    """
+
+    field_names = tuple(field_names)
+
+    def __init__(self: Any, *args: Any, **kwargs: Any) -> None:
+        # Only invoked for instances created outside of sampling. The formclass
+        # constructor takes care of InitVar values and derived fields.
+        instance = form_class(*args, **kwargs)
+        for name, value in instance.__dict__.items():
+            object.__setattr__(self, name, value)
+
+    def __reduce__(self: Any) -> Tuple[Callable[..., Any], Tuple[Any, ...]]:
+        values = tuple(getattr(self, name) for name in field_names)
+        return _create_output_instance, (form_class, values)
+
+    namespace: Dict[str, Any] = {
+        "__init__": __init__,
+        "__reduce__": __reduce__,
+        "__module__": form_class.__module__,
+        "__qualname__": form_class.__qualname__,
+        "__doc__": form_class.__doc__,
+        _FORM_CLASS_ATTR: form_class,
+    }
+    if slots:
+        namespace["__slots__"] = field_names
+    if getattr(form_class, "__dataclass_params__").eq:
+        namespace["__eq__"] = create_eq(form_class)
+        namespace["__hash__"] = form_class.__hash__
+    if frozen:
+
+        def __hash__(self: Any) -> int:
+            return hash(tuple(getattr(self, name) for name in field_names))
+
+        namespace["__setattr__"] = _raise_frozen_instance_error
+        namespace["__delattr__"] = _raise_frozen_instance_error
+        namespace["__hash__"] = __hash__
+
+    output_class = type(form_class)(form_class.__name__, (form_class,), namespace)
+    setattr(form_class, _OUTPUT_CLASS_ATTR, output_class)
+    setattr(
+        form_class,
+        _OUTPUT_FACTORY_ATTR,
+        _create_factory(output_class, field_names, frozen),
+    )
+    return output_class
+
+
+def get_output_class(form_class: type) -> Optional[type]:
+    """Returns the output class registered for a formclass.
+
+    Arguments
+    ---------
+    form_class
+        The formclass to get the output class for.
+
+    Returns
+    -------
+    The output class created with `create_output_class` for ``form_class`` or
+    `None` if no output class has been created for exactly this class.
+    """
+    return form_class.__dict__.get(_OUTPUT_CLASS_ATTR, None)
+
+
+def get_output_factory(form_class: type) -> Optional[Callable[..., Any]]:
+    """Returns the factory creating sampled instances of a formclass.
+
+    Arguments
+    ---------
+    form_class
+        The formclass to get the factory for.
+
+    Returns
+    -------
+    A function creating an instance of the output class of ``form_class``
+    from the values of all fields or `None` if no output class has been
+    created for exactly this class.
+    """
+    return form_class.__dict__.get(_OUTPUT_FACTORY_ATTR, None)
+
+
+def get_form_class(cls: type) -> type:
+    """Returns the formclass of an output class.
+
+    Arguments
+    ---------
+    cls
+        An output class created with `create_output_class` or a subclass of
+        it.
+
+    Returns
+    -------
+    The formclass the output class has been created for or ``cls`` itself if
+    it is not an output class.
+    """
+    return getattr(cls, _FORM_CLASS_ATTR, cls)
+
+
+def create_eq(form_class: type, *classes: type) -> Callable[[Any, Any], Any]:
+    """Creates an ``__eq__`` method comparing the fields like a dataclass.
+
+    Unlike the method generated by the `dataclasses` module, it does not only
+    accept instances of the same class, but also of ``form_class`` and
+    ``classes``.
+
+    Arguments
+    ---------
+    form_class
+        The formclass whose fields are compared.
+    classes
+        Further classes whose instances are compared.
+
+    Returns
+    -------
+    The ``__eq__`` method.
+    """
+    field_names = tuple(
+        field_def.name for field_def in fields(form_class) if field_def.compare
+    )
+    other_classes = (form_class,) + classes
+
+    def __eq__(self: Any, other: Any) -> Any:
+        if other.__class__ is self.__class__ or other.__class__ in other_classes:
+            return tuple(getattr(self, name) for name in field_names) == tuple(
+                getattr(other, name) for name in field_names
+            )
+        return NotImplemented
+
+    return __eq__
+
+
+def _create_factory(
+    output_class: type, field_names: Tuple[str, ...], frozen: bool
+) -> Callable[..., Any]:
+    # Generating the source code (like the dataclasses module does) gives
+    # a factory as fast as a handwritten one.
+    self_name = "__plato_self__"
+    if frozen:
+        body = [
+            f"__plato_setattr__({self_name}, {name!r}, {name})" for name in field_names
+        ]
+    else:
+        body = [f"{self_name}.{name} = {name}" for name in field_names]
+    source = "def __plato_create__({}):\n    {}\n".format(
+        ", ".join(field_names),
+        "\n    ".join(
+            [f"{self_name} = __plato_new__(__plato_output_class__)"]
+            + body
+            + [f"return {self_name}"]
+        ),
+    )
+    namespace: Dict[str, Any] = {}
+    exec(  # pylint: disable=exec-used
+        source,
+        {
+            "__plato_new__": object.__new__,
+            "__plato_output_class__": output_class,
+            "__plato_setattr__": object.__setattr__,
+        },
+        namespace,
+    )
+    return namespace["__plato_create__"]
+
+
+def _raise_frozen_instance_error(self: Any, name: str, *_args: Any) -> NoReturn:
+    raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+
+def _create_output_instance(form_class: type, values: Tuple[Any, ...]) -> Any:
+    return form_class.__dict__[_OUTPUT_FACTORY_ATTR](*values)
@@ -0,0 +1,171 @@
+"""Precomputed per-class information required to sample formclass instances."""
+
+import inspect
+import sys
+from dataclasses import InitVar, fields
+from typing import Any, Callable, Dict, FrozenSet, MutableMapping, NamedTuple, Tuple
+from weakref import WeakKeyDictionary
+
+from .graph import toposort
+
+INIT_VARS_ATTR = "__plato_init_vars__"
+"""Name of the instance attribute holding the `InitVar` values of a formclass
+instance."""
+
+
+class DerivedFieldPlan(NamedTuple):
+    """A `.derivedfield` method with its argument names."""
+
+    name: str
+    fn: Callable[..., Any]
+    arg_names: Tuple[str, ...]
+
+
+class SamplingPlan(NamedTuple):
+    """Precomputed per-formclass information required by `.sample`.
+
+    Attributes
+    ----------
+    field_names
+        Names of the dataclass fields in declaration order.
+    init_var_names
+        Names of the `InitVar` fields in the order they are passed to
+        `__post_init__`.
+    derived_fields
+        The `.derivedfield` methods with their argument names in the order
+        they need to be evaluated.
+    """
+
+    field_names: Tuple[str, ...]
+    init_var_names: Tuple[str, ...]
+    derived_fields: Tuple[DerivedFieldPlan, ...]
+
+
+_derived_field_registry: MutableMapping[
+    object, Dict[str, Callable[..., Any]]
+] = WeakKeyDictionary()
+
+_sampling_plan_registry: MutableMapping[type, SamplingPlan] = WeakKeyDictionary()
+
+
+def register_derived_fields(cls: type, fns: Dict[str, Callable[..., Any]]) -> None:
+    """Registers the `.derivedfield` methods of a formclass.
+
+    Arguments
+    ---------
+    cls
+        The formclass.
+    fns
+        The methods by the name of the derived field.
+    """
+    _derived_field_registry[cls] = fns
+
+
+def get_sampling_plan(cls: type) -> SamplingPlan:
+    """Returns the sampling plan of a dataclass.
+
+    The plan is created on first use.
+
+    Arguments
+    ---------
+    cls
+        The dataclass (usually a formclass) to get the plan for.
+
+    Returns
+    -------
+    The sampling plan.
+    """
+    plan = _sampling_plan_registry.get(cls, None)
+    if plan is None:
+        plan = _create_sampling_plan(cls)
+        _sampling_plan_registry[cls] = plan
+    return plan
+
+
+def get_init_vars(form: Any, plan: SamplingPlan) -> Dict[str, Any]:
+    """Returns the `InitVar` values a formclass instance has been created with.
+
+    Arguments
+    ---------
+    form
+        The formclass instance.
+    plan
+        The sampling plan of the formclass.
+
+    Returns
+    -------
+    The `InitVar` values by name.
+    """
+    return dict(zip(plan.init_var_names, getattr(form, INIT_VARS_ATTR, ())))
+
+
+def get_derived_field_args(
+    instance: Any, derived_field: DerivedFieldPlan, init_vars: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Returns the keyword arguments to invoke a `.derivedfield` method with.
+
+    Arguments
+    ---------
+    instance
+        The instance to get the field values from.
+    derived_field
+        The derived field to get the arguments for.
+    init_vars
+        The `InitVar` values by name.
+
+    Returns
+    -------
+    The arguments by name.
+    """
+    return {
+        name: init_vars[name] if name in init_vars else getattr(instance, name)
+        for name in derived_field.arg_names
+    }
+
+
+def is_init_var(type_: type) -> bool:
+    """Returns whether a field type annotation is an `InitVar`.
+
+    Arguments
+    ---------
+    type_
+        The type annotation.
+
+    Returns
+    -------
+    Whether the annotation is an `InitVar`.
+    """
+    is_py37_init_var = (
+        sys.version_info[:2] <= (3, 7) and type_.__class__ is InitVar.__class__
+    )
+    return is_py37_init_var or isinstance(type_, InitVar)
+
+
+def _create_sampling_plan(cls: type) -> SamplingPlan:
+    field_names = tuple(field_def.name for field_def in fields(cls))
+    init_var_names = tuple(
+        field_def.name
+        for field_def in getattr(cls, "__dataclass_fields__").values()
+        if is_init_var(field_def.type)
+    )
+    post_init_fns = _derived_field_registry.get(cls, {})
+
+    dependency_graph: Dict[str, FrozenSet[str]] = {
+        name: frozenset() for name in init_var_names + field_names
+    }
+    arg_names: Dict[str, Tuple[str, ...]] = {}
+    for name, fn in post_init_fns.items():
+        parameter_iter = iter(inspect.signature(fn).parameters)
+        next(parameter_iter)  # skip self
+        arg_names[name] = tuple(parameter_iter)
+        dependency_graph[name] = frozenset(arg_names[name])
+
+    return SamplingPlan(
+        field_names=field_names,
+        init_var_names=init_var_names,
+        derived_fields=tuple(
+            DerivedFieldPlan(name, post_init_fns[name], arg_names[name])
+            for name in toposort(dependency_graph)
+            if name in post_init_fns
+        ),
+    )
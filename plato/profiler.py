@@ -0,0 +1,147 @@
+"""Profiler reporting where the time is spent when sampling.
+
+The `SamplingProfiler` is a `.SamplingHook` aggregating the call counts, total
+time, and self time (i.e., excluding the time of nested fields and providers)
+per `.formclass`, per `.formclass` field, and per `.Provider` class::
+
+    from plato.profiler import SamplingProfiler
+
+    with SamplingProfiler() as profiler:
+        sample_many(Order(), 100)
+    profiler.print_report(limit=10)
+
+Note that the total time of a field or provider sampled recursively within
+itself counts the nested invocations multiple times.
+"""
+
+import sys
+from typing import Dict, List, Optional, TextIO, Tuple
+
+from .hooks import SamplingEvent, SamplingHook
+
+
+class ProfileStats:
+    """Aggregated timing of a formclass, field, or provider class."""
+
+    __slots__ = ("kind", "name", "calls", "total_time", "self_time")
+
+    kind: str
+    """One of ``"instance"``, ``"field"``, and ``"provider"``."""
+
+    name: str
+    """Qualified name of the formclass, the field (``"FormClass.field"``), or
+    the provider class."""
+
+    calls: int
+    """Number of invocations."""
+
+    total_time: float
+    """Accumulated time in seconds of all invocations."""
+
+    self_time: float
+    """Accumulated time in seconds of all invocations, excluding the time spent
+    in nested fields and providers."""
+
+    def __init__(self, kind: str, name: str):
+        self.kind = kind
+        self.name = name
+        self.calls = 0
+        self.total_time = 0.0
+        self.self_time = 0.0
+
+
+class SamplingProfiler(SamplingHook):
+    """Sampling hook aggregating the timing of formclasses, fields, and providers.
+
+    Use the profiler as a context manager to register it as hook for the
+    duration of the ``with`` block. Alternatively, register it with
+    `.add_hook`.
+    """
+
+    _SORT_KEYS = ("calls", "total_time", "self_time")
+
+    def __init__(self) -> None:
+        self.stats: Dict[Tuple[str, str], ProfileStats] = {}
+        """Aggregated timings by kind and name."""
+        self._nested_times: List[float] = []
+
+    def before(self, event: SamplingEvent) -> None:
+        self._nested_times.append(0.0)
+
+    def after(self, event: SamplingEvent, elapsed: float) -> None:
+        nested_time = self._nested_times.pop()
+        if self._nested_times:
+            self._nested_times[-1] += elapsed
+
+        if event.provider is not None:
+            key = ("provider", type(event.provider).__qualname__)
+        elif event.field_name is None:
+            key = ("instance", getattr(event.form_class, "__qualname__", ""))
+        else:
+            form_class_name = getattr(event.form_class, "__qualname__", "")
+            key = ("field", f"{form_class_name}.{event.field_name}")
+
+        stats = self.stats.get(key, None)
+        if stats is None:
+            stats = ProfileStats(*key)
+            self.stats[key] = stats
+        stats.calls += 1
+        stats.total_time += elapsed
+        stats.self_time += elapsed - nested_time
+
+    def report(self, sort_by: str = "self_time", limit: Optional[int] = None) -> str:
+        """Create a report of the aggregated timings.
+
+        Arguments
+        ---------
+        sort_by
+            Attribute of `ProfileStats` to sort the entries by in descending
+            order. One of ``"calls"``, ``"total_time"``, and ``"self_time"``.
+        limit
+            Maximum number of entries to include.
+
+        Returns
+        -------
+        str
+            The report as a table.
+
+        Raises
+        ------
+        ValueError
+            If *sort_by* is not a valid attribute to sort by.
+        """
+        if sort_by not in self._SORT_KEYS:
+            raise ValueError(f"sort_by must be one of {', '.join(self._SORT_KEYS)}.")
+
+        entries = sorted(
+            self.stats.values(),
+            key=lambda stats: getattr(stats, sort_by),
+            reverse=True,
+        )[:limit]
+        lines = [f"{'calls':>10} {'total [s]':>12} {'self [s]':>12}  kind      name"]
+        lines.extend(
+            f"{stats.calls:>10} {stats.total_time:>12.6f} {stats.self_time:>12.6f}"
+            f"  {stats.kind:<8}  {stats.name}"
+            for stats in entries
+        )
+        return "\n".join(lines)
+
+    def print_report(
+        self,
+        sort_by: str = "self_time",
+        limit: Optional[int] = None,
+        file: Optional[TextIO] = None,
+    ) -> None:
+        """Print a report of the aggregated timings.
+
+        Arguments
+        ---------
+        sort_by
+            Attribute of `ProfileStats` to sort the entries by in descending
+            order. One of ``"calls"``, ``"total_time"``, and ``"self_time"``.
+        limit
+            Maximum number of entries to include.
+        file
+            File to print to. Defaults to `sys.stdout`.
+        """
+        print(self.report(sort_by, limit), file=file or sys.stdout)
@@ -11,7 +11,7 @@ providers. Otherwise, you probably will not need them.
 """
 
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Generic, List, Sequence, TypeVar
 
 from typing_extensions import Protocol
 
@@ -51,10 +51,39 @@ class ProviderProtocol(Protocol[T]):
 class Provider(ABC, Generic[T], ProviderProtocol[T]):
     """Provider interface."""
 
+    shares_values: bool = False
+    """Whether the provider stores sampled values in the `.Context.meta` of the
+    parent context to reuse them across the fields of a `.formclass` instance
+    (like `~plato.providers.common.Shared`). Fields using the same instance of
+    such a provider are resampled together by `~plato.resampling.resample`,
+    and lazy sampling samples the preceding fields using it first.
+    """
+
     @abstractmethod
     def sample(self, context: Context) -> T:
         ...
 
+    def sample_batch(self, contexts: Sequence[Context]) -> List[T]:
+        """Return a sample for each of the given contexts.
+
+        This method is used when generating many samples at once (e.g., with
+        `~plato.batch.sample_many`). The default implementation invokes
+        `.sample` for each context. Override it if values can be generated more
+        efficiently in one go, but ensure that each value is the same as the one
+        that would be returned by `.sample` for the respective context.
+
+        Arguments
+        ---------
+        contexts
+            The sampling contexts.
+
+        Returns
+        -------
+        List[T]
+            The sampled values in the order of the *contexts*.
+        """
+        return [self.sample(context) for context in contexts]
+
 
 class WithAttributeAccess(Generic[T]):
     """Provider mixin to provide transparent access to attributes.
@@ -62,8 +91,8 @@ class WithAttributeAccess(Generic[T]):
     Attributes existing on the implementing class and special members starting and
     ending with a double-underscore (``__``) are excluded.
 
-    Example
-    -------
+    Examples
+    --------
 
     .. testcode:: WithAttributeAccess
 
@@ -110,3 +139,12 @@ class AttributeProvider(Provider[T], WithAttributeAccess):
 
     def sample(self, context: Context) -> T:
         return getattr(self.parent.sample(context), self.attr_name)
+
+    def sample_batch(self, contexts: Sequence[Context]) -> List[T]:
+        if isinstance(self.parent, Provider):
+            parent_samples = self.parent.sample_batch(contexts)
+        else:
+            parent_samples = [self.parent.sample(context) for context in contexts]
+        return [
+            getattr(parent_sample, self.attr_name) for parent_sample in parent_samples
+        ]
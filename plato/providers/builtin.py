@@ -0,0 +1,422 @@
+"""Providers for common primitive values without any external dependency.
+
+In contrast to the providers from `plato.providers.faker`, these providers
+derive their values directly from the context seed. Instead of seeding
+a :class:`random.Random` instance (which is relatively costly) for each
+sampled value, a lightweight random number generator hashing the seed is used.
+Thus, these providers are considerably faster and suited to generate large
+amounts of test data.
+
+.. testsetup:: *
+
+    import plato
+    from plato import formclass, sample
+    from plato.providers.builtin import Bothify, IntRange
+
+    plato.seed(0)
+
+Examples
+--------
+
+.. testcode:: builtin
+
+    @formclass
+    class Product:
+        product_number: str = Bothify("?????-###")
+        quantity: int = IntRange(1, 10)
+
+    print(sample(Product()))
+
+.. testoutput:: builtin
+
+    Product(product_number='MyLcX-100', quantity=3)
+"""
+
+import string
+import uuid
+from abc import abstractmethod
+from bisect import bisect
+from datetime import date, datetime, timedelta
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal
+from hashlib import blake2b
+from itertools import accumulate
+from typing import Any, List, Mapping, Optional, Sequence, Tuple, TypeVar, Union
+
+from ..context import Context
+from .base import Provider
+
+T = TypeVar("T")
+
+
+class _SeedRandom:
+    """Random number generator deriving its random bits from hashing a seed.
+
+    Provides a subset of the :class:`random.Random` API, but avoids the costly
+    initialization of the Mersenne Twister state.
+    """
+
+    __slots__ = ("_key", "_counter", "_pool", "_pool_bits")
+
+    def __init__(self, seed: bytes):
+        if len(seed) > blake2b.MAX_KEY_SIZE:  # pylint: disable=no-member
+            seed = blake2b(seed).digest()
+        self._key = seed
+        self._counter = 0
+        self._pool = 0
+        self._pool_bits = 0
+
+    def getrandbits(self, k: int) -> int:
+        while self._pool_bits < k:
+            block = blake2b(self._counter.to_bytes(8, "little"), key=self._key)
+            self._pool |= int.from_bytes(block.digest(), "little") << self._pool_bits
+            self._pool_bits += 8 * block.digest_size
+            self._counter += 1
+        bits = self._pool & ((1 << k) - 1)
+        self._pool >>= k
+        self._pool_bits -= k
+        return bits
+
+    def random(self) -> float:
+        return self.getrandbits(53) * 2.0 ** -53
+
+    def randbelow(self, stop: int) -> int:
+        k = stop.bit_length()
+        value = self.getrandbits(k)
+        while value >= stop:
+            value = self.getrandbits(k)
+        return value
+
+    def randint(self, low: int, high: int) -> int:
+        return low + self.randbelow(high - low + 1)
+
+    def uniform(self, low: float, high: float) -> float:
+        return low + (high - low) * self.random()
+
+    def choice(self, seq: Sequence[T]) -> T:
+        return seq[self.randbelow(len(seq))]
+
+    def weighted_choice(self, seq: Sequence[T], cum_weights: Sequence[float]) -> T:
+        return seq[bisect(cum_weights, self.random() * cum_weights[-1])]
+
+    def sample(self, population: Sequence[T], k: int) -> List[T]:
+        pool = list(population)
+        size = len(pool)
+        for i in range(k):
+            j = i + self.randbelow(size - i)
+            pool[i], pool[j] = pool[j], pool[i]
+        return pool[:k]
+
+
+class _SeedRandomProvider(Provider[T]):
+    def sample(self, context: Context) -> T:
+        return self._generate(_SeedRandom(context.seed))
+
+    def sample_batch(self, contexts: Sequence[Context]) -> List[T]:
+        generate = self._generate
+        return [generate(_SeedRandom(context.seed)) for context in contexts]
+
+    @abstractmethod
+    def _generate(self, rng: _SeedRandom) -> T:
+        ...
+
+
+class IntRange(_SeedRandomProvider[int]):
+    """Provides integers from a range including both end points.
+
+    Arguments
+    ---------
+    min_value
+        Minimum value to generate.
+    max_value
+        Maximum value to generate.
+    """
+
+    def __init__(self, min_value: int, max_value: int):
+        if min_value > max_value:
+            raise ValueError("min_value must not be larger than max_value.")
+        self.min_value = min_value
+        self.max_value = max_value
+
+    def _generate(self, rng: _SeedRandom) -> int:
+        return rng.randint(self.min_value, self.max_value)
+
+
+class FloatRange(_SeedRandomProvider[float]):
+    """Provides uniformly distributed floats from a range.
+
+    Arguments
+    ---------
+    min_value
+        Minimum value to generate.
+    max_value
+        Maximum value to generate.
+    """
+
+    def __init__(self, min_value: float, max_value: float):
+        if min_value > max_value:
+            raise ValueError("min_value must not be larger than max_value.")
+        self.min_value = min_value
+        self.max_value = max_value
+
+    def _generate(self, rng: _SeedRandom) -> float:
+        return rng.uniform(self.min_value, self.max_value)
+
+
+class DecimalRange(_SeedRandomProvider[Decimal]):
+    """Provides decimals with a fixed number of places from a range.
+
+    Bounds with more decimal places than *places* are rounded into the range,
+    i.e. the generated values never exceed the bounds.
+
+    Arguments
+    ---------
+    min_value
+        Minimum value to generate.
+    max_value
+        Maximum value to generate.
+    places
+        Number of decimal places of the generated values.
+    """
+
+    def __init__(
+        self,
+        min_value: Union[int, Decimal],
+        max_value: Union[int, Decimal],
+        places: int = 2,
+    ):
+        if min_value > max_value:
+            raise ValueError("min_value must not be larger than max_value.")
+        self.min_value = Decimal(min_value)
+        self.max_value = Decimal(max_value)
+        self.places = places
+        self._min_units = int(
+            self.min_value.scaleb(places).to_integral_value(rounding=ROUND_CEILING)
+        )
+        self._max_units = int(
+            self.max_value.scaleb(places).to_integral_value(rounding=ROUND_FLOOR)
+        )
+        if self._min_units > self._max_units:
+            raise ValueError("The range contains no value with the given places.")
+
+    def _generate(self, rng: _SeedRandom) -> Decimal:
+        return Decimal(rng.randint(self._min_units, self._max_units)).scaleb(
+            -self.places
+        )
+
+
+class Bool(_SeedRandomProvider[bool]):
+    """Provides booleans.
+
+    Arguments
+    ---------
+    probability
+        Probability of generating `True`.
+    """
+
+    def __init__(self, probability: float = 0.5):
+        if not 0.0 <= probability <= 1.0:
+            raise ValueError("probability must be within [0, 1].")
+        self.probability = probability
+
+    def _generate(self, rng: _SeedRandom) -> bool:
+        return rng.random() < self.probability
+
+
+def _check_choice_arguments(
+    elements: Sequence[Any], weights: Optional[Sequence[float]]
+) -> None:
+    if len(elements) == 0:
+        raise ValueError("elements must not be empty.")
+    if weights is not None and len(weights) != len(elements):
+        raise ValueError("weights must have the same length as elements.")
+
+
+class Choice(_SeedRandomProvider[T]):
+    """Provides a random element from a sequence.
+
+    Arguments
+    ---------
+    elements
+        Sequence to choose elements from.
+    weights
+        Relative weights of the *elements*. If not given, all elements are
+        equally likely.
+    """
+
+    def __init__(
+        self, elements: Sequence[T], weights: Optional[Sequence[float]] = None
+    ):
+        _check_choice_arguments(elements, weights)
+        self.elements = elements
+        self.weights = weights
+        self._cum_weights = None if weights is None else list(accumulate(weights))
+
+    def _generate(self, rng: _SeedRandom) -> T:
+        if self._cum_weights is None:
+            return rng.choice(self.elements)
+        return rng.weighted_choice(self.elements, self._cum_weights)
+
+
+class Sample(_SeedRandomProvider[List[T]]):
+    """Provides a list of *k* unique elements from a population sequence.
+
+    Arguments
+    ---------
+    population
+        Sequence to choose elements from.
+    k
+        Number of elements to choose.
+    """
+
+    def __init__(self, population: Sequence[T], k: int):
+        if not 0 <= k <= len(population):
+            raise ValueError("k must be within [0, len(population)].")
+        self.population = population
+        self.k = k
+
+    def _generate(self, rng: _SeedRandom) -> List[T]:
+        return rng.sample(self.population, self.k)
+
+
+_NUMERIFY_PLACEHOLDERS = {
+    "#": tuple(string.digits),
+    "%": tuple(string.digits[1:]),
+    "!": ("",) + tuple(string.digits),
+    "@": ("",) + tuple(string.digits[1:]),
+}
+
+
+class _Pattern:
+    """Pattern with placeholders replaced by randomly chosen strings."""
+
+    __slots__ = ("_parts", "_combinations")
+
+    def __init__(self, pattern: str, placeholders: Mapping[str, Tuple[str, ...]]):
+        self._parts: List[Union[str, Tuple[str, ...]]] = []
+        self._combinations = 1
+        for char in pattern:
+            if char in placeholders:
+                self._parts.append(placeholders[char])
+                self._combinations *= len(placeholders[char])
+            elif self._parts and isinstance(self._parts[-1], str):
+                self._parts[-1] += char
+            else:
+                self._parts.append(char)
+
+    def generate(self, rng: _SeedRandom) -> str:
+        # Draw a single number for all placeholders and decompose it with
+        # mixed radices, which is uniform and much cheaper than a draw for
+        # each placeholder.
+        remaining = rng.randbelow(self._combinations)
+        result = []
+        for part in self._parts:
+            if isinstance(part, str):
+                result.append(part)
+            else:
+                remaining, index = divmod(remaining, len(part))
+                result.append(part[index])
+        return "".join(result)
+
+
+class Numerify(_SeedRandomProvider[str]):
+    """Provides strings by replacing placeholders in a pattern with digits.
+
+    The placeholders are the same as in Faker's ``numerify``:
+
+    * ``#``: a digit from 0 to 9,
+    * ``%``: a digit from 1 to 9,
+    * ``!``: a digit from 0 to 9 or an empty string,
+    * ``@``: a digit from 1 to 9 or an empty string.
+
+    Arguments
+    ---------
+    pattern
+        Pattern to replace placeholders in.
+    """
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self._pattern = _Pattern(pattern, _NUMERIFY_PLACEHOLDERS)
+
+    def _generate(self, rng: _SeedRandom) -> str:
+        return self._pattern.generate(rng)
+
+
+class Bothify(_SeedRandomProvider[str]):
+    """Provides strings by replacing placeholders with digits and letters.
+
+    In addition to the placeholders of `Numerify`, ``?`` will be replaced with
+    a letter.
+
+    Arguments
+    ---------
+    pattern
+        Pattern to replace placeholders in.
+    letters
+        Letters to choose from for ``?`` placeholders.
+    """
+
+    def __init__(self, pattern: str, letters: str = string.ascii_letters):
+        if len(letters) == 0:
+            raise ValueError("letters must not be empty.")
+        placeholders = dict(_NUMERIFY_PLACEHOLDERS)
+        placeholders["?"] = tuple(letters)
+        self.pattern = pattern
+        self.letters = letters
+        self._pattern = _Pattern(pattern, placeholders)
+
+    def _generate(self, rng: _SeedRandom) -> str:
+        return self._pattern.generate(rng)
+
+
+class UUID4(_SeedRandomProvider[uuid.UUID]):
+    """Provides random (version 4) UUIDs."""
+
+    def _generate(self, rng: _SeedRandom) -> uuid.UUID:
+        return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+class DateRange(_SeedRandomProvider[date]):
+    """Provides dates from a range including both end points.
+
+    Arguments
+    ---------
+    start
+        Earliest date to generate.
+    end
+        Latest date to generate.
+    """
+
+    def __init__(self, start: date, end: date):
+        if start > end:
+            raise ValueError("start must not be after end.")
+        self.start = start
+        self.end = end
+
+    def _generate(self, rng: _SeedRandom) -> date:
+        days = rng.randint(0, (self.end - self.start).days)
+        return self.start + timedelta(days=days)
+
+
+class DatetimeRange(_SeedRandomProvider[datetime]):
+    """Provides datetimes from a range including both end points.
+
+    The generated datetimes have a resolution of one microsecond.
+
+    Arguments
+    ---------
+    start
+        Earliest datetime to generate.
+    end
+        Latest datetime to generate.
+    """
+
+    def __init__(self, start: datetime, end: datetime):
+        if start > end:
+            raise ValueError("start must not be after end.")
+        self.start = start
+        self.end = end
+        self._range_us = (end - start) // timedelta(microseconds=1)
+
+    def _generate(self, rng: _SeedRandom) -> datetime:
+        return self.start + timedelta(microseconds=rng.randint(0, self._range_us))
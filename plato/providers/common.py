@@ -1,7 +1,9 @@
 """Commonly used providers."""
 
-from typing import TypeVar
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Sequence, TypeVar, cast
 
+from ..batch import sample_batch
 from ..context import Context
 from ..formclasses import sample
 from .base import Provider, WithAttributeAccess
@@ -87,6 +89,8 @@ class Shared(Provider[T], WithAttributeAccess[T]):
 
     """
 
+    shares_values = True
+
     def __init__(self, provider: Provider[T]):
         self.provider = provider
 
@@ -98,3 +102,157 @@ class Shared(Provider[T], WithAttributeAccess[T]):
             context.parent.meta[self] = sample(self.provider, context)
 
         return context.parent.meta[self]
+
+    def sample_batch(self, contexts: Sequence[Context]) -> List[T]:
+        pending: Dict[int, Context] = {}
+        for context in contexts:
+            if context.parent is None:
+                raise ValueError("Subcontext with set parent required.")
+            if self not in context.parent.meta:
+                pending.setdefault(id(context.parent), context)
+
+        pending_contexts = list(pending.values())
+        for context, value in zip(
+            pending_contexts, sample_batch(self.provider, pending_contexts)
+        ):
+            context.parent.meta[self] = value  # type: ignore[union-attr]
+
+        return [context.parent.meta[self] for context in contexts]  # type: ignore
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a `Cached` provider."""
+
+    hits: int
+    """Number of values returned from the cache."""
+
+    misses: int
+    """Number of values sampled from the wrapped provider."""
+
+    maxsize: Optional[int]
+    """Maximum number of cached values or `None` if unbounded."""
+
+    currsize: int
+    """Current number of cached values."""
+
+
+class Cached(Provider[T]):
+    """Memoize the sampled values of a Provider by the context seed.
+
+    Providers are expected to be deterministic in the seed of the passed
+    context. Thus, a provider that is expensive to sample (e.g., because it
+    parses templates or reads reference data) can be wrapped with *Cached* to
+    skip the work when the same seeds are sampled repeatedly, e.g., when tests
+    sample the same fixtures again.
+
+    Each *Cached* instance has its own cache, i.e., the cached values are keyed
+    by the wrapped provider and the context seed. The least recently used
+    values are evicted once more than *maxsize* values are cached. Note that
+    the same object is returned for cache hits, so it must not be modified.
+
+    Arguments
+    ---------
+    provider
+        Provider to memoize the sampled values of.
+    maxsize
+        Maximum number of values to cache. If `None`, the cache is unbounded.
+
+    Examples
+    --------
+
+    .. testsetup:: Cached
+
+        import plato
+        from plato import formclass, sample
+        from plato.context import Context
+        from plato.providers.base import Provider
+        from plato.providers.common import Cached
+
+    .. testcode:: Cached
+
+        class ExpensiveProvider(Provider):
+            def sample(self, context: Context) -> int:
+                return context.rng.randint(0, 100)
+
+        @formclass
+        class MyFormclass:
+            value: int = Cached(ExpensiveProvider(), maxsize=1024)
+
+        plato.seed(0)
+        first = sample(MyFormclass())
+        plato.seed(0)  # Start over with the same seeds.
+        assert sample(MyFormclass()) == first
+        print(MyFormclass.value.cache_info())
+
+    .. testoutput:: Cached
+
+        CacheInfo(hits=1, misses=1, maxsize=1024, currsize=1)
+
+    """
+
+    def __init__(self, provider: Provider[T], maxsize: Optional[int] = 128):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must not be negative.")
+        self.provider = provider
+        self.maxsize = maxsize
+        self._cache: "OrderedDict[bytes, T]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def sample(self, context: Context) -> T:
+        key = context.seed
+        if key in self._cache:
+            self._hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        self._misses += 1
+        value = cast(T, sample(self.provider, context))
+        self._store(key, value)
+        return value
+
+    def sample_batch(self, contexts: Sequence[Context]) -> List[T]:
+        values: Dict[bytes, T] = {}
+        pending: Dict[bytes, Context] = {}
+        for context in contexts:
+            key = context.seed
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                values[key] = self._cache[key]
+            elif key not in pending:
+                pending[key] = context
+
+        pending_values = cast(
+            List[T], sample_batch(self.provider, list(pending.values()))
+        )
+        for key, value in zip(pending.keys(), pending_values):
+            values[key] = value
+            self._store(key, value)
+
+        self._misses += len(pending)
+        self._hits += len(contexts) - len(pending)
+        return [values[context.seed] for context in contexts]
+
+    def cache_info(self) -> CacheInfo:
+        """Return statistics of the cache.
+
+        Returns
+        -------
+        CacheInfo
+            The number of hits and misses, the maximum size, and the current
+            size of the cache.
+        """
+        return CacheInfo(self._hits, self._misses, self.maxsize, len(self._cache))
+
+    def cache_clear(self) -> None:
+        """Clear the cache and its statistics."""
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def _store(self, key: bytes, value: T) -> None:
+        if self.maxsize is not None and len(self._cache) >= self.maxsize:
+            if self.maxsize == 0:
+                return
+            self._cache.popitem(last=False)
+        self._cache[key] = value
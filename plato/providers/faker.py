@@ -2,10 +2,11 @@
 library with Plato.
 """
 
-from functools import partial
-from typing import Any, Callable
+from decimal import Decimal
+from itertools import chain
+from typing import Any, Callable, Dict, Hashable, Tuple
 
-from faker import Faker  # type: ignore
+from faker import Faker, Generator  # type: ignore
 
 from ..context import Context
 from .base import Provider
@@ -18,14 +19,20 @@ class FromFaker:
     :doc:`Faker <fakerclass>` instance, but return `.Provider` instances usable
     in a `.formclass`.
 
+    The results of indexing operations are cached. The same applies to
+    attribute access if the :doc:`Faker <fakerclass>` instance uses a single
+    locale (with multiple locales, Faker selects a random locale on each
+    attribute access). Invocations of a method with identical arguments of
+    basic immutable types return the same `.Provider` instance.
+
     Arguments
     ---------
     faker:
         Faker instance used to generate values. If not given a new instance
         using the default will be created.
 
-    Example
-    -------
+    Examples
+    --------
 
     .. testsetup:: FromFaker
 
@@ -54,14 +61,59 @@ class FromFaker:
         if faker is None:
             faker = Faker()
         self.faker = faker
+        self._locale_proxies: Dict[str, FromFaker] = {}
+        self._cache_attributes = isinstance(faker, Generator) or (
+            len(getattr(faker, "factories", ())) == 1
+        )
 
     def __getattr__(self, name: str) -> Any:
-        if name.startswith("__") and name.endswith("__"):
-            raise AttributeError
-        return partial(_FakerMethodProvider, self.faker, getattr(self.faker, name))
+        if name.startswith("_"):
+            raise AttributeError(name)
+        provider_factory = _FakerMethodProviderFactory(
+            self.faker, getattr(self.faker, name)
+        )
+        if self._cache_attributes:
+            setattr(self, name, provider_factory)
+        return provider_factory
 
     def __getitem__(self, key: str) -> "FromFaker":
-        return FromFaker(self.faker[key])
+        if key not in self._locale_proxies:
+            self._locale_proxies[key] = FromFaker(self.faker[key])
+        return self._locale_proxies[key]
+
+
+_CACHEABLE_ARG_TYPES = (type(None), bool, int, float, complex, str, bytes, Decimal)
+
+
+class _FakerMethodProviderFactory:
+    def __init__(self, faker: Faker, method: Callable[..., Any]) -> None:
+        self.faker = faker
+        self.method = method
+        self._providers: Dict[Hashable, _FakerMethodProvider] = {}
+
+    def __call__(self, *args: Any, **kwargs: Any) -> "_FakerMethodProvider":
+        key = self._cache_key(args, kwargs)
+        if key is None:
+            return _FakerMethodProvider(self.faker, self.method, *args, **kwargs)
+        if key not in self._providers:
+            self._providers[key] = _FakerMethodProvider(
+                self.faker, self.method, *args, **kwargs
+            )
+        return self._providers[key]
+
+    @staticmethod
+    def _cache_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+        for value in chain(args, kwargs.values()):
+            if type(value) not in _CACHEABLE_ARG_TYPES:
+                return None
+        # Including the types prevents sharing providers for arguments that
+        # are equal, but of different type (e.g., 1 and 1.0).
+        return (
+            args,
+            tuple(map(type, args)),
+            tuple(kwargs.items()),
+            tuple(map(type, kwargs.values())),
+        )
 
 
 class _FakerMethodProvider(Provider[Any]):
@@ -72,7 +124,38 @@ class _FakerMethodProvider(Provider[Any]):
         self.method = method
         self.args = args
         self.kwargs = kwargs
+        self._seedable = _get_seedable_generator(faker, method)
 
     def sample(self, context: Context) -> Any:
-        self.faker.seed_instance(context.seed)
+        self._seedable.seed_instance(context.seed)
         return self.method(*self.args, **self.kwargs)
+
+
+def _get_seedable_generator(faker: Faker, method: Callable[..., Any]) -> Any:
+    """Get the generator that needs to be seeded to make *method* deterministic.
+
+    Faker methods are bound to a provider that draws random numbers from the
+    generator of a single locale. Seeding only that generator is equivalent to
+    seeding the *faker* instance, but avoids seeding the generators of all other
+    locales. If the generator cannot be determined, the *faker* instance itself
+    is returned.
+
+    Arguments
+    ---------
+    faker
+        The Faker instance *method* belongs to.
+    method
+        A method of the *faker* instance or of one of its providers.
+
+    Returns
+    -------
+    Any
+        The generator or the *faker* instance to seed.
+    """
+    owner = getattr(method, "__self__", None)
+    if isinstance(owner, Generator):
+        return owner
+    generator = getattr(owner, "generator", None)
+    if isinstance(generator, Generator):
+        return generator
+    return faker
@@ -0,0 +1,295 @@
+"""Providers generating values in bulk with NumPy.
+
+This module requires the optional `NumPy <https://numpy.org>`_ dependency
+which can be installed with the ``numpy`` extra of Plato::
+
+    pip install plato[numpy]
+
+When sampling a batch of values, e.g., with `plato.sample_many`, these providers
+generate all values with a few vectorized NumPy operations. Each value is
+derived from the seed of its own context only by hashing the seed with
+a counter (SplitMix64) and transforming the resulting uniformly distributed
+numbers (e.g., by the inverse of the cumulative distribution function). Thus,
+a value does not depend on the other contexts in the batch, and sampling one
+instance at a time or with multiple workers gives the same values.
+
+.. testsetup:: *
+    :skipif: not numpy_available
+
+    import plato
+    from plato import formclass, sample_many
+    from plato.providers.numpy import Categorical, Code, Normal, Poisson
+
+    plato.seed(0)
+
+Examples
+--------
+
+.. testcode:: numpy
+    :skipif: not numpy_available
+
+    @formclass
+    class Measurement:
+        sensor: str = Code(4)
+        unit: str = Categorical(["mm", "cm", "m"], weights=[0.5, 0.3, 0.2])
+        value: float = Normal(10.0, 2.0)
+        count: int = Poisson(3.0)
+
+    for measurement in sample_many(Measurement(), 2):
+        print(measurement)
+
+.. testoutput:: numpy
+    :skipif: not numpy_available
+
+    Measurement(sensor='NOAV', unit='mm', value=12.537936788569587, count=3)
+    Measurement(sensor='HMAO', unit='cm', value=10.72474713343552, count=2)
+"""
+
+import string
+from abc import abstractmethod
+from typing import Any, List, Optional, Sequence, Tuple, TypeVar
+
+from ..context import Context
+from .base import Provider
+from .builtin import _check_choice_arguments
+
+try:
+    import numpy as np
+except ImportError as err:  # pragma: no cover
+    raise ImportError(
+        "The plato.providers.numpy module requires NumPy. "
+        "Install it with 'pip install plato[numpy]'."
+    ) from err
+
+T = TypeVar("T")
+
+_SPLITMIX64_GAMMA = 0x9E3779B97F4A7C15
+_SPLITMIX64_MUL1 = 0xBF58476D1CE4E5B9
+_SPLITMIX64_MUL2 = 0x94D049BB133111EB
+
+
+def _uniforms(contexts: Sequence[Context], count: int) -> Any:
+    """Returns *count* floats from [0, 1) per context derived from the context seed.
+
+    The floats are obtained by hashing the seed of each context with
+    a counter. Hence, they only depend on the seed of the respective context.
+
+    Arguments
+    ---------
+    contexts
+        The contexts to derive the floats from.
+    count
+        Number of floats per context.
+
+    Returns
+    -------
+    An array of the floats with one row per context.
+    """
+    keys = np.frombuffer(
+        b"".join(context.seed[:8].ljust(8, b"\0") for context in contexts),
+        dtype="<u8",
+    )
+    counters = np.arange(1, count + 1, dtype=np.uint64) * np.uint64(_SPLITMIX64_GAMMA)
+    state = keys[:, np.newaxis] + counters[np.newaxis, :]
+    state = (state ^ (state >> np.uint64(30))) * np.uint64(_SPLITMIX64_MUL1)
+    state = (state ^ (state >> np.uint64(27))) * np.uint64(_SPLITMIX64_MUL2)
+    state ^= state >> np.uint64(31)
+    return (state >> np.uint64(11)) * (1.0 / (1 << 53))
+
+
+class _NumpyProvider(Provider[T]):
+    _uniforms_per_value = 1
+
+    def sample(self, context: Context) -> T:
+        return self._generate(_uniforms((context,), self._uniforms_per_value))[0]
+
+    def sample_batch(self, contexts: Sequence[Context]) -> List[T]:
+        if len(contexts) == 0:
+            return []
+        return self._generate(_uniforms(contexts, self._uniforms_per_value))
+
+    @abstractmethod
+    def _generate(self, uniforms: Any) -> List[T]:
+        """Generates one value per row of an array of uniform floats."""
+
+
+class Uniform(_NumpyProvider[float]):
+    """Provides uniformly distributed floats from the interval [low, high).
+
+    Arguments
+    ---------
+    low
+        Lower bound of the interval.
+    high
+        Upper bound of the interval.
+    """
+
+    def __init__(self, low: float = 0.0, high: float = 1.0):
+        if low > high:
+            raise ValueError("low must not be larger than high.")
+        self.low = low
+        self.high = high
+
+    def _generate(self, uniforms: Any) -> List[float]:
+        return (self.low + (self.high - self.low) * uniforms[:, 0]).tolist()
+
+
+class Normal(_NumpyProvider[float]):
+    """Provides normally distributed floats.
+
+    Arguments
+    ---------
+    mean
+        Mean of the distribution.
+    std
+        Standard deviation of the distribution.
+    """
+
+    def __init__(self, mean: float = 0.0, std: float = 1.0):
+        if std < 0.0:
+            raise ValueError("std must not be negative.")
+        self.mean = mean
+        self.std = std
+
+    _uniforms_per_value = 2
+
+    def _generate(self, uniforms: Any) -> List[float]:
+        return (self.mean + self.std * _standard_normal(uniforms)).tolist()
+
+
+class LogNormal(_NumpyProvider[float]):
+    """Provides log-normally distributed floats.
+
+    Arguments
+    ---------
+    mean
+        Mean of the underlying normal distribution.
+    sigma
+        Standard deviation of the underlying normal distribution.
+    """
+
+    def __init__(self, mean: float = 0.0, sigma: float = 1.0):
+        if sigma < 0.0:
+            raise ValueError("sigma must not be negative.")
+        self.mean = mean
+        self.sigma = sigma
+
+    _uniforms_per_value = 2
+
+    def _generate(self, uniforms: Any) -> List[float]:
+        return np.exp(self.mean + self.sigma * _standard_normal(uniforms)).tolist()
+
+
+class Poisson(_NumpyProvider[int]):
+    """Provides Poisson distributed integers.
+
+    Arguments
+    ---------
+    lam
+        Expected number of events.
+    """
+
+    def __init__(self, lam: float = 1.0):
+        if lam < 0.0:
+            raise ValueError("lam must not be negative.")
+        self.lam = lam
+        self._min_value, self._cdf = _poisson_cdf(lam)
+
+    def _generate(self, uniforms: Any) -> List[int]:
+        indices = np.searchsorted(self._cdf, uniforms[:, 0], side="right")
+        return (self._min_value + np.minimum(indices, len(self._cdf) - 1)).tolist()
+
+
+class Categorical(_NumpyProvider[T]):
+    """Provides a random element from a sequence.
+
+    Arguments
+    ---------
+    elements
+        Sequence to choose elements from.
+    weights
+        Relative weights of the *elements*. If not given, all elements are
+        equally likely.
+    """
+
+    def __init__(
+        self, elements: Sequence[T], weights: Optional[Sequence[float]] = None
+    ):
+        _check_choice_arguments(elements, weights)
+        self._cum_weights: Any = None
+        if weights is not None:
+            self._cum_weights = np.cumsum(np.asarray(weights, dtype=float))
+        self.elements = elements
+        self.weights = weights
+
+    def _generate(self, uniforms: Any) -> List[T]:
+        elements = self.elements
+        if self._cum_weights is None:
+            indices = (uniforms[:, 0] * len(elements)).astype(np.intp)
+        else:
+            indices = np.searchsorted(
+                self._cum_weights,
+                uniforms[:, 0] * self._cum_weights[-1],
+                side="right",
+            )
+        indices = np.minimum(indices, len(elements) - 1)
+        return [elements[index] for index in indices.tolist()]
+
+
+class Code(_NumpyProvider[str]):
+    """Provides fixed-width strings of random characters.
+
+    Arguments
+    ---------
+    width
+        Number of random characters in each string.
+    alphabet
+        ASCII characters to choose from.
+    prefix
+        Static prefix prepended to each string.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        alphabet: str = string.ascii_uppercase,
+        prefix: str = "",
+    ):
+        if width < 1:
+            raise ValueError("width must be positive.")
+        if len(alphabet) == 0:
+            raise ValueError("alphabet must not be empty.")
+        self.width = width
+        self.alphabet = alphabet
+        self.prefix = prefix
+        self._table = np.frombuffer(alphabet.encode("ascii"), dtype=np.uint8)
+        self._uniforms_per_value = width
+
+    def _generate(self, uniforms: Any) -> List[str]:
+        indices = (uniforms * len(self._table)).astype(np.intp)
+        codes = self._table[indices].view(f"S{self.width}").ravel()
+        prefix = self.prefix
+        return [prefix + code.decode("ascii") for code in codes.tolist()]
+
+
+def _standard_normal(uniforms: Any) -> Any:
+    # Box-Muller transform of the first two uniform floats of each row.
+    radius = np.sqrt(-2.0 * np.log1p(-uniforms[:, 0]))
+    return radius * np.cos(2.0 * np.pi * uniforms[:, 1])
+
+
+def _poisson_cdf(lam: float) -> Tuple[int, Any]:
+    # Returns the smallest value covered and the normalized CDF of the values
+    # within about ten standard deviations of the mean. The values outside have
+    # a probability that cannot be distinguished from zero by the uniform
+    # floats with 53 bit precision.
+    if lam == 0.0:
+        return 0, np.ones(1)
+    spread = 10.0 * np.sqrt(lam) + 20.0
+    min_value = max(0, int(lam - spread))
+    ks = np.arange(min_value + 1, int(lam + spread))
+    # Logarithms of the probabilities relative to the one of min_value from
+    # the ratio lam / k of consecutive probabilities.
+    log_pmf = np.concatenate(([0.0], np.cumsum(np.log(lam) - np.log(ks))))
+    cdf = np.cumsum(np.exp(log_pmf - log_pmf.max()))
+    return min_value, cdf / cdf[-1]
@@ -0,0 +1,299 @@
+"""Generation of variants of samples with some fields sampled again.
+
+.. testsetup:: *
+
+    from plato import derivedfield, formclass, resample, sample
+    import plato.providers.faker
+
+    plato.seed(0)
+"""
+
+from dataclasses import MISSING, is_dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, TypeVar
+
+from .context import Context, create_root_context, get_root_context
+from .formclasses import _create_instance, _sample_derived_field, sample
+from .internal.lazy_sampling import get_reachable_shared_providers
+from .internal.output_class import get_form_class
+from .internal.sampling_plan import (
+    DerivedFieldPlan,
+    SamplingPlan,
+    get_init_vars,
+    get_sampling_plan,
+)
+from .providers.base import AttributeProvider, Provider
+
+T = TypeVar("T")
+
+
+def resample(
+    instance: T,
+    fields: Sequence[str],
+    seed: Optional[int] = None,
+    form: Any = None,
+) -> T:
+    """Generates a variant of a sample with only the given fields resampled.
+
+    The given fields are sampled again with a new seed. Fields of nested
+    `.formclass` instances can be given by their dotted path (e.g.,
+    ``"billing_address.city"``). Afterwards, the `.derivedfield` methods
+    depending on the resampled fields (i.e., declaring them or other
+    recomputed derived fields as arguments) are recomputed. Derived fields
+    without arguments are always recomputed as they might access any field.
+    Fields sharing a provider with a resampled field (e.g., `.Shared`) are
+    resampled as a whole as well to keep the shared values consistent.
+    All other values are shared with the original *instance* without copying
+    them.
+
+    Arguments
+    ---------
+    instance
+        An instance created by sampling a `.formclass` instance.
+    fields
+        Names or dotted paths of the fields to resample.
+    seed
+        Root seed to sample the fields with. The resampled values are the same
+        as the ones of a `~plato.formclasses.sample` invocation using this root
+        seed. If `None`, the next root seed of the `.formclass` is used (like
+        `~plato.formclasses.sample` does).
+    form
+        The `.formclass` instance the *instance* has been sampled from. Only
+        required if it does not use the default values of the resampled
+        fields or if recomputed derived fields depend on `InitVar` values.
+
+    Returns
+    -------
+    T
+        The variant of the *instance*.
+
+    Raises
+    ------
+    TypeError
+        If *instance* is not a dataclass instance.
+    ValueError
+        If a field does not exist or cannot be resampled without *form*.
+
+    Examples
+    --------
+
+    .. testcode:: resample
+
+        fake = plato.providers.faker.FromFaker()
+
+        @formclass
+        class Customer:
+            first_name: str = fake.first_name()
+            last_name: str = fake.last_name()
+
+            @derivedfield
+            def full_name(self, first_name, last_name) -> str:
+                return f"{first_name} {last_name}"
+
+        customer = sample(Customer())
+        variant = resample(customer, ["first_name"], seed=1)
+        print(customer)
+        print(variant)
+
+    .. testoutput:: resample
+
+        Customer(first_name='Denise', last_name='Wright', full_name='Denise Wright')
+        Customer(first_name='Melissa', last_name='Wright', full_name='Melissa Wright')
+
+    ..
+        # noqa: DAR402 ValueError
+    """
+
+    if not is_dataclass(instance) or isinstance(instance, type):
+        raise TypeError("A sampled formclass instance is required.")
+
+    form_class = get_form_class(type(instance))
+    if seed is None:
+        context = get_root_context(form_class)
+    else:
+        context = create_root_context(seed)
+    return _resample(instance, form_class, _group_field_paths(fields), form, context)
+
+
+def _group_field_paths(paths: Iterable[str]) -> Dict[str, List[str]]:
+    # Maps field names to the paths of the nested fields to resample. An empty
+    # list means the whole field is resampled.
+    grouped: Dict[str, List[str]] = {}
+    whole_fields = set()
+    for path in paths:
+        name, _, subpath = path.partition(".")
+        subpaths = grouped.setdefault(name, [])
+        if subpath:
+            subpaths.append(subpath)
+        else:
+            whole_fields.add(name)
+    for name in whole_fields:
+        grouped[name] = []
+    return grouped
+
+
+def _resample(
+    instance: T,
+    form_class: type,
+    paths: Dict[str, List[str]],
+    form: Any,
+    context: Context,
+) -> T:
+    plan = get_sampling_plan(form_class)
+    _check_fields_exist(form_class, plan, paths)
+    paths = _add_fields_with_same_provider(form_class, form, plan, paths)
+    init_vars = {} if form is None else get_init_vars(form, plan)
+    derived_fields = {
+        derived_field.name: derived_field
+        for derived_field in plan.derived_fields
+        if derived_field.name not in init_vars
+        and (form is None or getattr(form, derived_field.name) is None)
+    }
+    values = {name: getattr(instance, name) for name in plan.field_names}
+
+    # Sampled in declaration order such that providers like Shared reuse the
+    # value of the same field as in eager sampling.
+    for name in plan.field_names:
+        if name not in paths:
+            continue
+        subpaths = paths[name]
+        if name in derived_fields and not subpaths:
+            # Recomputed below.
+            continue
+        field_form = _get_field_form(form_class, form, name)
+        if subpaths:
+            if not is_dataclass(values[name]):
+                raise ValueError(f"Field {name} has no nested fields.")
+            values[name] = _resample(
+                values[name],
+                get_form_class(type(values[name])),
+                _group_field_paths(subpaths),
+                field_form if is_dataclass(field_form) else None,
+                context.subcontext(name),
+            )
+        else:
+            values[name] = sample(field_form, context.subcontext(name))
+
+    variant: Any = _create_instance(
+        form_class, plan, init_vars, [values[name] for name in plan.field_names]
+    )
+
+    changed = set(paths)
+    for derived_field in derived_fields.values():
+        if derived_field.name in paths and paths[derived_field.name]:
+            continue
+        # Derived fields without arguments might access any field via self.
+        if derived_field.name not in paths and (
+            not changed
+            or derived_field.arg_names
+            and changed.isdisjoint(derived_field.arg_names)
+        ):
+            continue
+        _check_init_vars_given(derived_field, plan, init_vars)
+        object.__setattr__(
+            variant,
+            derived_field.name,
+            _sample_derived_field(
+                variant,
+                derived_field,
+                init_vars,
+                context.subcontext(derived_field.name),
+            ),
+        )
+        changed.add(derived_field.name)
+
+    return variant
+
+
+def _check_fields_exist(
+    form_class: type, plan: SamplingPlan, paths: Dict[str, List[str]]
+) -> None:
+    unknown_fields = set(paths) - set(plan.field_names)
+    if unknown_fields:
+        raise ValueError(
+            f"{form_class.__qualname__} has no fields "
+            f"{', '.join(sorted(unknown_fields))}."
+        )
+
+
+def _check_init_vars_given(
+    derived_field: DerivedFieldPlan, plan: SamplingPlan, init_vars: Dict[str, Any]
+) -> None:
+    missing_init_vars = (set(derived_field.arg_names) & set(plan.init_var_names)) - set(
+        init_vars
+    )
+    if missing_init_vars:
+        raise ValueError(
+            f"Recomputing {derived_field.name} requires the InitVar values "
+            f"{', '.join(sorted(missing_init_vars))}. Pass the form."
+        )
+
+
+def _add_fields_with_same_provider(
+    form_class: type, form: Any, plan: SamplingPlan, paths: Dict[str, List[str]]
+) -> Dict[str, List[str]]:
+    # Providers like Shared reuse the value sampled for the first field using
+    # them in all subsequent fields reaching them (also via nested formclass
+    # instances and providers). To keep the values consistent, such a group
+    # of fields is resampled as a whole if any of its fields is resampled.
+    # Other providers sample each field independently, even if the same
+    # instance is used for multiple fields.
+    field_forms = {}
+    for name in plan.field_names:
+        try:
+            field_forms[name] = _get_field_form(form_class, form, name)
+        except ValueError:
+            field_forms[name] = None
+    root_providers = {
+        name: _get_root_provider(field_form) for name, field_form in field_forms.items()
+    }
+    shared_providers = {
+        name: get_reachable_shared_providers(field_form)
+        for name, field_form in field_forms.items()
+    }
+
+    groups = []
+    for i, name in enumerate(plan.field_names):
+        provider = root_providers[name]
+        if provider is None or not provider.shares_values:
+            continue
+        if any(
+            root_providers[other_name] is provider
+            for other_name in plan.field_names[:i]
+        ):
+            continue
+        group = [name] + [
+            other_name
+            for other_name in plan.field_names[i + 1 :]
+            if id(provider) in shared_providers[other_name]
+        ]
+        if len(group) > 1:
+            groups.append(group)
+
+    paths = dict(paths)
+    changed = True
+    while changed:
+        changed = False
+        for group in groups:
+            if any(name in paths for name in group) and any(
+                paths.get(name, None) != [] for name in group
+            ):
+                paths.update((name, []) for name in group)
+                changed = True
+    return paths
+
+
+def _get_root_provider(value: Any) -> Optional[Provider]:
+    while isinstance(value, AttributeProvider):
+        value = value.parent
+    return value if isinstance(value, Provider) else None
+
+
+def _get_field_form(form_class: type, form: Any, name: str) -> Any:
+    if form is not None:
+        return getattr(form, name)
+    field_def = getattr(form_class, "__dataclass_fields__")[name]
+    if field_def.default is not MISSING:
+        return field_def.default
+    if field_def.default_factory is not MISSING:
+        return field_def.default_factory()
+    raise ValueError(f"Field {name} has no default value to resample. Pass the form.")
@@ -0,0 +1,98 @@
+"""Tracer recording the timeline of sampling in the Chrome trace event format.
+
+The `ChromeTracer` is a `.SamplingHook` recording a span for each sampled
+`.formclass` instance, each field and derived field, and each `.Provider`
+invocation. The recorded spans can be written as JSON in the Chrome trace event
+format and opened with a trace viewer like `Perfetto <https://ui.perfetto.dev>`_
+or ``chrome://tracing`` to see where the time is spent in nested formclasses::
+
+    from plato.tracing import ChromeTracer
+
+    with ChromeTracer() as tracer:
+        sample_many(Order(), 10)
+    tracer.write("sampling-trace.json")
+
+Each span is named after the sampled formclass, field (``"FormClass.field"``),
+or provider class and has the context path (see `.Context.path`) of the
+sampled field as argument.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import IO, Any, Dict, List, Union
+
+from .hooks import SamplingEvent, SamplingHook
+
+
+class ChromeTracer(SamplingHook):
+    """Sampling hook recording spans in the Chrome trace event format.
+
+    Use the tracer as a context manager to register it as hook for the
+    duration of the ``with`` block. Alternatively, register it with
+    `.add_hook`.
+    """
+
+    def __init__(self) -> None:
+        self.trace_events: List[Dict[str, Any]] = []
+        """The recorded trace events."""
+        self._start_times: Dict[int, List[float]] = {}
+        self._pid = os.getpid()
+
+    def before(self, event: SamplingEvent) -> None:
+        thread_id = threading.get_ident()
+        self._start_times.setdefault(thread_id, []).append(time.perf_counter())
+
+    def after(self, event: SamplingEvent, elapsed: float) -> None:
+        thread_id = threading.get_ident()
+        start_time = self._start_times[thread_id].pop()
+
+        form_class_name = getattr(event.form_class, "__qualname__", "")
+        if event.provider is not None:
+            category = "provider"
+            name = type(event.provider).__qualname__
+        elif event.field_name is None:
+            category = "instance"
+            name = form_class_name
+        else:
+            category = "derivedfield" if event.derived else "field"
+            name = f"{form_class_name}.{event.field_name}"
+
+        self.trace_events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start_time * 1e6,
+                "dur": elapsed * 1e6,
+                "pid": self._pid,
+                "tid": thread_id,
+                "args": {"path": ".".join(event.context.path)},
+            }
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        """Return the recorded trace as JSON object.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The trace in the JSON object format of the Chrome trace event
+            format.
+        """
+        return {"traceEvents": self.trace_events, "displayTimeUnit": "ms"}
+
+    def write(self, file: Union[str, "os.PathLike[str]", IO[str]]) -> None:
+        """Write the recorded trace as JSON.
+
+        Arguments
+        ---------
+        file
+            Path or text file object to write the trace to.
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "w", encoding="utf-8") as stream:
+                json.dump(self.to_json(), stream)
+        else:
+            json.dump(self.to_json(), file)
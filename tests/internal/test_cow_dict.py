@@ -0,0 +1,51 @@
+import pytest
+
+from plato.internal.cow_dict import CopyOnWriteDict
+
+
+def test_dict_operations():
+    cow_dict = CopyOnWriteDict()
+
+    cow_dict["key"] = "value"
+    assert "key" in cow_dict
+    assert cow_dict["key"] == "value"
+    assert list(cow_dict) == ["key"]
+    assert len(cow_dict) == 1
+
+    del cow_dict["key"]
+    assert "key" not in cow_dict
+    with pytest.raises(KeyError):
+        cow_dict["key"]  # pylint: disable=pointless-statement
+
+
+def test_uses_passed_data_as_storage():
+    data = {}
+    cow_dict = CopyOnWriteDict(data)
+
+    cow_dict["key"] = "value"
+
+    assert data == {"key": "value"}
+
+
+def test_copy_is_independent_of_original():
+    original = CopyOnWriteDict({"shared": "value"})
+    copy = original.copy()
+
+    original["original"] = "value"
+    copy["copy"] = "value"
+    del copy["shared"]
+
+    assert dict(original) == {"shared": "value", "original": "value"}
+    assert dict(copy) == {"copy": "value"}
+
+
+def test_copies_of_copies_are_independent():
+    original = CopyOnWriteDict()
+    copies = [original.copy(), original.copy()]
+    copies.append(copies[0].copy())
+
+    for i, copy in enumerate(copies):
+        copy["key"] = i
+
+    assert "key" not in original
+    assert [copy["key"] for copy in copies] == [0, 1, 2]
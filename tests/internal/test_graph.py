@@ -35,3 +35,9 @@ def test_toposort_with_cycle_raises():
 
 def test_toposort_on_empty_graph_returns_empty_list():
     assert toposort({}) == []
+
+
+def test_toposort_order_only_depends_on_graph_order():
+    graph = {"c": (), "a": ("c",), "b": (), "d": ("b", "c")}
+
+    assert toposort(graph) == ["c", "b", "a", "d"]
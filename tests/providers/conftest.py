@@ -0,0 +1,26 @@
+import pytest
+
+from plato import sample
+from plato.context import create_root_context
+
+
+@pytest.fixture(name="contexts")
+def fixture_contexts():
+    return [create_root_context(root_seed) for root_seed in range(200)]
+
+
+@pytest.fixture(name="assert_values_depend_only_on_context")
+def fixture_assert_values_depend_only_on_context(contexts):
+    def assert_values_depend_only_on_context(provider):
+        values = [sample(provider, context) for context in contexts]
+
+        assert len({repr(value) for value in values}) > 1
+        assert values == [
+            sample(provider, create_root_context(root_seed))
+            for root_seed in range(len(contexts))
+        ]
+        assert provider.sample_batch(contexts) == values
+        assert provider.sample_batch(contexts[::-1]) == values[::-1]
+        assert provider.sample_batch(contexts[5:7]) == values[5:7]
+
+    return assert_values_depend_only_on_context
@@ -0,0 +1,121 @@
+import re
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from plato import sample
+from plato.providers.builtin import (
+    UUID4,
+    Bool,
+    Bothify,
+    Choice,
+    DateRange,
+    DatetimeRange,
+    DecimalRange,
+    FloatRange,
+    IntRange,
+    Numerify,
+    Sample,
+)
+
+
+@pytest.mark.parametrize(
+    "provider",
+    [
+        IntRange(1, 10),
+        FloatRange(0.0, 1.0),
+        DecimalRange(0, 100),
+        Bool(),
+        Choice("abc", weights=[1, 2, 3]),
+        Sample(range(10), 3),
+        Bothify("??-##"),
+        UUID4(),
+        DateRange(date(2020, 1, 1), date(2020, 12, 31)),
+    ],
+)
+def test_values_depend_only_on_context(provider, assert_values_depend_only_on_context):
+    assert_values_depend_only_on_context(provider)
+
+
+def test_int_range_covers_both_end_points(contexts):
+    values = {sample(IntRange(-2, 2), context) for context in contexts}
+    assert values == {-2, -1, 0, 1, 2}
+
+
+def test_float_range_stays_within_bounds(contexts):
+    values = [sample(FloatRange(-1.5, 2.5), context) for context in contexts]
+    assert all(-1.5 <= value <= 2.5 for value in values)
+
+
+def test_decimal_range_has_fixed_places(contexts):
+    values = [sample(DecimalRange(0, 1, places=3), context) for context in contexts]
+    assert all(Decimal(0) <= value <= Decimal(1) for value in values)
+    assert all(value.as_tuple().exponent == -3 for value in values)
+
+
+def test_decimal_range_rounds_bounds_into_range(contexts):
+    provider = DecimalRange(Decimal("0.005"), Decimal("0.015"))
+    values = {sample(provider, context) for context in contexts}
+    assert values == {Decimal("0.01")}
+
+
+def test_bool_respects_extreme_probabilities(contexts):
+    assert not any(sample(Bool(0.0), context) for context in contexts)
+    assert all(sample(Bool(1.0), context) for context in contexts)
+
+
+def test_choice_ignores_elements_with_zero_weight(contexts):
+    provider = Choice(["a", "b", "c"], weights=[1, 0, 1])
+    assert {sample(provider, context) for context in contexts} == {"a", "c"}
+
+
+def test_sample_provides_unique_elements(contexts):
+    for context in contexts:
+        value = sample(Sample(range(5), 3), context)
+        assert len(value) == len(set(value)) == 3
+        assert set(value) <= set(range(5))
+
+
+def test_numerify_replaces_placeholders(contexts):
+    values = [sample(Numerify("#%-!@"), context) for context in contexts]
+    assert all(re.fullmatch(r"[0-9][1-9]-[0-9]?[1-9]?", value) for value in values)
+    assert len(set(values)) > 1
+
+
+def test_bothify_replaces_placeholders(contexts):
+    provider = Bothify("??-##", letters="xy")
+    values = [sample(provider, context) for context in contexts]
+    assert all(re.fullmatch(r"[xy]{2}-[0-9]{2}", value) for value in values)
+
+
+def test_uuid4_has_version_4(contexts):
+    assert all(sample(UUID4(), context).version == 4 for context in contexts)
+
+
+def test_date_ranges_cover_both_end_points(contexts):
+    start, end = date(2020, 1, 1), date(2020, 1, 3)
+    values = {sample(DateRange(start, end), context) for context in contexts}
+    assert values == {start, date(2020, 1, 2), end}
+
+    start_dt, end_dt = datetime(2020, 1, 1), datetime(2020, 1, 2)
+    provider = DatetimeRange(start_dt, end_dt)
+    assert all(start_dt <= sample(provider, context) <= end_dt for context in contexts)
+
+
+@pytest.mark.parametrize(
+    "create_provider",
+    [
+        lambda: IntRange(2, 1),
+        lambda: FloatRange(2.0, 1.0),
+        lambda: DecimalRange(Decimal("0.001"), Decimal("0.002")),
+        lambda: Bool(1.5),
+        lambda: Choice([]),
+        lambda: Choice("ab", weights=[1]),
+        lambda: Sample("ab", 3),
+        lambda: DateRange(date(2020, 1, 2), date(2020, 1, 1)),
+    ],
+)
+def test_rejects_invalid_arguments(create_provider):
+    with pytest.raises(ValueError):
+        create_provider()
@@ -0,0 +1,82 @@
+import pytest
+
+from plato import Provider, formclass, sample
+from plato.batch import sample_batch
+from plato.context import create_root_context
+from plato.providers.common import Cached, CacheInfo
+
+
+class CountingSeedProvider(Provider):
+    def __init__(self):
+        self.calls = 0
+
+    def sample(self, context):
+        self.calls += 1
+        return context.seed
+
+
+def test_cached_returns_cached_values_for_same_seed():
+    provider = CountingSeedProvider()
+    cached = Cached(provider)
+
+    values = [sample(cached, create_root_context(seed)) for seed in [0, 1, 0, 1]]
+
+    assert values == [create_root_context(seed).seed for seed in [0, 1, 0, 1]]
+    assert provider.calls == 2
+    assert cached.cache_info() == CacheInfo(hits=2, misses=2, maxsize=128, currsize=2)
+
+
+def test_cached_evicts_least_recently_used_values():
+    provider = CountingSeedProvider()
+    cached = Cached(provider, maxsize=2)
+
+    for seed in [0, 1, 0, 2, 0, 1]:
+        sample(cached, create_root_context(seed))
+
+    assert provider.calls == 4
+    assert cached.cache_info() == CacheInfo(hits=2, misses=4, maxsize=2, currsize=2)
+
+
+@pytest.mark.parametrize("maxsize", [0, None])
+def test_cached_with_zero_or_unbounded_maxsize(maxsize):
+    cached = Cached(CountingSeedProvider(), maxsize=maxsize)
+
+    for seed in list(range(200)) * 2:
+        sample(cached, create_root_context(seed))
+
+    assert cached.cache_info().currsize == (0 if maxsize == 0 else 200)
+
+
+def test_cached_rejects_negative_maxsize():
+    with pytest.raises(ValueError):
+        Cached(CountingSeedProvider(), maxsize=-1)
+
+
+def test_cached_sample_batch():
+    provider = CountingSeedProvider()
+    cached = Cached(provider)
+    sample(cached, create_root_context(0))
+
+    contexts = [create_root_context(seed) for seed in [0, 1, 2, 1]]
+    values = sample_batch(cached, contexts)
+
+    assert values == [context.seed for context in contexts]
+    assert provider.calls == 3
+    assert cached.cache_info() == CacheInfo(hits=2, misses=3, maxsize=128, currsize=3)
+
+
+def test_cached_cache_clear():
+    provider = CountingSeedProvider()
+
+    @formclass
+    class Data:
+        value: bytes = Cached(provider)  # type: ignore[assignment]
+
+    sample(Data(), create_root_context(0))
+    Data.value.cache_clear()  # type: ignore[attr-defined]
+    sample(Data(), create_root_context(0))
+
+    assert provider.calls == 2
+    assert Data.value.cache_info() == CacheInfo(  # type: ignore[attr-defined]
+        hits=0, misses=1, maxsize=128, currsize=1
+    )
@@ -0,0 +1,69 @@
+from faker import Faker
+
+from plato import sample
+from plato.context import Context, create_root_context
+from plato.providers.faker import FromFaker
+
+
+def test_samples_are_deterministic_per_seed():
+    fake = FromFaker(Faker(["en-US", "de-DE"]))
+    provider = fake["de-DE"].street_address()
+
+    values = [
+        sample(provider, create_root_context(root_seed)) for root_seed in range(3)
+    ]
+
+    assert len(set(values)) == 3
+    assert values == [
+        sample(provider, create_root_context(root_seed)) for root_seed in range(3)
+    ]
+
+
+def test_samples_match_seeding_all_locales():
+    faker = Faker(["en-US", "de-DE"])
+    context = create_root_context(0)
+
+    faker.seed_instance(context.seed)
+    expected = faker["de-DE"].street_address()
+
+    assert sample(FromFaker(faker)["de-DE"].street_address(), context) == expected
+
+
+def test_only_seeds_generator_of_used_locale():
+    faker = Faker(["en-US", "de-DE"])
+    en_us_random = faker["en-US"].random
+    en_us_state = en_us_random.getstate()
+
+    sample(FromFaker(faker)["de-DE"].street_address(), create_root_context(0))
+
+    assert faker["en-US"].random is en_us_random
+    assert en_us_random.getstate() == en_us_state
+
+
+def test_seeds_faker_instance_for_generator_methods():
+    faker = Faker()
+    context: Context = create_root_context(0)
+
+    faker.seed_instance(context.seed)
+    expected = faker.format("first_name")
+
+    assert sample(FromFaker(faker).format("first_name"), context) == expected
+
+
+def test_caches_locale_proxies_and_providers():
+    fake = FromFaker(Faker(["en-US", "de-DE"]))
+
+    assert fake["de-DE"] is fake["de-DE"]
+    assert fake["de-DE"].postcode is fake["de-DE"].postcode
+    assert fake["de-DE"].pyint(1, 10) is fake["de-DE"].pyint(1, 10)
+    assert fake["de-DE"].pyint(1, 10) is not fake["de-DE"].pyint(1, 11)
+    assert fake["de-DE"].pyint(1, 10) is not fake["de-DE"].pyint(1.0, 10)
+    assert fake["de-DE"].random_element([1, 2]) is not (
+        fake["de-DE"].random_element([1, 2])
+    )
+
+
+def test_does_not_cache_attributes_of_multi_locale_proxy():
+    fake = FromFaker(Faker(["en-US", "de-DE"]))
+
+    assert fake.name is not fake.name
@@ -0,0 +1,114 @@
+import pytest
+
+import plato
+from plato import formclass, sample, sample_many
+from plato.context import create_root_context
+
+np = pytest.importorskip("numpy")
+
+# pylint: disable=wrong-import-position
+from plato.providers.numpy import Categorical, Code, LogNormal, Normal, Poisson, Uniform
+
+
+@pytest.mark.parametrize(
+    "provider",
+    [
+        Uniform(-1.0, 1.0),
+        Normal(10.0, 2.0),
+        LogNormal(),
+        Poisson(3.0),
+        Categorical("abc", weights=[1, 2, 3]),
+        Code(6, prefix="X-"),
+    ],
+)
+def test_values_depend_only_on_context(provider, assert_values_depend_only_on_context):
+    assert_values_depend_only_on_context(provider)
+
+
+def test_provides_plain_python_values(contexts):
+    for provider in [Uniform(), Poisson(), Categorical([1, 2])]:
+        values = provider.sample_batch(contexts) + [sample(provider, contexts[0])]
+        assert all(not isinstance(value, np.generic) for value in values)
+
+
+def test_uniform_stays_within_bounds(contexts):
+    values = Uniform(-1.0, 1.0).sample_batch(contexts)
+    assert all(-1.0 <= value < 1.0 for value in values)
+
+
+@pytest.mark.parametrize(
+    "provider, mean, std",
+    [
+        (Uniform(2.0, 4.0), 3.0, 2.0 / 12 ** 0.5),
+        (Normal(10.0, 2.0), 10.0, 2.0),
+        (
+            LogNormal(0.0, 0.5),
+            np.exp(0.125),
+            ((np.exp(0.25) - 1) * np.exp(0.25)) ** 0.5,
+        ),
+        (Poisson(3.0), 3.0, 3.0 ** 0.5),
+        (Poisson(1000.0), 1000.0, 1000.0 ** 0.5),
+        (Poisson(1e8), 1e8, 1e4),
+    ],
+)
+def test_follows_distribution(provider, mean, std):
+    contexts = [create_root_context(seed) for seed in range(5000)]
+    values = np.asarray(provider.sample_batch(contexts))
+    assert abs(values.mean() - mean) < 5 * std / len(values) ** 0.5
+    assert abs(values.std() - std) < 0.05 * std
+
+
+def test_poisson_provides_ints(contexts):
+    assert all(isinstance(value, int) for value in Poisson().sample_batch(contexts))
+    assert set(Poisson(0.0).sample_batch(contexts)) == {0}
+
+
+def test_categorical_ignores_elements_with_zero_weight(contexts):
+    values = Categorical(["a", "b", "c"], weights=[1, 0, 1]).sample_batch(contexts)
+    assert set(values) == {"a", "c"}
+
+
+def test_code_has_fixed_width(contexts):
+    values = Code(4, alphabet="xy", prefix="#").sample_batch(contexts)
+    assert all(len(value) == 5 and value[0] == "#" for value in values)
+    assert set("".join(value[1:] for value in values)) == {"x", "y"}
+
+
+@formclass
+class Measurement:
+    unit: str = Categorical(["mm", "m"])  # type: ignore[assignment]
+    value: float = Normal()  # type: ignore[assignment]
+    count: int = Poisson()  # type: ignore[assignment]
+
+
+def test_plugs_into_formclass():
+    plato.seed(0)
+    samples = sample_many(Measurement(), 20)
+
+    assert all(instance.unit in ("mm", "m") for instance in samples)
+    assert len({instance.value for instance in samples}) == 20
+    assert isinstance(sample(Measurement()).count, int)
+
+    plato.seed(0)
+    assert [sample(Measurement()) for _ in range(20)] == samples
+
+    plato.seed(0)
+    assert sample_many(Measurement(), 20, workers=2) == samples
+
+
+@pytest.mark.parametrize(
+    "create_provider",
+    [
+        lambda: Uniform(1.0, 0.0),
+        lambda: Normal(std=-1.0),
+        lambda: LogNormal(sigma=-1.0),
+        lambda: Poisson(-1.0),
+        lambda: Categorical([]),
+        lambda: Categorical("ab", weights=[1]),
+        lambda: Code(0),
+        lambda: Code(4, alphabet=""),
+    ],
+)
+def test_rejects_invalid_arguments(create_provider):
+    with pytest.raises(ValueError):
+        create_provider()
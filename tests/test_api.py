@@ -1,12 +1,25 @@
 """Tests of the Plato's public core API."""
 
+import copy
+import dataclasses
+import itertools
+import pickle
 import typing
+import weakref
 from dataclasses import dataclass, fields
 
 import pytest
 
 import plato
-from plato import Provider, Shared, formclass, sample
+from plato import (
+    Provider,
+    Shared,
+    formclass,
+    iter_samples,
+    sample,
+    sample_columns,
+    sample_many,
+)
 from plato.formclasses import InitVar, derivedfield
 from plato.providers.base import ProviderProtocol, WithAttributeAccess
 
@@ -487,3 +500,470 @@ def test_initvar_is_passed_to_derivedfields():
             return base_value + 1
 
     assert sample(TestData(base_value=1)).plus_one == 2
+
+
+def test_initvar_is_passed_to_post_init():
+    @formclass
+    class TestData:
+        base_value: InitVar[int]
+        value: int = 0
+
+        def __post_init__(self, base_value):
+            self.value = base_value * 2
+
+    assert sample(TestData(base_value=2)).value == 4
+
+
+def test_initvar_of_base_class_is_passed_to_derivedfields():
+    @formclass
+    class Base:
+        base_value: InitVar[int]
+
+    @formclass
+    class TestData(Base):
+        offset: InitVar[int]
+
+        @derivedfield
+        def total(self, base_value, offset) -> int:
+            return base_value + offset
+
+    assert sample(TestData(base_value=1, offset=2)).total == 3
+
+
+def test_initvar_survives_copying():
+    @formclass
+    class TestData:
+        base_value: InitVar[int]
+
+        @derivedfield
+        def plus_one(self, base_value) -> int:
+            return base_value + 1
+
+    assert sample(copy.copy(TestData(base_value=1))).plus_one == 2
+
+
+def test_sample_many_matches_consecutive_samples():
+    @formclass
+    class TestData:
+        field: bytes = SeedProvider()
+
+        @derivedfield
+        def derived(self, field) -> bytes:
+            return field
+
+    plato.seed(42)
+    expected = [sample(TestData()) for _ in range(3)]
+    expected.append(sample(TestData()))
+
+    plato.seed(42)
+    actual = sample_many(TestData(), 3)
+    actual.append(sample(TestData()))
+
+    assert actual == expected
+
+
+def test_sample_many_with_provider_and_other_objects():
+    plato.seed(42)
+    expected = [sample(SeedProvider()) for _ in range(2)]
+
+    plato.seed(42)
+    assert sample_many(SeedProvider(), 2) == expected
+    assert sample_many("foo", 2) == ["foo", "foo"]
+
+
+def test_iter_samples_matches_consecutive_samples():
+    @formclass
+    class TestData:
+        field: bytes = SeedProvider()
+
+    plato.seed(42)
+    expected = [sample(TestData()) for _ in range(3)]
+
+    plato.seed(42)
+    assert list(iter_samples(TestData(), 3)) == expected
+
+    plato.seed(42)
+    assert list(itertools.islice(iter_samples(TestData()), 3)) == expected
+
+
+def test_iter_samples_does_not_keep_references_to_samples():
+    @formclass
+    class TestData:
+        field: int = CountingProvider()
+
+    samples = iter_samples(TestData())
+    ref = weakref.ref(next(samples))
+    next(samples)
+
+    assert ref() is None
+
+
+@formclass
+class PicklableData:
+    base_value: InitVar[bytes]
+    field: bytes = SeedProvider()  # type: ignore[assignment]
+
+    @derivedfield
+    def derived(self, base_value, field) -> bytes:
+        return base_value + field
+
+
+@formclass(output_slots=True, output_frozen=True)
+class PicklableFrozenData:
+    field: bytes = SeedProvider()  # type: ignore[assignment]
+
+
+def test_sampled_instances_are_plain_dataclasses():
+    post_init_calls = []
+
+    @formclass
+    class TestData:
+        field: str = "value"
+
+        def __post_init__(self):
+            post_init_calls.append(self)
+
+        @derivedfield
+        def derived(self, field) -> str:
+            return field + "!"
+
+    form = TestData()
+    data = sample(form)
+
+    assert post_init_calls == [form]
+    assert isinstance(data, TestData)
+    assert repr(data) == "TestData(field='value', derived='value!')"
+    assert dataclasses.asdict(data) == {"field": "value", "derived": "value!"}
+    assert dataclasses.replace(data, field="other").field == "other"
+
+
+def test_sampled_instances_can_use_slots_and_be_frozen():
+    @formclass(output_slots=True, output_frozen=True)
+    class TestData:
+        field: str = "value"
+
+        @derivedfield
+        def derived(self, field) -> str:
+            return field + "!"
+
+    data = sample(TestData())
+
+    assert vars(data) == {}
+    assert data.derived == "value!"
+    assert hash(data) == hash(sample(TestData()))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        data.field = "other"  # type: ignore[misc]
+    TestData().field = "other"
+    assert dataclasses.replace(data, field="other").derived == "value!"
+
+
+def test_sampled_instances_equal_instances_of_the_formclass():
+    @formclass
+    class TestData:
+        field: str = "value"
+        number: int = 1
+
+    expected = TestData(field="value", number=1)
+
+    assert sample(TestData()) == expected
+    assert expected == sample(TestData())
+    assert sample(TestData(), lazy=True) == expected
+    assert expected == sample(TestData(), lazy=True)
+    assert sample(TestData()) != TestData(field="other", number=1)
+
+
+def test_sampled_instances_can_be_replaced_with_init_vars():
+    @formclass
+    class TestData:
+        base: InitVar[int] = 1
+        field: int = 2
+
+        @derivedfield
+        def derived(self, base, field) -> int:
+            return base + field
+
+    data = sample(TestData())
+    replaced = dataclasses.replace(data, base=3, field=4)
+
+    assert type(replaced) is type(data)
+    assert replaced == TestData(base=3, field=4, derived=3)
+
+
+def test_sampled_instances_can_be_pickled():
+    for data in (sample(PicklableData(b"base")), sample(PicklableFrozenData())):
+        assert pickle.loads(pickle.dumps(data)) == data
+        assert copy.deepcopy(data) == data
+
+
+class RecordingSeedProvider(SeedProvider):
+    def __init__(self, sampled_paths):
+        self.sampled_paths = sampled_paths
+
+    def sample(self, context):
+        self.sampled_paths.append(".".join(context.path))
+        return super().sample(context)
+
+
+def test_lazy_sample_matches_eager_sample():
+    @formclass
+    class Inner:
+        field: bytes = SeedProvider()
+
+    @formclass
+    class TestData:
+        base_value: InitVar[bytes]
+        shared = Shared(SequenceProvider([Inner(), Inner()]))
+        first: Inner = shared
+        second: Inner = shared
+        second_field: bytes = shared.field
+        child: Inner = Inner()
+
+        @derivedfield
+        def derived(self, base_value, child) -> bytes:
+            return base_value + child.field
+
+    plato.seed(42)
+    expected = sample(TestData(b"base"))
+
+    plato.seed(42)
+    data = sample(TestData(b"base"), lazy=True)
+
+    assert data.derived == expected.derived
+    assert data.second_field == expected.second_field
+    assert data.second is data.first
+    assert data == expected
+    assert expected == data
+    assert repr(data) == repr(expected)
+    assert isinstance(data, TestData)
+
+
+def test_lazy_sample_matches_eager_sample_with_nested_shared():
+    @formclass
+    class Inner:
+        field: bytes = SeedProvider()
+
+    @formclass
+    class TestData:
+        shared = Shared(SeedProvider())
+        child_first: Inner = Inner(field=shared)  # type: ignore[arg-type]
+        first: bytes = shared
+        child: Inner = Inner(field=shared)  # type: ignore[arg-type]
+
+    plato.seed(42)
+    expected = sample(TestData())
+
+    plato.seed(42)
+    data = sample(TestData(), lazy=True)
+
+    assert data.child.field == expected.child.field == expected.first
+    assert data.child_first.field == expected.child_first.field != expected.first
+    assert data == expected
+
+
+def test_lazy_sample_only_samples_accessed_fields():
+    sampled_paths = []
+
+    @formclass
+    class Inner:
+        field: bytes = RecordingSeedProvider(sampled_paths)
+        other: bytes = RecordingSeedProvider(sampled_paths)
+
+    @formclass
+    class TestData:
+        field: bytes = RecordingSeedProvider(sampled_paths)
+        child: Inner = Inner()
+        unused: bytes = RecordingSeedProvider(sampled_paths)
+
+        @derivedfield
+        def derived(self, child) -> bytes:
+            return child.field
+
+    data = sample(TestData(), lazy=True)
+    assert sampled_paths == []
+
+    assert data.derived == data.child.field
+    assert data.derived is data.derived
+    assert sampled_paths == ["child.field"]
+
+
+def test_lazy_sample_does_not_sample_other_fields_using_the_same_provider():
+    sampled_paths = []
+    provider = RecordingSeedProvider(sampled_paths)
+
+    @formclass
+    class TestData:
+        first: bytes = provider
+        second: bytes = provider
+
+    plato.seed(42)
+    expected = sample(TestData())
+    sampled_paths.clear()
+
+    plato.seed(42)
+    data = sample(TestData(), lazy=True)
+
+    assert data.second == expected.second
+    assert sampled_paths == ["second"]
+
+
+def test_lazy_sample_with_slots_and_frozen_output_class():
+    plato.seed(42)
+    data = sample(PicklableFrozenData(), lazy=True)
+    plato.seed(42)
+    expected = sample(PicklableFrozenData())
+
+    assert hash(data) == hash(expected)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        data.field = b"other"  # type: ignore[misc]
+    assert pickle.loads(pickle.dumps(data)) == data
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_sample_many_with_workers_matches_serial_sampling(workers):
+    plato.seed(42)
+    expected = sample_many(PicklableData(b"base"), 5)
+    expected.append(sample(PicklableData(b"base")))
+
+    plato.seed(42)
+    actual = sample_many(PicklableData(b"base"), 5, workers=workers)
+    actual.append(sample(PicklableData(b"base")))
+
+    assert actual == expected
+
+
+def test_sample_columns_matches_consecutive_samples():
+    @formclass
+    class Inner:
+        field: bytes = SeedProvider()
+
+    @formclass
+    class TestData:
+        base_value: InitVar[bytes]
+        constant: str = "constant"
+        child: Inner = Inner()
+
+        @derivedfield
+        def derived(self, base_value, child) -> bytes:
+            return base_value + child.field
+
+        @derivedfield
+        def derived_child(self, child) -> Inner:
+            return child
+
+    plato.seed(42)
+    expected = [sample(TestData(b"base")) for _ in range(3)]
+
+    plato.seed(42)
+    columns = sample_columns(TestData(b"base"), 3)
+
+    assert columns == {
+        "constant": ["constant"] * 3,
+        "child.field": [data.child.field for data in expected],
+        "derived": [data.derived for data in expected],
+        "derived_child.field": [data.derived_child.field for data in expected],
+    }
+
+
+def test_sample_columns_fills_in_absent_fields():
+    @formclass
+    class ChildA:
+        a: str = "a"
+
+    @formclass
+    class ChildB:
+        b: str = "b"
+
+    @formclass
+    class TestData:
+        kind: str = SequenceProvider(["b", "a", "a"])
+
+        @derivedfield
+        def child(self, kind) -> typing.Any:
+            return {"a": ChildA(), "b": ChildB()}[kind]
+
+    columns = sample_columns(TestData(), 3)
+
+    assert columns == {
+        "kind": ["b", "a", "a"],
+        "child.b": ["b", None, None],
+        "child.a": [None, "a", "a"],
+    }
+
+
+class BatchSeedProvider(SeedProvider):
+    def __init__(self):
+        self.batch_sizes = []
+
+    def sample_batch(self, contexts):
+        self.batch_sizes.append(len(contexts))
+        return super().sample_batch(contexts)
+
+
+def test_sample_many_samples_providers_in_batches():
+    provider = BatchSeedProvider()
+
+    @formclass
+    class Inner:
+        field: bytes = provider
+
+    @formclass
+    class TestData:
+        field: bytes = provider
+        child: Inner = Inner()
+
+    plato.seed(42)
+    expected = [sample(TestData()) for _ in range(3)]
+
+    plato.seed(42)
+    assert sample_many(TestData(), 3) == expected
+    assert sample_columns(TestData(), 3)
+    assert provider.batch_sizes == [3, 3, 3, 3]
+
+
+def test_sample_many_with_shared_values():
+    @dataclass
+    class Data:
+        field0: bytes
+        field1: bytes
+
+    class DataProvider(Provider, WithAttributeAccess):
+        def sample(self, context):
+            return Data(context.seed, context.seed)
+
+    @formclass
+    class Inner:
+        field: bytes
+
+    @formclass
+    class TestData:
+        shared = Shared(DataProvider())
+        field0: bytes = shared.field0
+        field1: bytes = shared.field1
+        child: Inner = Inner(shared.field1)
+
+    plato.seed(42)
+    expected = [sample(TestData()) for _ in range(3)]
+
+    plato.seed(42)
+    actual = sample_many(TestData(), 3)
+
+    assert actual == expected
+    assert all(data.field0 == data.child.field for data in actual)
+
+
+def test_seeds_are_deterministic_and_stable_against_field_removal():
+    @formclass
+    class TestData:
+        field0: bytes = SeedProvider()
+        field1: bytes = SeedProvider()
+
+    plato.seed(42)
+    data = sample(TestData())
+    assert data.field0 != data.field1
+
+    @formclass
+    class TestData:  # pylint: disable=function-redefined
+        field1: bytes = SeedProvider()
+
+    plato.seed(42)
+    assert sample(TestData()).field1 == data.field1
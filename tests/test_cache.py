@@ -0,0 +1,204 @@
+import os
+from typing import List
+
+import faker
+import pytest
+from faker import Faker
+
+import plato
+from plato import Provider, derivedfield, formclass
+from plato.cache import DiskCache, fingerprint
+from plato.providers.faker import FromFaker
+
+SAMPLED_SEEDS: List[bytes] = []
+
+
+class RecordingSeedProvider(Provider):
+    def __init__(self, prefix=""):
+        self.prefix = prefix
+
+    def sample(self, context):
+        SAMPLED_SEEDS.append(context.seed)
+        return self.prefix + context.seed.hex()[:8]
+
+
+@formclass
+class Data:
+    value: str = RecordingSeedProvider()  # type: ignore[assignment]
+
+    @derivedfield
+    def upper(self, value) -> str:
+        return value.upper()
+
+
+@formclass
+class Person:
+    name: str = FromFaker(Faker("en-US")).name()  # type: ignore[assignment]
+
+
+@pytest.fixture(name="cache")
+def fixture_cache(tmp_path):
+    SAMPLED_SEEDS.clear()
+    plato.seed(0)
+    return DiskCache(tmp_path)
+
+
+def test_warm_cache_skips_sampling(cache):
+    cold = cache.sample_many(Data(), 5)
+    assert len(SAMPLED_SEEDS) == 5
+
+    plato.seed(0)
+    warm = cache.sample_many(Data(), 5)
+
+    assert warm == cold
+    assert type(warm[0]) is type(cold[0])  # pylint: disable=unidiomatic-typecheck
+    assert len(SAMPLED_SEEDS) == 5
+
+
+def test_cache_returns_same_samples_as_uncached_sampling(cache):
+    cached = [cache.sample(Data()), *cache.sample_many(Data(), 3)]
+    plato.seed(0)
+    uncached = [plato.sample(Data()), *plato.sample_many(Data(), 3)]
+
+    assert cached == uncached
+
+
+def test_cache_consumes_root_seeds(cache):
+    cache.sample_many(Data(), 3)
+    plato.seed(0)
+    cache.sample_many(Data(), 3)
+
+    assert cache.sample(Data()) != cache.sample(Data())
+    assert len(SAMPLED_SEEDS) == 5
+
+
+def test_cache_is_keyed_by_form(cache):
+    cache.sample(Data())
+    plato.seed(0)
+    cache.sample(Data(value=RecordingSeedProvider("prefix")))  # type: ignore[arg-type]
+    plato.seed(100)
+    cache.sample(Data())
+
+    assert len(SAMPLED_SEEDS) == 3
+
+
+def test_cache_is_keyed_by_faker_version(cache, monkeypatch):
+    cache.sample(Data())
+    plato.seed(0)
+    monkeypatch.setattr(faker, "VERSION", "0.0.0")
+    cache.sample(Data())
+
+    assert len(SAMPLED_SEEDS) == 2
+
+
+def test_cache_hits_after_sampling_with_faker(cache):
+    cold = cache.sample_many(Person(), 3)
+    plato.sample_many(Person(), 3)
+    plato.seed(0)
+
+    assert DiskCache(cache.directory).sample_many(Person(), 3) == cold
+    assert len(os.listdir(cache.directory)) == 1
+
+
+def test_cached_samples_do_not_depend_on_workers(cache):
+    parallel = cache.sample_many(Data(), 5, workers=2)
+    plato.seed(0)
+    sequential = plato.sample_many(Data(), 5)
+    plato.seed(0)
+
+    assert parallel == sequential
+    assert cache.sample_many(Data(), 5) == parallel
+
+
+def test_fingerprint_is_computed_once_per_form(cache, monkeypatch):
+    form = Data()
+    cache.sample(form)
+    monkeypatch.setattr(plato.cache, "fingerprint", None)
+
+    cache.sample(form)
+
+
+def test_fingerprint():
+    @formclass
+    class Derived:
+        value: int = 0
+
+        @derivedfield
+        def derived(self, value) -> int:
+            return value + 1
+
+    @formclass
+    class OtherDerived:  # pylint: disable=unused-variable
+        value: int = 0
+
+        @derivedfield
+        def derived(self, value) -> int:
+            return value + 2
+
+    shared = [1, 2]
+    recursive: list = []
+    recursive.append(recursive)
+
+    assert fingerprint(Data()) == fingerprint(Data())
+    assert fingerprint(Data()) != fingerprint(
+        Data(value=RecordingSeedProvider("prefix"))  # type: ignore[arg-type]
+    )
+    assert fingerprint(Derived()) != fingerprint(Derived(value=1))
+    assert fingerprint(Derived()) != fingerprint(OtherDerived())
+    assert fingerprint({1, "a"}) == fingerprint({"a", 1})
+    assert fingerprint([shared, shared]) != fingerprint([[1, 2], [1, 2]])
+    assert fingerprint(recursive) == fingerprint(recursive)
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    entry_size = _entry_size(tmp_path / "size")
+    cache = DiskCache(tmp_path / "cache", max_size=2 * entry_size)
+    SAMPLED_SEEDS.clear()
+
+    plato.seed(0)
+    cache.sample(Data())
+    (first_entry,) = _entries(cache)
+    os.utime(first_entry, (1, 1))
+    cache.sample(Data())
+    (second_entry,) = set(_entries(cache)) - {first_entry}
+    os.utime(second_entry, (2, 2))
+    plato.seed(0)
+    cache.sample(Data())  # marks the first entry as recently used
+    plato.seed(100)
+    cache.sample(Data())
+
+    assert len(SAMPLED_SEEDS) == 3
+    assert first_entry in _entries(cache)
+    assert second_entry not in _entries(cache)
+
+
+def test_cache_clear(cache):
+    cache.sample(Data())
+    cache.clear()
+    plato.seed(0)
+    cache.sample(Data())
+
+    assert len(SAMPLED_SEEDS) == 2
+
+
+def test_unpicklable_samples_are_not_cached(cache):
+    @formclass
+    class Local:
+        value: str = RecordingSeedProvider()  # type: ignore[assignment]
+
+    cache.sample(Local())
+
+    assert not _entries(cache)
+
+
+def _entry_size(directory):
+    cache = DiskCache(directory)
+    plato.seed(0)
+    cache.sample(Data())
+    return os.path.getsize(_entries(cache)[0])
+
+
+def _entries(cache):
+    return sorted(
+        os.path.join(cache.directory, name) for name in os.listdir(cache.directory)
+    )
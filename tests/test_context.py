@@ -0,0 +1,77 @@
+import random
+from hashlib import blake2b
+
+from plato.context import Context, create_root_context
+
+
+def test_seed_and_rng_are_derived_from_hasher():
+    hasher = blake2b(b"root")
+    context = Context(hasher.copy()).subcontext("field")
+
+    hasher.update(b"field")
+    assert context.seed == hasher.digest()
+    assert context.rng.random() == random.Random(hasher.digest()).random()
+
+
+class CountingHasher:
+    def __init__(self):
+        self.n_copies = 0
+        self.n_digests = 0
+
+    def copy(self):
+        self.n_copies += 1
+        return self
+
+    def update(self, data):
+        pass
+
+    def digest(self):
+        self.n_digests += 1
+        return b"seed"
+
+
+def test_seed_and_rng_are_created_lazily():
+    hasher = CountingHasher()
+    context = Context(hasher)
+    assert hasher.n_digests == 0
+
+    assert context.rng is context.rng
+    assert context.seed == b"seed"
+    assert hasher.n_digests == 1
+
+
+def test_meta_is_passed_to_subcontexts_but_not_back():
+    context = Context(blake2b())
+    context.meta["parent"] = "value"
+
+    subcontext = context.subcontext("child")
+    subcontext.meta["child"] = "value"
+    context.meta["parent after subcontext"] = "value"
+
+    assert dict(context.meta) == {"parent": "value", "parent after subcontext": "value"}
+    assert dict(subcontext.meta) == {"parent": "value", "child": "value"}
+
+
+def test_subcontext_hashers_are_created_lazily():
+    hasher = CountingHasher()
+    context = Context(hasher).subcontext("child").subcontext("grandchild")
+    assert hasher.n_copies == 0
+
+    assert context.seed == b"seed"
+    assert hasher.n_copies == 2
+
+
+def test_subcontext_seeds_do_not_depend_on_access_order():
+    root = Context(blake2b(b"root"))
+    child = root.subcontext("child")
+    grandchild = child.subcontext("grandchild")
+
+    grandchild_seed = grandchild.seed
+    assert child.seed == Context(blake2b(b"root")).subcontext("child").seed
+    assert grandchild_seed == root.subcontext("child").subcontext("grandchild").seed
+
+
+def test_path_lists_subcontext_names():
+    root = create_root_context(0)
+    assert root.path == ()
+    assert root.subcontext("a").subcontext("b").path == ("a", "b")
@@ -0,0 +1,135 @@
+import dataclasses
+import typing
+from dataclasses import InitVar, dataclass
+
+import pytest
+
+import plato
+from plato import (
+    Provider,
+    derivedfield,
+    formclass,
+    sample,
+    sample_columns,
+    sample_dict,
+    sample_many,
+    sample_many_dicts,
+)
+
+
+class SeedProvider(Provider):
+    def sample(self, context):
+        return context.seed
+
+
+@dataclass
+class GeneratedData:
+    values: typing.List[int]
+
+
+class GeneratedDataProvider(Provider):
+    def sample(self, context):
+        return GeneratedData([1, 2])
+
+
+@formclass
+class DictTestInner:
+    field: bytes = SeedProvider()  # type: ignore[assignment]
+    generated: GeneratedData = GeneratedDataProvider()  # type: ignore[assignment]
+
+
+@formclass
+class DictTestData:
+    base_value: InitVar[bytes]
+    constant: typing.List[str] = dataclasses.field(default_factory=lambda: ["a"])
+    child: DictTestInner = DictTestInner()
+
+    @derivedfield
+    def derived(self, base_value, child) -> bytes:
+        return base_value + child.field
+
+    @derivedfield
+    def derived_child(self, child) -> DictTestInner:
+        return child
+
+
+def test_sample_dict_matches_asdict_of_sample():
+    plato.seed(42)
+    expected = dataclasses.asdict(sample(DictTestData(b"base")))
+
+    plato.seed(42)
+    form = DictTestData(b"base")
+    data = sample_dict(form)
+
+    assert data == expected
+    assert list(data) == list(expected)
+    assert data["constant"] is not form.constant
+
+
+def test_sample_many_dicts_matches_asdict_of_sample_many():
+    plato.seed(42)
+    expected = [dataclasses.asdict(data) for data in sample_many(DictTestData(b""), 3)]
+
+    plato.seed(42)
+    assert sample_many_dicts(DictTestData(b""), 3) == expected
+
+
+def test_sample_dict_with_dict_factory():
+    @formclass
+    class TestData:
+        field: str = "value"
+
+    assert sample_dict(TestData(), dict_factory=tuple) == (("field", "value"),)
+
+
+def test_derived_fields_get_instances_without_sampling_instances():
+    @formclass
+    class Nested:
+        field: bytes = SeedProvider()  # type: ignore[assignment]
+
+    @formclass
+    class TestData:
+        field: bytes = SeedProvider()  # type: ignore[assignment]
+        child: Nested = Nested()
+
+        def describe(self):
+            return f"{type(self).__name__}: {self.field!r}"
+
+        @derivedfield
+        def is_instance(self) -> bool:
+            return isinstance(self, TestData) and isinstance(self.child, Nested)
+
+        @derivedfield
+        def description(self) -> str:
+            return self.describe()
+
+        @derivedfield
+        def representation(self, description) -> str:  # pylint: disable=unused-argument
+            return repr(self)
+
+        @derivedfield
+        def as_dict(  # pylint: disable=unused-argument
+            self, representation
+        ) -> typing.Dict[str, typing.Any]:
+            return dataclasses.asdict(self)  # type: ignore[call-overload]
+
+    plato.seed(42)
+    expected = sample(TestData())
+    assert expected.is_instance
+
+    plato.seed(42)
+    assert sample_dict(TestData()) == dataclasses.asdict(expected)
+
+    plato.seed(42)
+    columns = sample_columns(TestData(), 1)
+    assert columns["is_instance"] == [True]
+    assert columns["description"] == [expected.description]
+    assert columns["representation"] == [expected.representation]
+    assert columns["as_dict"] == [expected.as_dict]
+
+
+def test_sample_dict_requires_formclass():
+    with pytest.raises(TypeError):
+        sample_dict(SeedProvider())
+    with pytest.raises(TypeError):
+        sample_many_dicts(SeedProvider(), 2)
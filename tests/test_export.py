@@ -0,0 +1,116 @@
+import bz2
+import csv
+import gzip
+import io
+import json
+import lzma
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import List
+from uuid import UUID
+
+import pytest
+
+from plato import formclass, iter_samples
+from plato.export import write_csv, write_jsonl
+from plato.providers.builtin import IntRange
+
+
+@formclass
+class Item:
+    name: str = "item"
+    price: Decimal = Decimal("1.50")
+
+
+@formclass
+class Order:
+    number: int = IntRange(0, 1000)  # type: ignore[assignment]
+    day: date = date(2021, 1, 2)
+    item: Item = Item()
+    tags: List[str] = ("a", "b")  # type: ignore[assignment]
+
+
+def test_write_jsonl():
+    out = io.StringIO()
+
+    count = write_jsonl(iter_samples(Order(), 3), out, chunk_size=2)
+
+    rows = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert count == 3
+    assert len(rows) == 3
+    assert rows[0]["day"] == "2021-01-02"
+    assert rows[0]["item"] == {"name": "item", "price": "1.50"}
+    assert rows[0]["tags"] == ["a", "b"]
+
+
+def test_write_jsonl_rejects_unserializable_values():
+    with pytest.raises(TypeError):
+        write_jsonl([{"value": object()}], io.StringIO())
+
+
+def test_write_jsonl_writes_uuids_and_sets():
+    out = io.StringIO()
+    uuid = UUID(int=1)
+
+    write_jsonl([{"uuid": uuid, "set": {1}}], out)
+
+    assert json.loads(out.getvalue()) == {"uuid": str(uuid), "set": [1]}
+
+
+def test_write_csv_flattens_nested_fields():
+    out = io.StringIO()
+
+    count = write_csv(iter_samples(Order(), 3), out, separator="__", chunk_size=2)
+
+    rows = list(csv.reader(io.StringIO(out.getvalue())))
+    assert count == 3
+    assert rows[0] == ["number", "day", "item__name", "item__price", "tags"]
+    assert len(rows) == 4
+    assert rows[1][1:] == ["2021-01-02", "item", "1.50", '["a","b"]']
+
+
+def test_write_csv_with_non_formclass_samples():
+    out = io.StringIO()
+
+    write_csv([1, None], out)
+
+    assert list(csv.reader(io.StringIO(out.getvalue()))) == [["value"], ["1"], [""]]
+
+
+def test_write_csv_rejects_unknown_columns():
+    @dataclass
+    class Other:
+        other: int = 0
+
+    with pytest.raises(ValueError):
+        write_csv([Item(), Other()], io.StringIO())
+
+
+@pytest.mark.parametrize(
+    "extension, compression, open_fn",
+    [
+        (".jsonl", None, open),
+        (".jsonl.gz", None, gzip.open),
+        (".jsonl.bz2", None, bz2.open),
+        (".jsonl.xz", None, lzma.open),
+        (".jsonl", "gzip", gzip.open),
+    ],
+)
+def test_write_to_path_with_compression(tmp_path, extension, compression, open_fn):
+    path = tmp_path / f"samples{extension}"
+
+    write_jsonl(iter_samples(Order(), 2), path, compression=compression)
+
+    with open_fn(path, "rt", encoding="utf-8") as stream:
+        assert len(stream.readlines()) == 2
+
+
+def test_compression_requires_path():
+    with pytest.raises(ValueError):
+        write_jsonl([], io.StringIO(), compression="gzip")
+
+
+def test_unknown_compression(tmp_path):
+    with pytest.raises(ValueError):
+        write_csv([], tmp_path / "samples.csv", compression="zip")
@@ -0,0 +1,154 @@
+import pytest
+
+from plato import Provider, formclass, iter_samples, sample, sample_many
+from plato.formclasses import derivedfield
+from plato.hooks import SamplingHook, add_hook, remove_hook
+from plato.profiler import SamplingProfiler
+
+
+class ConstantProvider(Provider):
+    def sample(self, context):
+        return "provider value"
+
+
+@formclass
+class Child:
+    value: str = ConstantProvider()  # type: ignore[assignment]
+
+
+@formclass
+class Parent:
+    constant: str = "constant"
+    child: Child = Child()
+
+    @derivedfield
+    def derived(self, constant) -> str:
+        return constant + "!"
+
+
+class RecordingHook(SamplingHook):
+    def __init__(self):
+        self.calls = []
+
+    def before(self, event):
+        self.calls.append(("before", event.context.path))
+
+    def after(self, event, elapsed):
+        assert elapsed >= 0
+        form_class_name = getattr(event.form_class, "__name__", None)
+        provider_type_name = type(event.provider).__name__ if event.provider else None
+        self.calls.append(
+            (
+                "after",
+                event.context.path,
+                form_class_name,
+                event.field_name,
+                provider_type_name,
+            )
+        )
+
+
+@pytest.fixture(name="hook")
+def fixture_hook():
+    hook = RecordingHook()
+    add_hook(hook)
+    yield hook
+    remove_hook(hook)
+
+
+def test_hooks_are_invoked_around_fields_and_providers(hook):
+    sample(Parent())
+
+    assert hook.calls == [
+        ("before", ()),
+        ("before", ("constant",)),
+        ("after", ("constant",), "Parent", "constant", None),
+        ("before", ("child",)),
+        ("before", ("child",)),
+        ("before", ("child", "value")),
+        ("before", ("child", "value")),
+        ("after", ("child", "value"), None, None, "ConstantProvider"),
+        ("after", ("child", "value"), "Child", "value", None),
+        ("after", ("child",), "Child", None, None),
+        ("after", ("child",), "Parent", "child", None),
+        ("before", ("derived",)),
+        ("after", ("derived",), "Parent", "derived", None),
+        ("after", (), "Parent", None, None),
+    ]
+
+
+def test_hooks_are_invoked_for_each_sample_in_batches(hook):
+    samples = sample_many(Child(), 3)
+
+    assert [data.value for data in samples] == ["provider value"] * 3
+    assert [call for call in hook.calls if call[0] == "after"] == [
+        ("after", ("value",), None, None, "ConstantProvider"),
+        ("after", ("value",), "Child", "value", None),
+        ("after", (), "Child", None, None),
+    ] * 3
+
+
+def test_hooks_are_invoked_for_each_sample_of_iter_samples(hook):
+    samples = list(iter_samples(Child(), 2))
+
+    assert [data.value for data in samples] == ["provider value"] * 2
+    assert [call for call in hook.calls if call[0] == "after"] == [
+        ("after", ("value",), None, None, "ConstantProvider"),
+        ("after", ("value",), "Child", "value", None),
+        ("after", (), "Child", None, None),
+    ] * 2
+
+
+def test_hooks_are_not_invoked_after_removal():
+    hook = RecordingHook()
+    add_hook(hook)
+    remove_hook(hook)
+
+    sample(Parent())
+
+    assert hook.calls == []
+
+
+def test_hooks_are_registered_while_used_as_context_manager():
+    with RecordingHook() as hook:
+        sample(Child())
+    calls = len(hook.calls)
+    sample(Child())
+
+    assert calls > 0
+    assert len(hook.calls) == calls
+
+
+def test_profiler_aggregates_fields_and_providers():
+    with SamplingProfiler() as profiler:
+        sample_many(Parent(), 4)
+
+    stats = profiler.stats
+    assert set(stats) == {
+        ("instance", "Parent"),
+        ("instance", "Child"),
+        ("field", "Parent.constant"),
+        ("field", "Parent.child"),
+        ("field", "Parent.derived"),
+        ("field", "Child.value"),
+        ("provider", "ConstantProvider"),
+    }
+    assert all(entry.calls == 4 for entry in stats.values())
+    child_stats = stats[("field", "Parent.child")]
+    child_instance_stats = stats[("instance", "Child")]
+    assert child_stats.total_time >= child_instance_stats.total_time
+    assert child_stats.self_time == pytest.approx(
+        child_stats.total_time - child_instance_stats.total_time
+    )
+
+
+def test_profiler_report():
+    with SamplingProfiler() as profiler:
+        sample(Parent())
+
+    report = profiler.report(sort_by="calls", limit=2).splitlines()
+    assert len(report) == 3
+    assert report[0].split() == ["calls", "total", "[s]", "self", "[s]", "kind", "name"]
+
+    with pytest.raises(ValueError):
+        profiler.report(sort_by="name")
@@ -0,0 +1,192 @@
+import dataclasses
+import typing
+from dataclasses import InitVar
+
+import pytest
+
+import plato
+from plato import Provider, Shared, derivedfield, formclass, resample, sample
+from plato.context import create_root_context
+from plato.providers.faker import FromFaker
+
+
+class SeedProvider(Provider):
+    def sample(self, context):
+        return context.seed
+
+
+class PrefixedSeedProvider(Provider):
+    def __init__(self, prefix):
+        self.prefix = prefix
+
+    def sample(self, context):
+        return self.prefix + context.seed
+
+
+@formclass
+class ResampleTestInner:
+    field0: bytes = SeedProvider()  # type: ignore[assignment]
+    field1: bytes = SeedProvider()  # type: ignore[assignment]
+
+
+@formclass
+class ResampleTestData:
+    field0: bytes = SeedProvider()  # type: ignore[assignment]
+    field1: bytes = SeedProvider()  # type: ignore[assignment]
+    child: ResampleTestInner = ResampleTestInner()
+    constant: typing.List[str] = dataclasses.field(default_factory=lambda: ["a"])
+
+    @derivedfield
+    def derived0(self, field0) -> bytes:
+        return field0 + b"+"
+
+    @derivedfield
+    def derived1(self, derived0, child) -> bytes:
+        return derived0 + child.field0
+
+    @derivedfield
+    def independent(self, field1) -> typing.List[bytes]:
+        return [field1]
+
+
+def test_resample_regenerates_fields_and_dependent_derived_fields():
+    plato.seed(42)
+    data = sample(ResampleTestData())
+    variant = resample(data, ["field0"], seed=7)
+
+    expected = sample(ResampleTestData(), create_root_context(7))
+    assert variant.field0 == expected.field0 != data.field0
+    assert variant.derived0 == variant.field0 + b"+"
+    assert variant.derived1 == variant.derived0 + data.child.field0
+    assert variant.field1 is data.field1
+    assert variant.child is data.child
+    assert variant.constant is data.constant
+    assert variant.independent is data.independent
+    assert isinstance(variant, type(data))
+
+
+def test_resample_nested_fields():
+    plato.seed(42)
+    data = sample(ResampleTestData())
+    variant = resample(data, ["child.field0"], seed=7)
+
+    expected = sample(ResampleTestData(), create_root_context(7))
+    assert variant.child.field0 == expected.child.field0 != data.child.field0
+    assert variant.child.field1 is data.child.field1
+    assert variant.derived1 == data.derived0 + variant.child.field0
+    assert variant.field0 is data.field0
+    assert variant.derived0 is data.derived0
+
+
+def test_resample_keeps_shared_values_consistent():
+    @formclass
+    class Child:
+        field: bytes = SeedProvider()
+
+    @formclass
+    class TestData:
+        shared = Shared(SeedProvider())
+        child_first: Child = Child(field=shared)  # type: ignore[arg-type]
+        first: bytes = shared
+        second: bytes = shared
+        child: Child = Child(field=shared)  # type: ignore[arg-type]
+        other_child: Child = Child()
+
+    plato.seed(42)
+    data = sample(TestData())
+    variant = resample(data, ["second"], seed=7)
+
+    expected = sample(TestData(), create_root_context(7))
+    assert variant.first == variant.second == variant.child.field
+    assert variant.first == expected.first != data.first
+    assert variant.child_first is data.child_first
+    assert variant.other_child is data.other_child
+    assert resample(data, ["child.field"], seed=7) == variant
+    assert resample(data, ["child_first"], seed=7).first is data.first
+
+
+def test_resample_keeps_fields_using_the_same_provider_instance():
+    fake = FromFaker()
+
+    @formclass
+    class TestData:
+        first: int = fake.pyint(1, 1000000)
+        second: int = fake.pyint(1, 1000000)
+
+    assert TestData.first is TestData.second
+
+    plato.seed(42)
+    data = sample(TestData())
+    variant = resample(data, ["second"], seed=7)
+
+    assert variant.first == data.first
+    assert variant.second == sample(TestData(), create_root_context(7)).second
+
+
+def test_resample_derived_fields():
+    plato.seed(42)
+    data = sample(ResampleTestData())
+    variant = resample(data, ["field0", "derived1"])
+    assert variant.derived1 == variant.derived0 + data.child.field0
+    assert resample(data, ["derived0"]) == data
+
+
+def test_resample_recomputes_derived_fields_without_arguments():
+    @formclass
+    class TestData:
+        field: bytes = SeedProvider()
+
+        @derivedfield
+        def derived(self) -> bytes:
+            return self.field
+
+    data = sample(TestData())
+    variant = resample(data, ["field"])
+    assert variant.derived == variant.field != data.field
+
+
+def test_resample_without_seed_uses_next_root_seed():
+    plato.seed(42)
+    data = sample(ResampleTestData())
+    expected = sample(ResampleTestData())
+
+    plato.seed(42)
+    data = sample(ResampleTestData())
+    assert resample(data, ["field1"]).field1 == expected.field1
+
+
+def test_resample_with_form():
+    plato.seed(42)
+    form = ResampleTestData(field0=PrefixedSeedProvider(b"x"))
+    data = sample(form)
+    variant = resample(data, ["field0"], form=form)
+    assert variant.field0.startswith(b"x")
+    assert variant.field0 != data.field0
+    assert variant.derived0 == variant.field0 + b"+"
+
+
+def test_resample_derived_fields_depending_on_initvar_requires_form():
+    @formclass
+    class TestData:
+        prefix: InitVar[str] = "x"
+        field: bytes = SeedProvider()
+
+        @derivedfield
+        def derived(self, prefix, field) -> str:
+            return f"{prefix}{len(field)}"
+
+    form = TestData(prefix="y")
+    data = sample(form)
+    with pytest.raises(ValueError):
+        resample(data, ["field"])
+    assert resample(data, ["field"], form=form).derived.startswith("y")
+
+
+def test_resample_unknown_field_raises():
+    data = sample(ResampleTestData())
+    with pytest.raises(ValueError):
+        resample(data, ["unknown"])
+    with pytest.raises(ValueError):
+        resample(data, ["field0.nested"])
+    with pytest.raises(TypeError):
+        resample(b"data", ["field0"])
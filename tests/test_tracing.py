@@ -0,0 +1,67 @@
+import io
+import json
+
+from plato import Provider, derivedfield, formclass, sample, sample_many
+from plato.tracing import ChromeTracer
+
+
+class StaticProvider(Provider):
+    def sample(self, context):
+        return "static value"
+
+
+@formclass
+class Item:
+    value: str = StaticProvider()  # type: ignore[assignment]
+
+
+@formclass
+class Order:
+    item: Item = Item()
+
+    @derivedfield
+    def derived(self, item) -> str:
+        return item.value + "!"
+
+
+def test_tracer_records_spans():
+    with ChromeTracer() as tracer:
+        sample(Order())
+
+    spans = [
+        (event["cat"], event["name"], event["args"]["path"])
+        for event in sorted(tracer.trace_events, key=lambda event: event["ts"])
+    ]
+    assert spans == [
+        ("instance", "Order", ""),
+        ("field", "Order.item", "item"),
+        ("instance", "Item", "item"),
+        ("field", "Item.value", "item.value"),
+        ("provider", "StaticProvider", "item.value"),
+        ("derivedfield", "Order.derived", "derived"),
+    ]
+    assert all(event["ph"] == "X" for event in tracer.trace_events)
+    root, *nested = tracer.trace_events[::-1]
+    for event in nested:
+        assert root["ts"] <= event["ts"]
+        assert event["ts"] + event["dur"] <= root["ts"] + root["dur"]
+
+
+def test_tracer_records_each_sample_of_batches():
+    with ChromeTracer() as tracer:
+        sample_many(Item(), 3)
+
+    assert [event["name"] for event in tracer.trace_events].count("Item") == 3
+
+
+def test_tracer_writes_json(tmp_path):
+    with ChromeTracer() as tracer:
+        sample(Item())
+
+    path = tmp_path / "trace.json"
+    tracer.write(path)
+    file = io.StringIO()
+    tracer.write(file)
+
+    assert json.loads(path.read_text(encoding="utf-8")) == tracer.to_json()
+    assert json.loads(file.getvalue())["traceEvents"] == tracer.trace_events